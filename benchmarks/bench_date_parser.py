@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Date Parser Benchmark
+เปรียบเทียบเวลาแปลง pubDate ของ entry ระหว่าง dateutil + localize/astimezone (แบบเดิม)
+กับ utils.date_utils.parse_entry_datetime
+
+- rfc822 / iso: ข้อความไม่ซ้ำกัน (ผ่าน regex ทุกครั้ง)
+- repeated: pubDate ซ้ำกัน (เหมือน feed ที่ดึงหลายรอบ ใช้ผลที่ memoize ไว้)
+- struct_time: มี published_parsed จาก feedparser
+
+Usage:
+    python benchmarks/bench_date_parser.py
+    python benchmarks/bench_date_parser.py --count 20000 --json dates.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config.settings import settings
+from utils.date_utils import parse_datetime, parse_entry_datetime
+
+
+def _legacy(published: str, tz):
+    """การแปลงเวลาแบบเดิมของ NewsProcessor._parse_entry"""
+    from dateutil import parser as dateutil_parser
+    try:
+        published_dt = dateutil_parser.parse(published) if published else None
+        if published_dt and published_dt.tzinfo is None:
+            published_dt = tz.localize(published_dt)
+        if published_dt:
+            published_dt = published_dt.astimezone(tz)
+    except Exception:
+        published_dt = None
+    return published_dt
+
+
+def _cases(count: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    moments = [start + timedelta(seconds=rng.randint(0, 30_000_000)) for _ in range(count)]
+    rfc822 = [format_datetime(moment) for moment in moments]
+    return {
+        "rfc822": [(value, None) for value in rfc822],
+        "iso": [(moment.isoformat(), None) for moment in moments],
+        "repeated": [(rng.choice(rfc822[:count // 20 or 1]), None) for _ in range(count)],
+        "struct_time": [(value, moment.utctimetuple()) for value, moment in zip(rfc822, moments)],
+    }
+
+
+def _time(fn, values: list) -> float:
+    started = time.perf_counter()
+    for published, parsed in values:
+        fn(published, parsed)
+    return time.perf_counter() - started
+
+
+def bench(count: int, seed: int) -> list:
+    tz = settings.TZ
+    results = []
+    for name, values in _cases(count, seed).items():
+        parse_datetime.cache_clear()
+        legacy_s = _time(lambda published, parsed: _legacy(published, tz), values)
+        fast_s = _time(lambda published, parsed: parse_entry_datetime(published, parsed, tz), values)
+        mismatches = sum(
+            1 for published, parsed in values
+            if _legacy(published, tz) != parse_entry_datetime(published, parsed, tz)
+        )
+        results.append({
+            "case": name,
+            "count": len(values),
+            "dateutil_us": round(legacy_s / len(values) * 1e6, 2),
+            "fast_us": round(fast_s / len(values) * 1e6, 2),
+            "speedup": round(legacy_s / max(fast_s, 1e-9), 1),
+            "mismatches": mismatches,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    results = bench(args.count, args.seed)
+    for result in results:
+        print(f"[{result['case']:>11}] dateutil {result['dateutil_us']:>7.2f} us | "
+              f"date_utils {result['fast_us']:>6.2f} us | x{result['speedup']:<5} | "
+              f"mismatches {result['mismatches']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Deduplication Benchmark
+วัดเวลาของ EnhancedDeduplication.add_item ตามจำนวนข่าวที่ผ่าน filter
+
+รายงานเวลารวมและเวลาต่อข่าว และจำนวนข่าวที่ถูกเทียบใน Check 1 (title) / Check 3 (title คล้ายกัน)
+/ Check 4 (คำสำคัญ) / Check 5 (คำเฉพาะเจาะจง) เทียบกับการวนทุกข่าวใน processed_items (full scan)
+
+exponent: ความชันของ log(เวลารวม) เทียบกับ log(จำนวนข่าว) ทุกขนาด (1.0 = เชิงเส้น, 2.0 = กำลังสอง)
+
+Usage:
+    python benchmarks/bench_dedup.py
+    python benchmarks/bench_dedup.py --sizes 500,1000,2000,4000 --json dedup.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tempfile
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("DEBUG_FILTERING", "0")
+os.environ.setdefault("SENT_DIR", tempfile.mkdtemp(prefix="bench_dedup_"))
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.bench_pipeline import _final_item
+
+
+def dedup_candidates(n: int, seed: int) -> list:
+    """ข่าวที่ผ่าน keyword filter + ประเทศ จาก corpus ขนาด n (รูปแบบเดียวกับ _process_entry)"""
+    from services.news_processor import NewsProcessor
+    from filters.keyword_filter import KeywordFilter
+    from filters.text_analysis import AnalyzedText
+
+    processor = NewsProcessor()
+    now = datetime.now(timezone.utc)
+    items = []
+    for entry in generate_corpus(n, seed=seed, now=now):
+        item = processor._parse_entry(entry, "Synthetic", "thai" if entry.thai else "international")
+        analysis = AnalyzedText(item["title"], item["summary"])
+        if not KeywordFilter.check_valid_energy_news(analysis)[0]:
+            continue
+        country = KeywordFilter.detect_country(analysis)
+        if country:
+            items.append(_final_item(processor, item, country))
+    return items
+
+
+def bench(n: int, seed: int) -> dict:
+    from filters.deduplication import EnhancedDeduplication
+    from utils.metrics import metrics
+
+    items = dedup_candidates(n, seed)
+    metrics.reset()
+    dedup = EnhancedDeduplication()
+
+    full_scan = 0
+    started = time.perf_counter()
+    for item in items:
+        full_scan += len(dedup.processed_items)
+        dedup.add_item(item.copy())
+    elapsed = time.perf_counter() - started
+
+    candidates = {
+        counter["labels"]["check"]: counter["value"]
+        for counter in metrics.snapshot()["counters"]
+        if counter["name"] == "dedup_candidates_total"
+    }
+    return {
+        "entries": n,
+        "items": len(items),
+        "unique": len(dedup.processed_items),
+        "total_s": round(elapsed, 4),
+        "us_per_item": round(elapsed / max(len(items), 1) * 1e6, 1),
+        "full_scan_comparisons": full_scan,
+        "candidates": candidates,
+    }
+
+
+def scaling_exponent(results: list) -> float:
+    """ความชันของ log(total_s) เทียบกับ log(items) แบบ least squares"""
+    points = [(math.log(r["items"]), math.log(r["total_s"])) for r in results if r["items"] and r["total_s"] > 0]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="250,500,1000,2000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    results = []
+    for n in [int(size) for size in args.sizes.split(",") if size.strip()]:
+        result = bench(n, args.seed)
+        results.append(result)
+        print(f"[{n:>6}] {result['items']:>6} items, {result['unique']:>5} unique: "
+              f"{result['total_s'] * 1000:10.1f} ms ({result['us_per_item']:.0f} us/item) | "
+              f"full scan {result['full_scan_comparisons']:>9} vs candidates "
+              f"title {result['candidates'].get('title', 0):>6}, "
+              f"similar_title {result['candidates'].get('similar_title', 0):>6}, "
+              f"keywords {result['candidates'].get('keywords', 0):>6}, "
+              f"specific_terms {result['candidates'].get('specific_terms', 0):>5}")
+
+    exponent = scaling_exponent(results)
+    print(f"total time ~ items^{exponent:.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "exponent": round(exponent, 3)}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Domain Registry Benchmark
+เปรียบเทียบเวลาหาชื่อเว็บข่าวระหว่างการวน substring ทุก domain (แบบเดิม)
+กับ DomainRegistry (trie ของ label กลับด้าน) เมื่อทะเบียนมีหลายพันเว็บ
+
+รายงานจำนวน domain ที่แบบเดิมให้ชื่อผิดด้วย (เช่น microsoft.com -> Financial Times)
+
+Usage:
+    python benchmarks/bench_domain_registry.py
+    python benchmarks/bench_domain_registry.py --sizes 100,1000,10000 --json registry.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data.domain_registry import DomainRegistry, Publisher, get_registry
+
+_TLDS = ["com", "net", "co.th", "or.th", "com.my", "co.id", "vn", "co.uk"]
+
+
+def _legacy_source_name(sources: dict, domain: str) -> str:
+    """get_source_name แบบเดิม: วน substring ทุก domain ใน NEWS_SOURCES"""
+    domain = domain.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+    for source_domain, source_name in sources.items():
+        if source_domain in domain:
+            return source_name
+    return domain
+
+
+def _publishers(n: int, rng: random.Random) -> list:
+    """เว็บในทะเบียนจริง + เว็บสมมติจนครบ n เว็บ"""
+    publishers = list(get_registry())
+    for i in range(len(publishers), n):
+        publishers.append(Publisher(domain=f"news{i:05d}.{rng.choice(_TLDS)}", name=f"News {i}"))
+    return publishers
+
+
+def _queries(publishers: list, count: int, rng: random.Random) -> list:
+    """domain ที่ใช้ค้นหา: domain ตรง, subdomain, www. และ domain ที่ไม่อยู่ในทะเบียน"""
+    queries = []
+    for _ in range(count):
+        kind = rng.random()
+        domain = rng.choice(publishers).domain
+        if kind < 0.4:
+            queries.append(domain)
+        elif kind < 0.6:
+            queries.append(f"www.{domain}")
+        elif kind < 0.8:
+            queries.append(f"{rng.choice(['feeds', 'm', 'energy'])}.{domain}")
+        else:
+            queries.append(f"{rng.choice(['micro', 'soft', 'the'])}{domain}")
+    return queries
+
+
+def _time(fn, queries: list) -> tuple:
+    started = time.perf_counter()
+    names = [fn(domain) for domain in queries]
+    return time.perf_counter() - started, names
+
+
+def bench(n: int, lookups: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    publishers = _publishers(n, rng)
+    queries = _queries(publishers, lookups, rng)
+    sources = {publisher.domain: publisher.name for publisher in publishers}
+    registry = DomainRegistry(publishers)
+
+    legacy_s, legacy_names = _time(lambda domain: _legacy_source_name(sources, domain), queries)
+    registry_s, registry_names = _time(registry.source_name, queries)
+    return {
+        "publishers": len(publishers),
+        "lookups": lookups,
+        "legacy_us": round(legacy_s / lookups * 1e6, 2),
+        "registry_us": round(registry_s / lookups * 1e6, 2),
+        "mismatches": sum(1 for a, b in zip(legacy_names, registry_names) if a != b),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="30,1000,5000")
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    results = []
+    for n in [int(size) for size in args.sizes.split(",") if size.strip()]:
+        result = bench(n, args.lookups, args.seed)
+        results.append(result)
+        print(f"[{result['publishers']:>6} publishers] substring scan {result['legacy_us']:>9.2f} us/lookup | "
+              f"registry {result['registry_us']:>6.2f} us/lookup | "
+              f"legacy mismatches {result['mismatches']}/{result['lookups']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTML Cleaner Benchmark
+เปรียบเทียบ clean_google_news_text / clean_html_text แบบเดิม (re.sub หลายรอบ, HTMLParser ใหม่ทุกครั้ง)
+กับ utils.html_utils ปัจจุบัน
+
+ชุดทดสอบ (golden set) = title/summary ของ corpus จำลอง + กรณีพิเศษ + ข้อความสุ่มจากตัวอักษรที่มีผลต่อการทำความสะอาด
+ผลลัพธ์ต้องเหมือนแบบเดิมทุกข้อความ (mismatches = 0)
+แยกเวลาตามชนิดข้อความด้วย: plain (ไม่มี '<' และ '&') / markup (มี tag หรือ entity)
+
+Usage:
+    python benchmarks/bench_html_cleaner.py
+    python benchmarks/bench_html_cleaner.py --count 5000 --json html.json
+"""
+
+import os
+import re
+import sys
+import html
+import json
+import time
+import random
+import argparse
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import generate_corpus
+from utils.html_utils import HTMLTextExtractor, clean_google_news_text, clean_html_text
+
+SPECIAL_CASES = [
+    "",
+    "&lt;a href=&quot;https://example.com&quot;&gt;Link&lt;/a&gt;",
+    "Thailand&#39;s energy &amp; power sector",
+    "<strong>Breaking News:</strong> Oil price rises",
+    "Text with &nbsp; spaces &amp; &lt;tags&gt;",
+    "ข่าวพลังงาน: ราคาน้ำมันปรับขึ้น &gt; $75/barrel",
+    "see https://news.google.com/rss/articles/CBMi%20abc?oc=5&x=(1),2 now",
+    "http://a.b/c%zz%41 tail",
+    'He said ""hello"" and \'\'bye\'\'',
+    "line1\r\nline2\t\ttab nbsp em",
+    "<a href=\"x\">unterminated",
+    "a < b > c",
+    "&amp;lt;b&amp;gt;double&amp;lt;/b&amp;gt;",
+    "<p>one</p><p>two</p>",
+    "trailing &",
+    "<!-- comment --><script>x</script>text",
+]
+
+_FUZZ_ALPHABET = list("ab ข่าว\"'<>&;#/:.%=\t\n\r ") + ["&amp;", "&quot;", "&#39;", "<b>", "</b>", "http://", "https://x.y/"]
+
+
+def _legacy_strip_html_tags(text: str) -> str:
+    if not text:
+        return ""
+    try:
+        parser = HTMLTextExtractor()
+        parser.feed(text)
+        return parser.get_text()
+    except Exception:
+        pass
+    return re.sub(r'<[^>]+>', '', text)
+
+
+def _legacy_clean_html_text(text: str) -> str:
+    if not text:
+        return ""
+    text = _legacy_strip_html_tags(text)
+    text = html.unescape(text)
+    text = ' '.join(text.split())
+    return text.strip()
+
+
+def _legacy_clean_google_news_text(text: str) -> str:
+    if not text:
+        return ""
+    text = html.unescape(text)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'[\r\n\t]+', ' ', text)
+    text = ' '.join(text.split())
+    text = re.sub(r'"+', '"', text)
+    text = re.sub(r"'+", "'", text)
+    return text.strip()
+
+
+def golden_set(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    texts = list(SPECIAL_CASES)
+    for entry in generate_corpus(count, seed=seed, now=now):
+        texts.extend([entry.title, entry.summary])
+    for _ in range(count):
+        texts.append("".join(rng.choice(_FUZZ_ALPHABET) for _ in range(rng.randint(1, 40))))
+    return texts
+
+
+def _time(fn, texts: list) -> float:
+    started = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return time.perf_counter() - started
+
+
+def bench(count: int, seed: int) -> list:
+    texts = golden_set(count, seed)
+    plain = [text for text in texts if '<' not in text and '&' not in text]
+    markup = [text for text in texts if '<' in text or '&' in text]
+    results = []
+    for name, legacy, current in [
+        ("clean_google_news_text", _legacy_clean_google_news_text, clean_google_news_text),
+        ("clean_html_text", _legacy_clean_html_text, clean_html_text),
+    ]:
+        mismatches = [text for text in texts if legacy(text) != current(text)]
+        legacy_s = _time(legacy, texts)
+        current_s = _time(current, texts)
+        results.append({
+            "function": name,
+            "texts": len(texts),
+            "legacy_us": round(legacy_s / len(texts) * 1e6, 2),
+            "current_us": round(current_s / len(texts) * 1e6, 2),
+            "by_kind": {
+                kind: {
+                    "texts": len(group),
+                    "legacy_us": round(_time(legacy, group) / max(len(group), 1) * 1e6, 2),
+                    "current_us": round(_time(current, group) / max(len(group), 1) * 1e6, 2),
+                }
+                for kind, group in [("plain", plain), ("markup", markup)]
+            },
+            "mismatches": len(mismatches),
+            "examples": mismatches[:5],
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    results = bench(args.count, args.seed)
+    for result in results:
+        print(f"[{result['function']:>22}] {result['texts']} texts | legacy {result['legacy_us']:>6.2f} us | "
+              f"current {result['current_us']:>6.2f} us | mismatches {result['mismatches']}")
+        for kind, timing in result["by_kind"].items():
+            print(f"  {kind:>22}  {timing['texts']} texts | legacy {timing['legacy_us']:>6.2f} us | "
+                  f"current {timing['current_us']:>6.2f} us")
+        for example in result["examples"]:
+            print(f"    {example!r}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    return 1 if any(result["mismatches"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
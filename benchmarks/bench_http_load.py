@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTTP Load Benchmark
+ยิง request จำนวนมากผ่าน client จริง (LineSender, WTIFuturesFetcher, NewsProcessor)
+ไปยัง mock server ใน process เดียวกัน (scripts/mock_services.py)
+
+รายงาน throughput, latency (p50/p95/p99) และจำนวน response แยกตาม status
+
+Usage:
+    python benchmarks/bench_http_load.py
+    python benchmarks/bench_http_load.py --requests 5000 --concurrency 32 --latency-ms 20 --rate-limit-rate 0.05
+    python benchmarks/bench_http_load.py --scenarios line,gnews --rss-items 200 --json load.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scripts.mock_services import MockConfig, start_mock_server
+
+SCENARIOS = ["line", "eia", "gnews", "yahoo"]
+
+
+def build_scenarios() -> dict:
+    """สร้างฟังก์ชันของแต่ละ scenario (import หลังตั้งค่า environment แล้ว)"""
+    from config.settings import settings
+    settings.reload()
+
+    from services.line_sender import LineSender
+    from services.wti_fetcher import WTIFuturesFetcher
+    from services.news_processor import NewsProcessor
+    from data.feeds import gnews_rss
+
+    sender = LineSender("load-test-token")
+    fetcher = WTIFuturesFetcher(api_key="load-test-key")
+    processor = NewsProcessor()
+    feed_url = gnews_rss("energy Thailand")
+    message = {"type": "text", "text": "load test"}
+
+    return {
+        "line": lambda: sender.send_message(message),
+        "eia": lambda: fetcher.fetch_current_wti_price()[0] is not None,
+        "gnews": lambda: bool(processor._fetch_feed_with_retry("Load", feed_url, retries=1)),
+        # 13 สัญญาต่อครั้ง และมี sleep 0.2s ระหว่างสัญญา - ใช้จำนวนน้อย
+        "yahoo": lambda: bool(fetcher.fetch_futures_from_yahoo()[0]),
+    }
+
+
+def _percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def run_scenario(name: str, func, requests_count: int, concurrency: int) -> dict:
+    """รัน scenario หนึ่ง"""
+    latencies, outcomes = [], []
+
+    def call(_):
+        started = time.perf_counter()
+        try:
+            ok = bool(func())
+        except Exception:
+            ok = False
+        return time.perf_counter() - started, ok
+
+    started = time.perf_counter()
+    # log ของ service ไม่ต้องแสดงระหว่าง load test
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for elapsed, ok in pool.map(call, range(requests_count)):
+                latencies.append(elapsed)
+                outcomes.append(ok)
+    wall = time.perf_counter() - started
+
+    return {
+        "scenario": name,
+        "calls": requests_count,
+        "concurrency": concurrency,
+        "succeeded": sum(outcomes),
+        "wall_s": round(wall, 3),
+        "calls_per_s": round(requests_count / wall, 1) if wall else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies) * 1000, 2),
+            "p50": round(_percentile(latencies, 50) * 1000, 2),
+            "p95": round(_percentile(latencies, 95) * 1000, 2),
+            "p99": round(_percentile(latencies, 99) * 1000, 2),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default="line,eia,gnews", help=f"คั่นด้วย , จาก {', '.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=1000, help="จำนวนครั้งต่อ scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--rss-items", type=int, default=30)
+    parser.add_argument("--padding-bytes", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+
+    config = MockConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, rss_items=args.rss_items,
+        padding_bytes=args.padding_bytes, seed=args.seed,
+    )
+    server = start_mock_server(config)
+    os.environ.update(server.service_env())
+    os.environ.update({"DRY_RUN": "0", "HTTP_MODE": "live"})
+
+    from utils.metrics import metrics
+
+    try:
+        scenarios = build_scenarios()
+        results = []
+        for name in names:
+            metrics.reset()
+            result = run_scenario(name, scenarios[name], args.requests, args.concurrency)
+            result["http_requests"] = {
+                counter["labels"]["status"]: counter["value"]
+                for counter in metrics.snapshot()["counters"]
+                if counter["name"] == "http_requests_total"
+            }
+            results.append(result)
+
+            latency = result["latency_ms"]
+            print(f"[{name}] {result['calls']} calls x{result['concurrency']}: "
+                  f"{result['calls_per_s']:.1f} calls/s, p50 {latency['p50']:.1f} ms, "
+                  f"p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms, "
+                  f"ok {result['succeeded']}/{result['calls']}, status {result['http_requests']}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "server_stats": server.stats_snapshot(), "results": results},
+                      f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
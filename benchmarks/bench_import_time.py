@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Import-time Benchmark
+วัดเวลา startup (import อย่างเดียว ไม่รัน main) ของ scripts/check_wti_alert.py
+
+import เฉพาะโมดูลระดับบนสุดที่ target import (อ่านด้วย ast) ใน subprocess ใหม่ทุกรอบ
+แล้วหักเวลาเริ่ม interpreter เปล่าออก โมดูลที่หาไม่พบจะถูกรายงานแยกไว้
+ใช้ --ref เพื่อเปรียบเทียบกับ commit อื่น (เช่น ก่อนเปลี่ยนเป็น lazy settings)
+
+Usage:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --ref HEAD~1 --runs 20
+    python benchmarks/bench_import_time.py --target main.py
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["feedparser", "dateutil", "pytz", "requests", "dotenv", "numpy"]
+
+# import โมดูลทั้งหมดของ target แล้วรายงานเวลาและโมดูลที่ถูกโหลด
+_CHILD = """
+import sys, time, json, importlib
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+missing = []
+for name in {modules!r}:
+    try:
+        importlib.import_module(name)
+    except ModuleNotFoundError as e:
+        missing.append(e.name)
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "missing": missing,
+                  "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+# ค่าจำลองเพื่อให้ settings แบบเดิม (ตรวจสอบตอน import) ไม่ raise
+_DUMMY_ENV = {
+    "LINE_CHANNEL_ACCESS_TOKEN": "benchmark-token",
+    "EIA_API_KEY": "benchmark-key",
+    "DRY_RUN": "1",
+}
+
+
+def target_imports(path: str) -> list:
+    """รายชื่อโมดูลที่ไฟล์ import ที่ระดับบนสุด (ตามลำดับ)"""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def measure(root: str, target: str, runs: int) -> dict:
+    """รัน import target ใน subprocess ใหม่ runs รอบ"""
+    env = dict(os.environ, **_DUMMY_ENV)
+    env["SENT_DIR"] = tempfile.mkdtemp(prefix="bench_sent_")
+    modules = target_imports(os.path.join(root, target))
+    code = _CHILD.format(root=root, modules=modules, heavy=HEAVY_MODULES)
+
+    import_times, wall_times, bare_times = [], [], []
+    loaded, missing = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True, env=env)
+        bare_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-c", code], cwd=root, env=env,
+                              capture_output=True, text=True)
+        wall_times.append(time.perf_counter() - started)
+        if proc.returncode != 0:
+            raise RuntimeError(f"import failed:\n{proc.stderr}")
+
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        import_times.append(result["elapsed"])
+        loaded, missing = result["loaded"], result["missing"]
+
+    return {
+        "root": root,
+        "target": target,
+        "runs": runs,
+        "import_ms_median": round(statistics.median(import_times) * 1000, 2),
+        "startup_ms_median": round((statistics.median(wall_times) - statistics.median(bare_times)) * 1000, 2),
+        "heavy_modules_loaded": loaded,
+        "missing_modules": missing,
+    }
+
+
+def _print_result(label: str, result: dict):
+    print(f"[{label}] {result['target']}")
+    print(f"  import time (median):   {result['import_ms_median']:.1f} ms")
+    print(f"  startup over bare python: {result['startup_ms_median']:.1f} ms")
+    print(f"  heavy modules loaded:   {', '.join(result['heavy_modules_loaded']) or '-'}")
+    if result["missing_modules"]:
+        print(f"  missing (skipped):      {', '.join(result['missing_modules'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="scripts/check_wti_alert.py")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--ref", help="git ref ที่ใช้เปรียบเทียบ (เช่น HEAD~1)")
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    results = {"current": measure(ROOT, args.target, args.runs)}
+    _print_result("current", results["current"])
+
+    if args.ref:
+        worktree = tempfile.mkdtemp(prefix="bench_ref_")
+        subprocess.run(["git", "worktree", "add", "--detach", worktree, args.ref],
+                       cwd=ROOT, check=True, capture_output=True)
+        try:
+            results["baseline"] = measure(worktree, args.target, args.runs)
+            results["baseline"]["ref"] = args.ref
+            _print_result(f"baseline {args.ref}", results["baseline"])
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", worktree],
+                           cwd=ROOT, capture_output=True)
+
+        before = results["baseline"]["import_ms_median"]
+        after = results["current"]["import_ms_median"]
+        if before:
+            print(f"\nimport time: {before:.1f} ms -> {after:.1f} ms ({(before - after) / before:.0%} faster)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
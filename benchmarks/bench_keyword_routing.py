@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Keyword Routing Benchmark
+วัดงานตรวจคำสำคัญต่อข่าว (รายการคำของ KeywordFilter + EnhancedDeduplication ทุกกลุ่ม)
+
+- substring: ตรวจทุกคำในทุกรายการ (`kw.lower() in text` แบบเดิม)
+- routed: KeywordSet.substring_hits ตรวจเฉพาะคำของภาษาที่มีในข้อความ (ผลต้องเท่ากับแบบเดิม)
+- terms: KeywordSet.term_hits (แบบคำเต็มที่ KeywordFilter ใช้)
+
+checks = จำนวนคำที่ต้องเทียบกับข้อความต่อข่าว (เฉลี่ย)
+
+Usage:
+    python benchmarks/bench_keyword_routing.py
+    python benchmarks/bench_keyword_routing.py --count 5000 --json routing.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import generate_corpus
+from filters.deduplication import EnhancedDeduplication
+from filters.keyword_filter import KeywordFilter
+from utils.html_utils import clean_google_news_text
+from utils.lang_utils import keyword_set, latin_words, text_language
+
+
+def keyword_groups() -> list:
+    groups = [
+        KeywordFilter.EXCLUDE_KEYWORDS, KeywordFilter.ENERGY_KEYWORDS,
+        KeywordFilter.ENERGY_MARKET_KEYWORDS, KeywordFilter.BUSINESS_KEYWORDS,
+        KeywordFilter.COUNTRY_NAME_KEYWORDS, KeywordFilter.IMPORTANCE_KEYWORDS,
+        KeywordFilter.INTERNATIONAL_KEYWORDS,
+        EnhancedDeduplication.GROUPING_KEYWORDS, EnhancedDeduplication.ENTITY_KEYWORDS,
+    ]
+    return groups + list(KeywordFilter.PRIMARY_COUNTRIES.values())
+
+
+def _checks(sets: list, language: str) -> int:
+    return sum(len(compiled.route(language)) for compiled in sets)
+
+
+def bench(count: int, seed: int) -> dict:
+    now = datetime.now(timezone.utc)
+    texts = [
+        clean_google_news_text(f"{entry.title} {entry.summary}").lower()
+        for entry in generate_corpus(count, seed=seed, now=now)
+    ]
+    groups = keyword_groups()
+    sets = [keyword_set(keywords) for keywords in groups]
+    languages = [text_language(text) for text in texts]
+
+    started = time.perf_counter()
+    legacy = [[[kw for kw in keywords if kw.lower() in text] for keywords in groups] for text in texts]
+    substring_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    routed = [
+        [compiled.substring_hits(text, text_language(text)) for compiled in sets]
+        for text in texts
+    ]
+    routed_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in texts:
+        language, words = text_language(text), latin_words(text)
+        for compiled in sets:
+            compiled.term_hits(text, language, words)
+    terms_s = time.perf_counter() - started
+
+    total_keywords = sum(len(keywords) for keywords in groups)
+    return {
+        "texts": len(texts),
+        "languages": dict(Counter(languages)),
+        "substring_checks": total_keywords,
+        "routed_checks": round(sum(_checks(sets, language) for language in languages) / len(texts), 1),
+        "substring_us": round(substring_s / len(texts) * 1e6, 2),
+        "routed_us": round(routed_s / len(texts) * 1e6, 2),
+        "terms_us": round(terms_s / len(texts) * 1e6, 2),
+        "mismatches": sum(1 for old, new in zip(legacy, routed) if old != new),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    result = bench(args.count, args.seed)
+    print(f"texts {result['texts']} | languages {result['languages']}")
+    print(f"[substring] {result['substring_checks']:>6} checks | {result['substring_us']:>7.2f} us")
+    print(f"[   routed] {result['routed_checks']:>6} checks | {result['routed_us']:>7.2f} us | "
+          f"mismatches {result['mismatches']}")
+    print(f"[    terms] {'':>6}        | {result['terms_us']:>7.2f} us")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    return 1 if result["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
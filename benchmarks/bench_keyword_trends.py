@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Keyword Trends Benchmark
+จำลองการทำงานรายวันหลายวัน (ข่าวจาก corpus จำลอง) แล้วเพิ่มข่าวของคำหนึ่งคำในวันสุดท้าย
+
+- observe_us: เวลานับคำสำคัญต่อข่าว (ไม่รวมการหาคำสำคัญที่ filter คำนวณไว้แล้ว)
+- spikes_ms: เวลาหาคำที่มาแรงต่อรอบ
+- file_kb: ขนาดไฟล์ TREND_FILE หลังวันสุดท้าย (คงที่เมื่อครบช่วง baseline)
+- detected: คำที่เพิ่มในวันสุดท้ายถูกพบเป็นคำที่มาแรง
+
+Usage:
+    python benchmarks/bench_keyword_trends.py
+    python benchmarks/bench_keyword_trends.py --days 14 --per-day 400 --json trends.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import generate_corpus
+from filters.keyword_trends import KeywordTrends, trend_keywords
+from filters.text_analysis import AnalyzedText
+from utils.html_utils import clean_google_news_text
+
+
+def _day_items(count: int, seed: int, now: datetime) -> list:
+    """(คำสำคัญ, เวลาเผยแพร่) ของข่าวหนึ่งวัน"""
+    items = []
+    for entry in generate_corpus(count, seed=seed, now=now, window_hours=24):
+        published = entry.published_dt
+        if published <= now - timedelta(hours=24):
+            continue
+        analysis = AnalyzedText(clean_google_news_text(entry.title), clean_google_news_text(entry.summary))
+        items.append((trend_keywords(analysis), published))
+    return items
+
+
+def bench(days: int, per_day: int, spike_keyword: str, spike_items: int, seed: int) -> dict:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_trends_"), "trends.json")
+    start = datetime(2026, 10, 1, 7, 0, tzinfo=timezone.utc)
+    observe_s = spikes_s = 0.0
+    observed = 0
+    trends = []
+    for day in range(days):
+        now = start + timedelta(days=day)
+        items = _day_items(per_day, seed + day, now)
+        if day == days - 1:
+            items.extend(({spike_keyword}, now - timedelta(hours=1 + i % 20)) for i in range(spike_items))
+
+        tracker = KeywordTrends(6, 24, 7)
+        tracker.load(path)
+        started = time.perf_counter()
+        for keywords, published in items:
+            observed += tracker.observe(keywords, published)
+        observe_s += time.perf_counter() - started
+
+        started = time.perf_counter()
+        trends = tracker.spikes(now, 2.0, 3)
+        spikes_s += time.perf_counter() - started
+        tracker.save(path)
+
+    return {
+        "days": days,
+        "items": observed,
+        "observe_us": round(observe_s / max(observed, 1) * 1e6, 2),
+        "spikes_ms": round(spikes_s / days * 1000, 3),
+        "file_kb": round(os.path.getsize(path) / 1024, 1),
+        "buckets": len(tracker),
+        "trends": [trend._asdict() for trend in trends],
+        "detected": any(trend.keyword.lower() == spike_keyword for trend in trends),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--per-day", type=int, default=300)
+    parser.add_argument("--spike-keyword", default="pipeline")
+    parser.add_argument("--spike-items", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    result = bench(args.days, args.per_day, args.spike_keyword.lower(), args.spike_items, args.seed)
+    print(f"{result['days']} days, {result['items']} items | observe {result['observe_us']} us/item | "
+          f"spikes {result['spikes_ms']} ms/run | file {result['file_kb']} KB ({result['buckets']} buckets)")
+    for trend in result["trends"]:
+        print(f"  {trend['keyword']:<20} {trend['count']:>4} (baseline {trend['baseline']}, x{trend['ratio']})")
+    print(f"spike '{args.spike_keyword}' detected: {result['detected']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    return 0 if result["detected"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
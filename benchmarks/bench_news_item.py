@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+News Item Memory Benchmark
+เปรียบเทียบหน่วยความจำและจำนวน allocation ของข่าวที่ผ่าน filter
+ระหว่าง dict แบบเดิม (14 keys, คำนวณ domain/ชื่อเว็บทันที) กับ NewsItem (__slots__, lazy)
+
+Usage:
+    python benchmarks/bench_news_item.py
+    python benchmarks/bench_news_item.py --sizes 1000,10000 --json news_item.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("DEBUG_FILTERING", "0")
+os.environ.setdefault("SENT_DIR", tempfile.mkdtemp(prefix="bench_news_item_"))
+
+from benchmarks.corpus import generate_corpus
+
+
+def _legacy_item(item: dict, country: str) -> dict:
+    """รูปแบบ dict เดิมของ NewsProcessor._process_entry"""
+    from data.news_sources import get_source_name
+    from data.projects import PROJECTS_BY_COUNTRY
+    from utils.url_utils import extract_domain
+
+    display_url = item["canon_url"] or item["url"]
+    domain = extract_domain(display_url)
+    return {
+        'title': item['title'][:100],
+        'url': item['url'],
+        'canon_url': item['canon_url'],
+        'source_name': get_source_name(domain),
+        'domain': domain,
+        'summary': item['summary'][:200],
+        'published_dt': item['published_dt'],
+        'country': country,
+        'project_hints': PROJECTS_BY_COUNTRY.get(country, [])[:2],
+        'llm_summary': '',
+        'feed': item['feed'],
+        'feed_type': item['section'],
+        'simple_summary': ''
+    }
+
+
+def _measure(build, parsed: list) -> dict:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    snapshot_before = tracemalloc.take_snapshot()
+    items = [build(item, "Thailand") for item in parsed]
+    after, _ = tracemalloc.get_traced_memory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocations = sum(
+        stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename")
+        if stat.count_diff > 0
+    )
+    return {
+        "bytes_per_item": round((after - before) / max(len(items), 1), 1),
+        "allocations_per_item": round(allocations / max(len(items), 1), 2),
+    }
+
+
+def bench(n: int, seed: int) -> dict:
+    from services.news_processor import NewsProcessor
+
+    processor = NewsProcessor()
+    now = datetime.now(timezone.utc)
+    parsed = [
+        processor._parse_entry(entry, "Synthetic", "thai" if entry.thai else "international")
+        for entry in generate_corpus(n, seed=seed, now=now)
+    ]
+    return {
+        "items": n,
+        "dict": _measure(_legacy_item, parsed),
+        "news_item": _measure(processor._build_news_item, parsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    results = []
+    for n in [int(size) for size in args.sizes.split(",") if size.strip()]:
+        result = bench(n, args.seed)
+        results.append(result)
+        print(f"[{n:>6}] dict: {result['dict']['bytes_per_item']:>8.1f} B/item, "
+              f"{result['dict']['allocations_per_item']:>5.2f} allocs/item | "
+              f"NewsItem: {result['news_item']['bytes_per_item']:>8.1f} B/item, "
+              f"{result['news_item']['allocations_per_item']:>5.2f} allocs/item")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
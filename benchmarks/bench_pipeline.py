@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pipeline Benchmark
+วัดเวลาแต่ละส่วนของ pipeline ข่าวด้วย corpus จำลอง (benchmarks/corpus.py)
+
+Components:
+    parse_entry      NewsProcessor._parse_entry
+    keyword_filter   KeywordFilter.check_valid_energy_news + detect_country
+    dedup_add_item   EnhancedDeduplication.add_item (ข่าวที่ผ่าน keyword filter)
+    builders         NewsMessageBuilder.create_carousel_message + WTIMessageBuilder
+    storage          append_sent_link + read_sent_links
+    end_to_end       NewsProcessor.fetch_and_filter_news (feed เล่นซ้ำจาก fixture, ไม่ใช้ network)
+    end_to_end_pool  end_to_end แบบ PROCESS_WORKERS=--workers (ผลต้องเท่ากับ end_to_end)
+
+Usage:
+    python benchmarks/bench_pipeline.py --json baseline.json
+    python benchmarks/bench_pipeline.py --sizes 100,1000,10000,100000 --repeat 3
+    python benchmarks/bench_pipeline.py --compare baseline.json --tolerance 0.2
+    python benchmarks/bench_pipeline.py --components end_to_end,end_to_end_pool --workers 4
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import contextlib
+import statistics
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import generate_corpus, to_rss
+
+RESULT_VERSION = 1
+COMPONENTS = ["parse_entry", "keyword_filter", "dedup_add_item", "builders", "storage", "end_to_end",
+              "end_to_end_pool"]
+
+
+def _configure(workdir: str, n: int):
+    """ตั้งค่า environment ให้ pipeline อ่าน feed จาก fixture และเขียนไฟล์ใน workdir"""
+    os.environ.update({
+        "HTTP_MODE": "replay",
+        "HTTP_FIXTURES": os.path.join(workdir, "feeds.json.gz"),
+        "HTTP_REPLAY_LATENCY_SCALE": "0",
+        "SENT_DIR": os.path.join(workdir, "sent_links"),
+        "MAX_PER_FEED": str(n),
+        "DEBUG_FILTERING": "0",
+        "DRY_RUN": "1",
+        "METRICS_DIR": os.path.join(workdir, "metrics"),
+    })
+    from config.settings import settings
+    from utils import http_client
+    settings.reload()
+    http_client.reset()
+
+
+def _write_feed_fixture(corpus: list, recorded_at: datetime):
+    """แบ่ง corpus ตามภาษาเข้า FEEDS แล้วเขียนเป็น fixture archive"""
+    from config.settings import settings
+    from data.feeds import get_feeds
+    from utils import http_client
+
+    entries = []
+    for feed_name, feed_type, feed_url in get_feeds():
+        body = to_rss([e for e in corpus if e.thai == (feed_type == "thai")], feed_name)
+        key = http_client.canonical_url("GET", feed_url)
+        entries.append(http_client.make_entry(
+            "GET", key, "gnews", 200, {"Content-Type": "application/rss+xml; charset=utf-8"}, body, "utf-8"))
+    http_client.write_archive(settings.HTTP_FIXTURES, entries, recorded_at.isoformat())
+
+
+def _final_item(processor, item: dict, country: str):
+    """ข่าวที่ผ่าน filter ในรูปแบบเดียวกับ NewsProcessor._process_entry"""
+    return processor._build_news_item(item, country)
+
+
+def _time(run, repeat: int, setup=None, budget_s: float = None) -> dict:
+    """
+    รัน run() repeat รอบ (setup() ก่อนทุกรอบ ไม่นับเวลา)
+    หยุดก่อนครบถ้าเวลารวมเกิน budget_s (ใช้กับ corpus ขนาดใหญ่)
+    """
+    timings = []
+    for _ in range(repeat):
+        if budget_s and sum(timings) > budget_s:
+            break
+        state = setup() if setup else None
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            started = time.perf_counter()
+            run(state) if setup else run()
+            timings.append(time.perf_counter() - started)
+    return {
+        "median_s": round(statistics.median(timings), 6),
+        "min_s": round(min(timings), 6),
+        "runs": len(timings),
+    }
+
+
+def bench_size(n: int, seed: int, repeat: int, components: list, budget_s: float = None,
+               workers: int = None) -> dict:
+    """วัดทุก component ที่ขนาด corpus n"""
+    workdir = tempfile.mkdtemp(prefix=f"bench_pipeline_{n}_")
+    try:
+        _configure(workdir, n)
+
+        from config.settings import settings
+        from services.news_processor import NewsProcessor
+        from filters.keyword_filter import KeywordFilter
+        from filters.deduplication import EnhancedDeduplication
+        from builders.news_message import NewsMessageBuilder
+        from builders.wti_message import WTIMessageBuilder
+        from services.wti_fetcher import WTIFuturesFetcher
+        from utils.storage import append_sent_link, read_sent_links
+
+        now = datetime.now(timezone.utc)
+        corpus = generate_corpus(n, seed=seed, now=now, window_hours=settings.WINDOW_HOURS)
+        _write_feed_fixture(corpus, now)
+
+        processor = NewsProcessor()
+        parsed = [processor._parse_entry(e, "Synthetic", "thai" if e.thai else "international") for e in corpus]
+
+        texts = [f"{item['title']} {item['summary']}" for item in parsed]
+        candidates = []
+        for item, text in zip(parsed, texts):
+            if item["published_dt"] and processor._in_time_window(item["published_dt"]) \
+                    and KeywordFilter.check_valid_energy_news(text)[0]:
+                country = KeywordFilter.detect_country(text)
+                if country:
+                    candidates.append(_final_item(processor, item, country))
+
+        dedup = EnhancedDeduplication()
+        kept = [item for item in candidates if dedup.add_item(item.copy())]
+        per_carousel = settings.BUBBLES_PER_CAROUSEL
+        wti_data = {
+            "current": {"source": "Synthetic", "current_price": 60.0},
+            "futures": WTIFuturesFetcher()._estimate_futures_from_spot(60.0),
+            "updated_at": now.strftime("%d/%m/%Y %H:%M"),
+            "is_estimated": True,
+        }
+
+        def run_keyword_filter():
+            for text in texts:
+                if KeywordFilter.check_valid_energy_news(text)[0]:
+                    KeywordFilter.detect_country(text)
+
+        def run_dedup():
+            d = EnhancedDeduplication()
+            for item in candidates:
+                d.add_item(item.copy())
+
+        def run_builders():
+            for i in range(0, len(kept), per_carousel):
+                NewsMessageBuilder.create_carousel_message(kept[i:i + per_carousel])
+            WTIMessageBuilder.create_wti_futures_message(wti_data)
+
+        def reset_sent_dir():
+            shutil.rmtree(settings.SENT_DIR, ignore_errors=True)
+
+        def run_storage(_):
+            for item in kept:
+                append_sent_link(item["canon_url"] or item["url"])
+            read_sent_links()
+
+        e2e_counts = {}
+        pool_counts = {}
+
+        def run_end_to_end(_):
+            news_processor = NewsProcessor()
+            items = news_processor.fetch_and_filter_news()
+            e2e_counts.update(news_processor.filter_stats["filtered_by"], returned=len(items))
+
+        def run_end_to_end_pool(_):
+            os.environ["PROCESS_WORKERS"] = str(workers or os.cpu_count() or 1)
+            settings.reload()
+            try:
+                news_processor = NewsProcessor()
+                items = news_processor.fetch_and_filter_news()
+                pool_counts.update(news_processor.filter_stats["filtered_by"], returned=len(items))
+            finally:
+                del os.environ["PROCESS_WORKERS"]
+                settings.reload()
+
+        runners = {
+            "parse_entry": lambda: _time(
+                lambda: [processor._parse_entry(e, "Synthetic", "thai") for e in corpus], repeat, budget_s=budget_s),
+            "keyword_filter": lambda: _time(run_keyword_filter, repeat, budget_s=budget_s),
+            "dedup_add_item": lambda: _time(run_dedup, repeat, budget_s=budget_s),
+            "builders": lambda: _time(run_builders, repeat, budget_s=budget_s),
+            "storage": lambda: _time(run_storage, repeat, setup=reset_sent_dir, budget_s=budget_s),
+            "end_to_end": lambda: _time(run_end_to_end, repeat, setup=reset_sent_dir, budget_s=budget_s),
+            "end_to_end_pool": lambda: _time(run_end_to_end_pool, repeat, setup=reset_sent_dir, budget_s=budget_s),
+        }
+
+        result = {"entries": n, "components": {}}
+        for name in components:
+            timing = runners[name]()
+            timing["us_per_entry"] = round(timing["median_s"] / n * 1e6, 2)
+            result["components"][name] = timing
+            print(f"  [{n:>6}] {name:<15} median {timing['median_s'] * 1000:10.2f} ms "
+                  f"({timing['us_per_entry']:.1f} us/entry)")
+
+        result["counts"] = {
+            "keyword_and_country_passed": len(candidates),
+            "dedup_kept": len(kept),
+        }
+        if e2e_counts:
+            result["counts"]["end_to_end"] = e2e_counts
+        if pool_counts:
+            result["counts"]["end_to_end_pool"] = pool_counts
+            if e2e_counts and pool_counts != e2e_counts:
+                print(f"  [{n:>6}] WARNING: end_to_end_pool counts differ from end_to_end")
+        return result
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """เทียบกับ baseline และคืนรายการ component ที่ช้าลงเกิน tolerance"""
+    regressions = []
+    print(f"\n{'size':>7} {'component':<15} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for size, result in current["sizes"].items():
+        base_result = baseline.get("sizes", {}).get(size)
+        if not base_result:
+            continue
+        for name, timing in result["components"].items():
+            base_timing = base_result["components"].get(name)
+            if not base_timing:
+                continue
+            before, after = base_timing["median_s"], timing["median_s"]
+            change = (after - before) / before if before else 0.0
+            regressed = change > tolerance and (after - before) * 1000 > min_delta_ms
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{size:>7} {name:<15} {before * 1000:12.2f} {after * 1000:12.2f} {change:+8.0%}{flag}")
+            if regressed:
+                regressions.append({"size": int(size), "component": name,
+                                    "baseline_s": before, "current_s": after, "change": round(change, 4)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="จำนวนข่าวใน corpus คั่นด้วย , (สูงสุดที่ใช้จริง 100000)")
+    parser.add_argument("--components", default=",".join(COMPONENTS), help="คั่นด้วย ,")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--budget-s", type=float, default=60.0, help="ไม่รันซ้ำถ้า component ใช้เวลารวมเกินนี้ (วินาที)")
+    parser.add_argument("--workers", type=int, help="จำนวน worker ของ end_to_end_pool (default = จำนวน CPU)")
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON (ใช้เป็น baseline ได้)")
+    parser.add_argument("--compare", help="ไฟล์ JSON baseline ที่ใช้เปรียบเทียบ")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="สัดส่วนที่ช้าลงได้ก่อนถือเป็น regression")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="ไม่นับ regression ที่ต่างน้อยกว่านี้ (ms)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    components = [name.strip() for name in args.components.split(",") if name.strip()]
+    unknown = [name for name in components if name not in COMPONENTS]
+    if unknown:
+        parser.error(f"unknown component: {', '.join(unknown)}")
+
+    results = {
+        "version": RESULT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for n in sizes:
+        print(f"[BENCH] corpus {n} entries")
+        results["sizes"][str(n)] = bench_size(n, args.seed, args.repeat, components, args.budget_s,
+                                                 args.workers)
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != RESULT_VERSION:
+            print(f"[BENCH] baseline version {baseline.get('version')} != {RESULT_VERSION}")
+            return 2
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        results["regressions"] = regressions
+        if regressions:
+            print(f"\n[BENCH] {len(regressions)} regression(s) over {args.tolerance:.0%}")
+            exit_code = 1
+        else:
+            print("\n[BENCH] no regressions")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Project Matcher Benchmark
+วัดเวลาหาชื่อโครงการในข่าวเมื่อรายชื่อโครงการโตเป็นหลักร้อย
+
+- scan: วน regex ทีละชื่อ (re.search ต่อชื่อ ต่อข่าว)
+- automaton: ProjectMatcher (อ่านข้อความรอบเดียว)
+- startup: เวลาสร้าง automaton เทียบกับโหลดจากไฟล์ cache
+
+Usage:
+    python benchmarks/bench_project_matcher.py
+    python benchmarks/bench_project_matcher.py --sizes 60,500,2000 --json projects.json
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("DEBUG_FILTERING", "0")
+os.environ.setdefault("SENT_DIR", tempfile.mkdtemp(prefix="bench_projects_"))
+
+from benchmarks.corpus import generate_corpus
+from data.projects import PROJECTS_BY_COUNTRY, PROJECT_ALIASES
+from filters.project_matcher import ProjectMatcher
+
+
+def _projects(n: int, rng: random.Random) -> dict:
+    """รายชื่อโครงการจริง + ชื่อสมมติ (แปลงสัมปทาน/Block) จนครบ n ชื่อ"""
+    projects = {country: list(names) for country, names in PROJECTS_BY_COUNTRY.items()}
+    synthetic = projects.setdefault("Synthetic", [])
+    total = sum(len(names) for names in projects.values())
+    for i in range(max(n - total, 0)):
+        synthetic.append(rng.choice([f"Block {i}X", f"โครงการจี {i}/{rng.randint(40, 99)}", f"Field-{i:04d}"]))
+    return projects
+
+
+def _scan(projects: dict, texts: list) -> list:
+    patterns = [
+        (re.compile(r'(?<![A-Za-z0-9])' + re.escape(name) + r'(?![A-Za-z0-9])', re.IGNORECASE),
+         PROJECT_ALIASES.get(name, name))
+        for names in projects.values() for name in names
+    ]
+    return [{project for pattern, project in patterns if pattern.search(text)} for text in texts]
+
+
+def bench(n: int, texts: list, seed: int) -> dict:
+    projects = _projects(n, random.Random(seed))
+
+    started = time.perf_counter()
+    _scan(projects, texts)
+    scan_s = time.perf_counter() - started
+
+    cache_file = os.path.join(tempfile.mkdtemp(prefix="bench_projects_"), "project_index.json")
+    started = time.perf_counter()
+    matcher = ProjectMatcher.from_projects(projects, PROJECT_ALIASES, cache_file)
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    ProjectMatcher.from_projects(projects, PROJECT_ALIASES, cache_file)
+    load_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in texts:
+        matcher.match(text)
+    automaton_s = time.perf_counter() - started
+
+    return {
+        "patterns": len(matcher.patterns),
+        "texts": len(texts),
+        "scan_us": round(scan_s / len(texts) * 1e6, 1),
+        "automaton_us": round(automaton_s / len(texts) * 1e6, 1),
+        "build_ms": round(build_s * 1000, 2),
+        "cache_load_ms": round(load_s * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="60,500,2000")
+    parser.add_argument("--texts", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="บันทึกผลเป็นไฟล์ JSON")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    texts = [f"{entry.title}\n{entry.summary}" for entry in generate_corpus(args.texts, seed=args.seed, now=now)]
+
+    results = []
+    for n in [int(size) for size in args.sizes.split(",") if size.strip()]:
+        result = bench(n, texts, args.seed)
+        results.append(result)
+        print(f"[{result['patterns']:>5} names] scan {result['scan_us']:>8.1f} us/item | "
+              f"automaton {result['automaton_us']:>6.1f} us/item | "
+              f"build {result['build_ms']:>7.2f} ms, cache load {result['cache_load_ms']:>7.2f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
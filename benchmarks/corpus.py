@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic Corpus Generator
+สร้างข่าวจำลองสำหรับ benchmark (หน้าตาเหมือน entry จาก Google News RSS)
+
+ชนิดของข่าวที่สร้าง (สัดส่วนปรับได้):
+    valid          ข่าวพลังงานไทย/อังกฤษ ที่มีประเทศและคำธุรกิจ/ตลาด
+    near_duplicate ข่าวเดิมที่เขียนใหม่เล็กน้อยหรือมาจากสำนักข่าวอื่น
+    out_of_window  ข่าวเก่ากว่า WINDOW_HOURS
+    excluded       ข่าวรถยนต์/ดารา/การกุศล (มีคำต้องห้าม)
+    irrelevant     ข่าวพลังงานที่ไม่ระบุประเทศ หรือไม่เกี่ยวกับพลังงาน
+
+ผลลัพธ์กำหนดได้ด้วย seed (เรียกซ้ำได้ผลเดิม)
+"""
+
+import random
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from xml.sax.saxutils import escape
+
+DEFAULT_MIX = {
+    "valid": 0.55,
+    "near_duplicate": 0.15,
+    "out_of_window": 0.10,
+    "excluded": 0.10,
+    "irrelevant": 0.10,
+}
+
+COUNTRIES_TH = ["ไทย", "เวียดนาม", "มาเลเซีย", "อินโดนีเซีย", "เมียนมา", "โอมาน", "ยูเออี", "คาซัคสถาน"]
+COUNTRIES_EN = ["Thailand", "Vietnam", "Malaysia", "Indonesia", "Myanmar", "Oman", "UAE", "Kazakhstan"]
+COMPANIES = ["PTTEP", "PTT", "Petronas", "PetroVietnam", "Pertamina", "Gulf Energy", "EGAT",
+             "Bangchak", "Banpu", "ADNOC", "Chevron", "Shell"]
+PROJECTS = ["Arthit", "Erawan", "Bongkot", "Zawtika", "Yadana", "SK309", "Block H",
+            "Vietnam 16-1", "Block 61", "Sinphuhorm", "G1/61", "B8/32"]
+
+TEMPLATES_TH = [
+    "{company} ลงทุนโครงการโรงไฟฟ้าใน{country} มูลค่า {n} ล้านบาท",
+    "ราคาน้ำมันดิบตลาดโลกปรับขึ้น {n} ดอลลาร์ต่อบาร์เรล กระทบ{country}",
+    "{country} ประกาศแผนพลังงานทดแทน {n} เมกะวัตต์ ภายในปี {year}",
+    "{company} เร่งผลิตก๊าซแหล่ง {project} ใน{country} เพิ่ม {n} ล้านลูกบาศก์ฟุต",
+    "กกพ. เคาะค่าไฟฟ้างวดใหม่ {n} สตางค์ต่อหน่วย ลดภาระประชาชน{country}",
+    "{country} ลงนามสัญญาซื้อขาย LNG กับ {company} ปริมาณ {n} ล้านตันต่อปี",
+    "{company} รายงานผลประกอบการไตรมาส {q} รายได้จากธุรกิจน้ำมันเพิ่ม {n}%",
+    "สัมปทานปิโตรเลียมแหล่ง {project} ใน{country} คาดผลิตได้ {n} บาร์เรลต่อวัน",
+]
+TEMPLATES_EN = [
+    "{company} invests ${n} million in {country} power plant project",
+    "Oil prices rise ${n} a barrel as {country} demand grows",
+    "{country} announces {n} MW renewable energy plan by {year}",
+    "{company} boosts gas production at {project} in {country} by {n} MMSCFD",
+    "{country} electricity tariff to fall {n} satang per unit, regulator says",
+    "{company} signs LNG supply deal with {country} for {n} million tonnes a year",
+    "{company} reports Q{q} revenue up {n}% on higher crude prices",
+    "{project} petroleum concession in {country} to produce {n} barrels a day",
+]
+EXCLUDED_TH = [
+    "ตลาดรถยนต์ไฟฟ้าใน{country} โต {n}% รับนโยบายพลังงาน",
+    "ดาราดังร่วมบุญมอบไฟฟ้าโซลาร์ให้โรงเรียน {n} แห่งใน{country}",
+]
+EXCLUDED_EN = [
+    "{country} car sales jump {n}% as fuel prices ease",
+    "Celebrity singer donates {n} solar panels to {country} charity",
+]
+IRRELEVANT_TH = [
+    "ราคาน้ำมันปรับลด {n} สตางค์ ตั้งแต่พรุ่งนี้",
+    "ทีมฟุตบอล{country} ชนะ {n} ประตูในนัดกระชับมิตร",
+]
+IRRELEVANT_EN = [
+    "Oil prices drop ${n} in early trading",
+    "{country} football team wins {n}-0 in friendly match",
+]
+PUBLISHERS = [
+    ("Reuters", "www.reuters.com"),
+    ("Bloomberg", "www.bloomberg.com"),
+    ("Bangkok Post", "www.bangkokpost.com"),
+    ("The Nation Thailand", "www.nationthailand.com"),
+    ("ประชาชาติธุรกิจ", "www.prachachat.net"),
+    ("ฐานเศรษฐกิจ", "www.thansettakij.com"),
+    ("กรุงเทพธุรกิจ", "www.bangkokbiz.com"),
+    ("Energy Voice", "www.energyvoice.com"),
+]
+REWRITE_PREFIXES_TH = ["ด่วน! ", "อัปเดต: ", "", "ล่าสุด "]
+REWRITE_PREFIXES_EN = ["UPDATE 1-", "Breaking: ", "", "Exclusive: "]
+
+
+class CorpusGenerator:
+    """สร้าง entry จำลองแบบ feedparser (มี title, link, summary, published)"""
+
+    def __init__(self, seed: int = 0, now: datetime = None, window_hours: int = 48,
+                 thai_ratio: float = 0.5, google_link_ratio: float = 0.7, mix: dict = None):
+        self.random = random.Random(seed)
+        self.now = now or datetime.now(timezone.utc)
+        self.window_hours = window_hours
+        self.thai_ratio = thai_ratio
+        self.google_link_ratio = google_link_ratio
+        self.mix = mix or DEFAULT_MIX
+        self._valid = []
+        self._counter = 0
+
+    def generate(self, n: int) -> list:
+        """สร้าง n entries"""
+        kinds, weights = zip(*self.mix.items())
+        return [self._entry(self.random.choices(kinds, weights)[0]) for _ in range(n)]
+
+    def _entry(self, kind: str) -> SimpleNamespace:
+        if kind == "near_duplicate" and self._valid:
+            return self._near_duplicate(self.random.choice(self._valid))
+
+        thai = self.random.random() < self.thai_ratio
+        if kind == "excluded":
+            templates = EXCLUDED_TH if thai else EXCLUDED_EN
+        elif kind == "irrelevant":
+            templates = IRRELEVANT_TH if thai else IRRELEVANT_EN
+        else:
+            templates = TEMPLATES_TH if thai else TEMPLATES_EN
+
+        headline = self._fill(self.random.choice(templates), thai)
+        if kind == "out_of_window":
+            age = timedelta(hours=self.random.uniform(self.window_hours + 1, self.window_hours * 4))
+        else:
+            age = timedelta(minutes=self.random.uniform(5, self.window_hours * 60 - 30))
+
+        entry = self._make(headline, self.random.choice(PUBLISHERS), self.now - age, thai)
+        if kind in ("valid", "near_duplicate"):
+            self._valid.append(entry)
+        return entry
+
+    def _near_duplicate(self, original: SimpleNamespace) -> SimpleNamespace:
+        """ข่าวเดิมจากสำนักข่าวอื่น พร้อมคำนำหน้า/เวลาที่ต่างไปเล็กน้อย"""
+        prefixes = REWRITE_PREFIXES_TH if original.thai else REWRITE_PREFIXES_EN
+        headline = self.random.choice(prefixes) + original.headline
+        published = original.published_dt + timedelta(minutes=self.random.uniform(-180, 180))
+        return self._make(headline, self.random.choice(PUBLISHERS), min(published, self.now), original.thai)
+
+    def _fill(self, template: str, thai: bool) -> str:
+        countries = COUNTRIES_TH if thai else COUNTRIES_EN
+        return template.format(
+            company=self.random.choice(COMPANIES),
+            country=self.random.choice(countries),
+            project=self.random.choice(PROJECTS),
+            n=self.random.randint(2, 9000),
+            year=self.random.randint(2026, 2037),
+            q=self.random.randint(1, 4),
+        )
+
+    def _make(self, headline: str, publisher: tuple, published: datetime, thai: bool) -> SimpleNamespace:
+        self._counter += 1
+        name, host = publisher
+        digest = hashlib.sha1(f"{self._counter}-{headline}".encode("utf-8")).hexdigest()
+        article = f"https://{host}/news/{digest[:12]}"
+        if self.random.random() < self.google_link_ratio:
+            link = f"https://news.google.com/rss/articles/CBMi{digest}?oc=5"
+        else:
+            link = article
+
+        summary = (f'<a href="{link}" target="_blank">{escape(headline)}</a>'
+                   f'&nbsp;&nbsp;<font color="#6f6f6f">{escape(name)}</font>')
+        return SimpleNamespace(
+            title=f"{headline} - {name}",
+            link=link,
+            summary=summary,
+            published=format_datetime(published),
+            published_dt=published,
+            source={"href": f"https://{host}", "title": name},
+            headline=headline,
+            thai=thai,
+        )
+
+
+def generate_corpus(n: int, seed: int = 0, now: datetime = None, **kwargs) -> list:
+    """สร้าง n entries (ดู CorpusGenerator สำหรับ options)"""
+    return CorpusGenerator(seed=seed, now=now, **kwargs).generate(n)
+
+
+def to_rss(entries: list, title: str = "Synthetic feed") -> bytes:
+    """แปลง entries เป็น RSS 2.0 แบบ Google News"""
+    items = []
+    for e in entries:
+        items.append(
+            "<item>"
+            f"<title>{escape(e.title)}</title>"
+            f"<link>{escape(e.link)}</link>"
+            f"<pubDate>{e.published}</pubDate>"
+            f"<description>{escape(e.summary)}</description>"
+            f'<source url="{escape(e.source["href"])}">{escape(e.source["title"])}</source>'
+            "</item>"
+        )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f"<rss version=\"2.0\"><channel><title>{escape(title)}</title>"
+        + "".join(items) +
+        "</channel></rss>"
+    )
+    return xml.encode("utf-8")
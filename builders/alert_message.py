@@ -6,11 +6,13 @@ Alert Message Builder
 
 import os
 from typing import Optional
+from utils.metrics import metrics
 
 class WTIPriceAlert:
     """ระบบแจ้งเตือนราคา WTI แบบ Dynamic"""
     
     @staticmethod
+    @metrics.timed("build_message", builder="wti_alert")
     def create_alert_message(data: dict, alert_config: Optional[dict] = None) -> dict:
         """
         สร้าง LINE Flex Message สำหรับการแจ้งเตือนราคา
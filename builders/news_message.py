@@ -5,12 +5,22 @@ News Message Builder
 """
 
 from datetime import datetime
-from config.settings import BUBBLES_PER_CAROUSEL, TZ
+from config.settings import settings
 from utils.text_utils import cut, create_simple_summary
+from utils.metrics import metrics
 
 class NewsMessageBuilder:
     """สร้าง LINE Flex Message สำหรับข่าว"""
     
+    # LINE รับ bubble ได้ไม่เกิน 12 อันต่อ carousel
+    MAX_CAROUSEL_BUBBLES = 12
+    
+    @staticmethod
+    def news_limit(trends: list = None) -> int:
+        """จำนวนข่าวสูงสุดต่อ carousel (เว้นที่ให้ bubble หัวข้อมาแรงถ้ามี trends)"""
+        limit = min(settings.BUBBLES_PER_CAROUSEL, NewsMessageBuilder.MAX_CAROUSEL_BUBBLES)
+        return min(limit, NewsMessageBuilder.MAX_CAROUSEL_BUBBLES - 1) if trends else limit
+    
     @staticmethod
     def create_flex_bubble(news_item: dict) -> dict:
         """สร้าง Flex Bubble สำหรับข่าวหนึ่งข่าว"""
@@ -153,21 +163,105 @@ class NewsMessageBuilder:
         return bubble
     
     @staticmethod
-    def create_carousel_message(news_items: list) -> dict:
-        """สร้าง Carousel Message จากข่าวหลายข่าว"""
+    def create_trending_bubble(trends: list) -> dict:
+        """สร้าง Flex Bubble ของหัวข้อที่มาแรง (trends = Trend จาก KeywordTrends.spikes)"""
+        if not trends:
+            return None
+        
+        contents = [
+            {
+                "type": "box",
+                "layout": "vertical",
+                "contents": [
+                    {
+                        "type": "text",
+                        "text": "🔥 หัวข้อมาแรง",
+                        "weight": "bold",
+                        "size": "md",
+                        "color": "#FFFFFF"
+                    }
+                ],
+                "backgroundColor": "#E65100",
+                "paddingAll": "12px",
+                "cornerRadius": "8px"
+            }
+        ]
+        
+        for trend in trends:
+            contents.append({
+                "type": "box",
+                "layout": "horizontal",
+                "margin": "md",
+                "contents": [
+                    {
+                        "type": "text",
+                        "text": cut(trend.keyword, 30),
+                        "size": "sm",
+                        "weight": "bold",
+                        "color": "#424242",
+                        "flex": 3
+                    },
+                    {
+                        "type": "text",
+                        "text": f"{trend.count} ข่าว (x{trend.ratio:g})",
+                        "size": "xs",
+                        "color": "#E65100",
+                        "align": "end",
+                        "flex": 2
+                    }
+                ]
+            })
+        
+        contents.append({
+            "type": "text",
+            "text": "เทียบกับค่าเฉลี่ยของช่วงก่อนหน้า",
+            "size": "xxs",
+            "color": "#888888",
+            "margin": "lg"
+        })
+        
+        return {
+            "type": "bubble",
+            "size": "kilo",
+            "body": {
+                "type": "box",
+                "layout": "vertical",
+                "contents": contents,
+                "paddingAll": "12px",
+                "spacing": "sm"
+            }
+        }
+    
+    @staticmethod
+    @metrics.timed("build_message", builder="news_carousel")
+    def create_carousel_message(news_items: list, trends: list = None) -> dict:
+        """
+        สร้าง Carousel Message จากข่าวหลายข่าว
+        
+        Args:
+            trends: หัวข้อที่มาแรง (ถ้ามีจะเพิ่ม bubble ท้าย carousel)
+        """
         bubbles = []
         
-        for item in news_items[:BUBBLES_PER_CAROUSEL]:
+        for item in news_items[:NewsMessageBuilder.news_limit(trends)]:
             bubble = NewsMessageBuilder.create_flex_bubble(item)
             if bubble:
                 bubbles.append(bubble)
         
+        metrics.incr("message_bubbles_total", len(bubbles), builder="news_carousel")
+        
         if not bubbles:
             return None
         
+        news_count = len(bubbles)
+        trending_bubble = NewsMessageBuilder.create_trending_bubble(trends)
+        if trending_bubble:
+            bubbles.append(trending_bubble)
+            metrics.incr("message_bubbles_total", builder="news_trending")
+        
         return {
             "type": "flex",
-            "altText": f"สรุปข่าวพลังงาน {datetime.now(TZ).strftime('%d/%m/%Y')} ({len(bubbles)} ข่าว)",
+            "altText": f"สรุปข่าวพลังงาน {datetime.now(settings.TZ).strftime('%d/%m/%Y')} ({news_count} ข่าว)",
             "contents": {
                 "type": "carousel",
                 "contents": bubbles
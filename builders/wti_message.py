@@ -4,10 +4,13 @@ WTI Message Builder
 สร้าง LINE Flex Message สำหรับ WTI Futures
 """
 
+from utils.metrics import metrics
+
 class WTIMessageBuilder:
     """สร้าง LINE Flex Message สำหรับ WTI Futures"""
     
     @staticmethod
+    @metrics.timed("build_message", builder="wti_futures")
     def create_wti_futures_message(data: dict) -> dict:
         """สร้าง Flex Message แสดงราคา WTI Futures ครบ 12 เดือน"""
         current = data.get("current", {})
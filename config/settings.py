@@ -2,72 +2,323 @@
 """
 Configuration Settings
 การตั้งค่าทั้งหมดของระบบ
+
+ค่าต่างๆ จะถูกอ่านจาก environment เมื่อใช้งานครั้งแรก (lazy) และ cache ไว้
+การ import โมดูลนี้จึงไม่มี side effect (ไม่ raise, ไม่ print, ไม่สร้างโฟลเดอร์)
+การตรวจสอบค่าที่จำเป็นให้เรียก settings.validate() ที่ entry point
+
+Usage:
+    from config.settings import settings
+    settings.validate("LINE_CHANNEL_ACCESS_TOKEN")
+    print(settings.WINDOW_HOURS)
 """
 
 import os
-import pytz
-
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except Exception:
-    pass
-
-# =============================================================================
-# TIMEZONE
-# =============================================================================
-TZ = pytz.timezone(os.getenv("TZ", "Asia/Bangkok"))
-
-# =============================================================================
-# LINE CONFIGURATION
-# =============================================================================
-LINE_CHANNEL_ACCESS_TOKEN = os.getenv("LINE_CHANNEL_ACCESS_TOKEN", "").strip()
-if not LINE_CHANNEL_ACCESS_TOKEN:
-    raise RuntimeError("Missing LINE_CHANNEL_ACCESS_TOKEN")
-
-# =============================================================================
-# GROQ LLM CONFIGURATION
-# =============================================================================
-GROQ_API_KEY = os.getenv("GROQ_API_KEY", "").strip()
-GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant").strip()
-GROQ_ENDPOINT = os.getenv("GROQ_ENDPOINT", "https://api.groq.com/openai/v1/chat/completions").strip()
-USE_LLM_SUMMARY = os.getenv("USE_LLM_SUMMARY", "1").strip().lower() in ["1", "true", "yes", "y"]
-
-# =============================================================================
-# EIA API CONFIGURATION
-# =============================================================================
-EIA_API_KEY = os.getenv("EIA_API_KEY", "").strip()
-if not EIA_API_KEY:
-    raise RuntimeError("Missing EIA_API_KEY - Get one from https://www.eia.gov/opendata/")
-
-# =============================================================================
-# NEWS FILTERING CONFIGURATION
-# =============================================================================
-WINDOW_HOURS = int(os.getenv("WINDOW_HOURS", "48"))
-MAX_PER_FEED = int(os.getenv("MAX_PER_FEED", "30"))
-DRY_RUN = os.getenv("DRY_RUN", "0").strip().lower() in ["1", "true", "yes", "y"]
-BUBBLES_PER_CAROUSEL = int(os.getenv("BUBBLES_PER_CAROUSEL", "10"))
-DEBUG_FILTERING = os.getenv("DEBUG_FILTERING", "1").strip().lower() in ["1", "true", "yes", "y"]
-
-# =============================================================================
-# ALLOWED NEWS SOURCES
-# =============================================================================
-ALLOWED_NEWS_SOURCES = os.getenv("ALLOWED_NEWS_SOURCES", "").strip()
-if ALLOWED_NEWS_SOURCES:
-    ALLOWED_NEWS_SOURCES_LIST = [s.strip().lower() for s in ALLOWED_NEWS_SOURCES.split(",") if s.strip()]
-    print(f"[CONFIG] เลือกเฉพาะเว็บข่าว: {ALLOWED_NEWS_SOURCES_LIST}")
-else:
-    ALLOWED_NEWS_SOURCES_LIST = []
-    print("[CONFIG] รับข่าวจากทุกเว็บข่าว")
-
-# =============================================================================
-# STORAGE CONFIGURATION
-# =============================================================================
-SENT_DIR = os.getenv("SENT_DIR", "sent_links")
-os.makedirs(SENT_DIR, exist_ok=True)
-
-# =============================================================================
-# WTI PRICE ALERT CONFIGURATION
-# =============================================================================
-WTI_ALERT_THRESHOLD = float(os.getenv("WTI_ALERT_THRESHOLD", "58.0"))
-WTI_ALERT_ENABLED = os.getenv("WTI_ALERT_ENABLED", "1").strip().lower() in ["1", "true", "yes", "y"]
+import threading
+from functools import cached_property
+
+_TRUE_VALUES = ["1", "true", "yes", "y"]
+
+_env_lock = threading.Lock()
+_env_loaded = False
+
+
+def _load_env():
+    """โหลดไฟล์ .env ครั้งเดียว (ถ้ามี python-dotenv)"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _env_lock:
+        if _env_loaded:
+            return
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except Exception:
+            pass
+        _env_loaded = True
+
+
+def _env(name: str, default: str = "") -> str:
+    _load_env()
+    return os.getenv(name, default).strip()
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return _env(name, default).lower() in _TRUE_VALUES
+
+
+class ConfigError(RuntimeError):
+    """การตั้งค่าที่จำเป็นไม่ครบ"""
+
+
+class Settings:
+    """การตั้งค่าของระบบ (อ่านค่าแต่ละตัวเมื่อใช้งานครั้งแรก)"""
+
+    # ข้อความ error เมื่อค่าที่จำเป็นไม่มี
+    REQUIRED_MESSAGES = {
+        "LINE_CHANNEL_ACCESS_TOKEN": "Missing LINE_CHANNEL_ACCESS_TOKEN",
+        "EIA_API_KEY": "Missing EIA_API_KEY - Get one from https://www.eia.gov/opendata/",
+    }
+
+    # =========================================================================
+    # TIMEZONE
+    # =========================================================================
+    @cached_property
+    def TZ(self):
+        import pytz
+        return pytz.timezone(_env("TZ", "Asia/Bangkok"))
+
+    # =========================================================================
+    # LINE CONFIGURATION
+    # =========================================================================
+    @cached_property
+    def LINE_CHANNEL_ACCESS_TOKEN(self) -> str:
+        return _env("LINE_CHANNEL_ACCESS_TOKEN")
+
+    # =========================================================================
+    # GROQ LLM CONFIGURATION
+    # =========================================================================
+    @cached_property
+    def GROQ_API_KEY(self) -> str:
+        return _env("GROQ_API_KEY")
+
+    @cached_property
+    def GROQ_MODEL(self) -> str:
+        return _env("GROQ_MODEL", "llama-3.1-8b-instant")
+
+    @cached_property
+    def GROQ_ENDPOINT(self) -> str:
+        return _env("GROQ_ENDPOINT", "https://api.groq.com/openai/v1/chat/completions")
+
+    @cached_property
+    def USE_LLM_SUMMARY(self) -> bool:
+        return _env_bool("USE_LLM_SUMMARY", "1")
+
+    # =========================================================================
+    # EIA API CONFIGURATION
+    # =========================================================================
+    @cached_property
+    def EIA_API_KEY(self) -> str:
+        return _env("EIA_API_KEY")
+
+    # =========================================================================
+    # NEWS FILTERING CONFIGURATION
+    # =========================================================================
+    @cached_property
+    def WINDOW_HOURS(self) -> int:
+        return int(_env("WINDOW_HOURS", "48"))
+
+    @cached_property
+    def MAX_PER_FEED(self) -> int:
+        return int(_env("MAX_PER_FEED", "30"))
+
+    @cached_property
+    def DRY_RUN(self) -> bool:
+        return _env_bool("DRY_RUN", "0")
+
+    @cached_property
+    def BUBBLES_PER_CAROUSEL(self) -> int:
+        return int(_env("BUBBLES_PER_CAROUSEL", "10"))
+
+    @cached_property
+    def DEBUG_FILTERING(self) -> bool:
+        return _env_bool("DEBUG_FILTERING", "1")
+
+    # =========================================================================
+    # DEDUPLICATION
+    # =========================================================================
+    # ไฟล์เก็บ event signatures ข้ามรอบ (ว่าง = ไม่บันทึก)
+    @cached_property
+    def EVENT_INDEX_FILE(self) -> str:
+        return _env("EVENT_INDEX_FILE")
+
+    # =========================================================================
+    # PARALLEL PROCESSING
+    # =========================================================================
+    # จำนวน worker process สำหรับ parse/ตรวจคำสำคัญ (0 = ทำใน process หลัก, auto = จำนวน CPU)
+    @cached_property
+    def PROCESS_WORKERS(self) -> int:
+        value = _env("PROCESS_WORKERS", "0").lower()
+        if value == "auto":
+            return os.cpu_count() or 1
+        return max(int(value), 0)
+
+    @cached_property
+    def PROCESS_CHUNK_SIZE(self) -> int:
+        return max(int(_env("PROCESS_CHUNK_SIZE", "64")), 1)
+
+    # =========================================================================
+    # VERDICT CACHE
+    # =========================================================================
+    # โฟลเดอร์เก็บผล parse/ตรวจคำสำคัญของ entry ข้ามรอบ (ว่าง = ไม่ใช้ cache)
+    @cached_property
+    def VERDICT_CACHE_DIR(self) -> str:
+        return _env("VERDICT_CACHE_DIR")
+
+    @cached_property
+    def VERDICT_CACHE_TTL_HOURS(self) -> float:
+        return float(_env("VERDICT_CACHE_TTL_HOURS", "72"))
+
+    # =========================================================================
+    # RELEVANCE SCORING
+    # =========================================================================
+    # คะแนนความเกี่ยวข้องของข่าวลดลงครึ่งหนึ่งทุกกี่ชั่วโมง (0 = ไม่คิดอายุข่าว)
+    @cached_property
+    def RELEVANCE_HALF_LIFE_HOURS(self) -> float:
+        return float(_env("RELEVANCE_HALF_LIFE_HOURS", "24"))
+
+    # =========================================================================
+    # KEYWORD TRENDS
+    # =========================================================================
+    # ไฟล์เก็บจำนวนข่าวต่อคำสำคัญข้ามรอบ (ว่าง = ไม่ตรวจคำที่มาแรง)
+    @cached_property
+    def TREND_FILE(self) -> str:
+        return _env("TREND_FILE")
+
+    @cached_property
+    def TREND_BUCKET_HOURS(self) -> float:
+        return float(_env("TREND_BUCKET_HOURS", "6"))
+
+    # จำนวนช่วงเวลา (ช่วงละ WINDOW_HOURS) ก่อนหน้าที่ใช้เป็นค่าเฉลี่ยอ้างอิง
+    @cached_property
+    def TREND_BASELINE_WINDOWS(self) -> int:
+        return max(int(_env("TREND_BASELINE_WINDOWS", "7")), 1)
+
+    @cached_property
+    def TREND_SPIKE_RATIO(self) -> float:
+        return float(_env("TREND_SPIKE_RATIO", "2.0"))
+
+    @cached_property
+    def TREND_MIN_COUNT(self) -> int:
+        return int(_env("TREND_MIN_COUNT", "3"))
+
+    # เพิ่ม bubble "หัวข้อมาแรง" ท้าย carousel ข่าวประเทศเฉพาะ
+    @cached_property
+    def TREND_BUBBLE(self) -> bool:
+        return _env_bool("TREND_BUBBLE", "0")
+
+    # =========================================================================
+    # PROJECT MATCHER
+    # =========================================================================
+    # ไฟล์ cache ของ automaton ชื่อโครงการ (ว่าง = สร้างใหม่ทุกครั้งที่เริ่มทำงาน)
+    @cached_property
+    def PROJECT_INDEX_CACHE_FILE(self) -> str:
+        return _env("PROJECT_INDEX_CACHE_FILE")
+
+    # =========================================================================
+    # ALLOWED NEWS SOURCES
+    # =========================================================================
+    @cached_property
+    def ALLOWED_NEWS_SOURCES(self) -> str:
+        return _env("ALLOWED_NEWS_SOURCES")
+
+    @cached_property
+    def ALLOWED_NEWS_SOURCES_LIST(self) -> list:
+        return [s.strip().lower() for s in self.ALLOWED_NEWS_SOURCES.split(",") if s.strip()]
+
+    # =========================================================================
+    # STORAGE CONFIGURATION
+    # =========================================================================
+    @cached_property
+    def SENT_DIR(self) -> str:
+        return _env("SENT_DIR", "sent_links")
+
+    # =========================================================================
+    # WTI PRICE ALERT CONFIGURATION
+    # =========================================================================
+    @cached_property
+    def WTI_ALERT_THRESHOLD(self) -> float:
+        return float(_env("WTI_ALERT_THRESHOLD", "58.0"))
+
+    @cached_property
+    def WTI_ALERT_ENABLED(self) -> bool:
+        return _env_bool("WTI_ALERT_ENABLED", "1")
+
+    # =========================================================================
+    # METRICS / INSTRUMENTATION
+    # =========================================================================
+    @cached_property
+    def METRICS_DIR(self) -> str:
+        return _env("METRICS_DIR", "metrics")
+
+    @cached_property
+    def METRICS_PROMETHEUS(self) -> bool:
+        return _env_bool("METRICS_PROMETHEUS", "0")
+
+    # =========================================================================
+    # SERVICE BASE URLS (เปลี่ยนเป็น mock server สำหรับ load test ได้)
+    # =========================================================================
+    @cached_property
+    def LINE_API_BASE_URL(self) -> str:
+        return _env("LINE_API_BASE_URL", "https://api.line.me").rstrip("/")
+
+    @cached_property
+    def YAHOO_CHART_BASE_URL(self) -> str:
+        return _env("YAHOO_CHART_BASE_URL", "https://query1.finance.yahoo.com").rstrip("/")
+
+    @cached_property
+    def EIA_API_BASE_URL(self) -> str:
+        return _env("EIA_API_BASE_URL", "https://api.eia.gov/v2").rstrip("/")
+
+    @cached_property
+    def GNEWS_BASE_URL(self) -> str:
+        return _env("GNEWS_BASE_URL", "https://news.google.com").rstrip("/")
+
+    # =========================================================================
+    # HTTP RECORD / REPLAY
+    # =========================================================================
+    @cached_property
+    def HTTP_MODE(self) -> str:
+        mode = _env("HTTP_MODE", "live").lower()
+        if mode not in ("live", "record", "replay"):
+            raise ConfigError(f"Invalid HTTP_MODE: {mode} (expected live, record or replay)")
+        return mode
+
+    @cached_property
+    def HTTP_FIXTURES(self) -> str:
+        return _env("HTTP_FIXTURES")
+
+    @cached_property
+    def HTTP_REPLAY_LATENCY_SCALE(self) -> float:
+        return float(_env("HTTP_REPLAY_LATENCY_SCALE", "1.0"))
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+    def validate(self, *names: str):
+        """
+        ตรวจสอบว่าค่าที่จำเป็นถูกตั้งไว้ (เรียกที่ entry point)
+
+        Raises:
+            ConfigError: ถ้าค่าใดค่าหนึ่งว่าง
+        """
+        for name in names:
+            if not getattr(self, name):
+                raise ConfigError(self.REQUIRED_MESSAGES.get(name, f"Missing {name}"))
+
+    def reload(self):
+        """ล้าง cache เพื่ออ่านค่าจาก environment ใหม่"""
+        for name in list(vars(self)):
+            if isinstance(getattr(type(self), name, None), cached_property):
+                del self.__dict__[name]
+
+    @classmethod
+    def names(cls) -> list:
+        """รายชื่อการตั้งค่าทั้งหมด"""
+        return [name for name, value in vars(cls).items() if isinstance(value, cached_property)]
+
+
+settings = Settings()
+
+
+def get_settings() -> Settings:
+    """คืนค่า Settings ที่ cache ไว้ของ process"""
+    return settings
+
+
+def __getattr__(name: str):
+    """รองรับ `from config.settings import TZ` แบบเดิม (อ่านค่าแบบ lazy)"""
+    if isinstance(getattr(Settings, name, None), cached_property):
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Publisher Domain Registry
+ทะเบียนเว็บข่าว (ชื่อ ประเทศ ภาษา ระดับความน่าเชื่อถือ และ RSS feeds) โหลดจาก data/publishers.json
+
+ค้นหาด้วย trie ของ label ที่กลับด้าน (com -> reuters -> feeds) ใช้เวลา O(จำนวน label)
+ไม่ขึ้นกับจำนวนเว็บในทะเบียน และตรงทั้ง label จึงไม่เกิดกรณี 'ft.com' ตรงกับ 'microsoft.com'
+subdomain ใช้ข้อมูลของ domain ที่ยาวที่สุดที่อยู่ในทะเบียน (asia.nikkei.com ก่อน nikkei.com)
+"""
+
+import os
+import json
+from functools import lru_cache
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "publishers.json")
+REGISTRY_VERSION = 1
+
+# key ของข้อมูลเว็บใน node ของ trie (label จริงไม่มีจุด จึงไม่ชนกัน)
+_RECORD = "."
+
+
+class Publisher(NamedTuple):
+    """เว็บข่าวหนึ่งเว็บในทะเบียน"""
+    domain: str
+    name: str
+    country: str = ""
+    language: str = ""
+    tier: int = 3
+    feeds: tuple = ()
+    aliases: tuple = ()
+
+
+def _labels(domain: str) -> List[str]:
+    """label ของ domain จากขวาไปซ้าย (ตัด www. และจุดท้าย)"""
+    domain = domain.strip().lower().rstrip(".")
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain.split(".")[::-1] if domain else []
+
+
+class DomainRegistry:
+    """ทะเบียน domain -> Publisher (รวม subdomain)"""
+
+    def __init__(self, publishers: Iterable[Publisher] = ()):
+        self._root = {}
+        self._publishers = []
+        for publisher in publishers:
+            self.add(publisher)
+
+    @classmethod
+    def load(cls, path: str = REGISTRY_FILE) -> "DomainRegistry":
+        """โหลดทะเบียนจากไฟล์ JSON"""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REGISTRY_VERSION:
+            raise ValueError(f"{path}: unsupported registry version {data.get('version')!r}")
+        return cls(
+            Publisher(
+                domain=record["domain"].lower(),
+                name=record["name"],
+                country=record.get("country", ""),
+                language=record.get("language", ""),
+                tier=int(record.get("tier", 3)),
+                feeds=tuple(record.get("feeds", ())),
+                aliases=tuple(alias.lower() for alias in record.get("aliases", ())),
+            )
+            for record in data.get("publishers", [])
+        )
+
+    def add(self, publisher: Publisher):
+        """เพิ่มเว็บ (domain หลักและ aliases) - domain ที่ซ้ำจะถูกแทนที่ด้วยข้อมูลล่าสุด"""
+        self._publishers.append(publisher)
+        for domain in (publisher.domain,) + publisher.aliases:
+            node = self._root
+            for label in _labels(domain):
+                node = node.setdefault(label, {})
+            node[_RECORD] = publisher
+
+    def lookup(self, domain: str) -> Optional[Publisher]:
+        """Publisher ของ domain (หรือ parent domain ที่ใกล้ที่สุด) หรือ None"""
+        if not domain:
+            return None
+        node = self._root
+        found = None
+        for label in _labels(domain):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(_RECORD, found)
+        return found
+
+    def source_name(self, domain: str) -> str:
+        """ชื่อเว็บข่าว หรือ domain (ตัด www.) ถ้าไม่อยู่ในทะเบียน"""
+        publisher = self.lookup(domain)
+        if publisher is not None:
+            return publisher.name
+        domain = (domain or "").lower()
+        return domain[4:] if domain.startswith("www.") else domain
+
+    def __contains__(self, domain: str) -> bool:
+        return self.lookup(domain) is not None
+
+    def __iter__(self) -> Iterator[Publisher]:
+        return iter(self._publishers)
+
+    def __len__(self) -> int:
+        return len(self._publishers)
+
+
+@lru_cache(maxsize=1)
+def get_registry() -> DomainRegistry:
+    """ทะเบียนเว็บข่าวของ process (โหลดจาก data/publishers.json ครั้งเดียว)"""
+    return DomainRegistry.load()
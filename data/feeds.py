@@ -2,29 +2,39 @@
 """
 RSS Feed Sources
 แหล่งข้อมูลข่าวจาก RSS Feeds
+
+URL ของ feed สร้างเมื่อเรียก get_feeds() (อ่าน GNEWS_BASE_URL ตอนใช้งาน ไม่ใช่ตอน import)
 """
 
-import requests
+from urllib.parse import quote
+from config.settings import settings
 
 def gnews_rss(q: str, hl="en", gl="US", ceid="US:en") -> str:
-    """สร้าง Google News RSS URL"""
-    return f"https://news.google.com/rss/search?q={requests.utils.quote(q)}&hl={hl}&gl={gl}&ceid={ceid}"
+    """สร้าง Google News RSS URL (base URL เปลี่ยนได้ด้วย GNEWS_BASE_URL)"""
+    return f"{settings.GNEWS_BASE_URL}/rss/search?q={quote(q)}&hl={hl}&gl={gl}&ceid={ceid}"
 
-FEEDS = [
+# (ชื่อ feed, ประเภท, query ของ Google News, ภาษา/ประเทศ)
+FEED_QUERIES = [
     (
         "GoogleNewsTH", 
         "thai", 
-        gnews_rss(
-            '(พลังงาน OR "ค่าไฟ" OR ก๊าซ OR LNG OR น้ำมัน OR ไฟฟ้า OR "โรงไฟฟ้า" OR "พลังงานทดแทน" OR "สัมปทาน") -"รถยนต์" -"ตลาดรถ" -"ดารา" -"นักแสดง"',
-            hl="th", gl="TH", ceid="TH:th"
-        )
+        '(พลังงาน OR "ค่าไฟ" OR ก๊าซ OR LNG OR น้ำมัน OR ไฟฟ้า OR "โรงไฟฟ้า" OR "พลังงานทดแทน" OR "สัมปทาน") -"รถยนต์" -"ตลาดรถ" -"ดารา" -"นักแสดง"',
+        dict(hl="th", gl="TH", ceid="TH:th")
     ),
     (
         "GoogleNewsEN", 
         "international", 
-        gnews_rss(
-            '(energy OR electricity OR power OR oil OR gas OR "power plant" OR "energy project") AND (Thailand OR Vietnam OR Malaysia OR Indonesia) -car -automotive -celebrity',
-            hl="en", gl="US", ceid="US:en"
-        )
+        '(energy OR electricity OR power OR oil OR gas OR "power plant" OR "energy project") AND (Thailand OR Vietnam OR Malaysia OR Indonesia) -car -automotive -celebrity',
+        dict(hl="en", gl="US", ceid="US:en")
     ),
 ]
+
+def get_feeds() -> list:
+    """รายการ feed [(ชื่อ, ประเภท, URL), ...] จาก GNEWS_BASE_URL ปัจจุบัน"""
+    return [(name, feed_type, gnews_rss(query, **locale)) for name, feed_type, query, locale in FEED_QUERIES]
+
+def __getattr__(name: str):
+    """รองรับ `from data.feeds import FEEDS` แบบเดิม (สร้าง URL เมื่อถูกเรียก)"""
+    if name == "FEEDS":
+        return get_feeds()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
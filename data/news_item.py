@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+News Item
+ข่าวหนึ่งข่าวที่ผ่าน filter (ใช้ __slots__ แทน dict 14 keys)
+
+ค่าที่ได้จากค่าอื่น (domain, source_name, simple_summary) คำนวณเมื่อถูกเรียกใช้ครั้งแรก
+และรองรับการเข้าถึงแบบ dict (item['title'], item.get('country'), dict(item))
+ทำให้ dedup, builders และ main.py ใช้งานได้เหมือนเดิม
+"""
+
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from data.news_sources import get_source_name
+from utils.url_utils import publisher_domain
+from utils.text_utils import create_simple_summary
+
+# ความยาวสรุปเริ่มต้น (เท่ากับที่ NewsMessageBuilder ใช้เมื่อไม่มีสรุป)
+SIMPLE_SUMMARY_LENGTH = 120
+
+
+class NewsItem:
+    """ข่าวหนึ่งข่าว - เข้าถึงได้ทั้งแบบ attribute และแบบ dict"""
+
+    KEYS = (
+        'title', 'url', 'canon_url', 'source_name', 'domain', 'summary', 'published_dt',
+        'country', 'project_hints', 'llm_summary', 'feed', 'feed_type', 'simple_summary', 'source_url', 'score',
+    )
+
+    __slots__ = (
+        'title', 'url', 'canon_url', 'summary', 'published_dt', 'country', 'project_hints',
+        'llm_summary', 'feed', 'feed_type', 'source_url', 'score',
+        '_domain', '_source_name', '_simple_summary', '_analysis',
+    )
+
+    def __init__(self, title: str = '', url: str = '', canon_url: str = '', summary: str = '',
+                 published_dt: Optional[datetime] = None, country: str = '',
+                 project_hints: Optional[List[str]] = None, llm_summary: str = '',
+                 feed: str = '', feed_type: str = '', source_url: str = '', score: float = 0.0,
+                 domain: Optional[str] = None,
+                 source_name: Optional[str] = None, simple_summary: Optional[str] = None):
+        self.title = title
+        self.url = url
+        self.canon_url = canon_url
+        self.summary = summary
+        self.published_dt = published_dt
+        self.country = country
+        self.project_hints = project_hints if project_hints is not None else []
+        self.llm_summary = llm_summary
+        self.feed = feed
+        self.feed_type = feed_type
+        self.source_url = source_url
+        self.score = score
+        self._domain = domain
+        self._source_name = source_name
+        self._simple_summary = simple_summary
+        self._analysis = None
+
+    # ===== ค่าที่คำนวณเมื่อใช้งาน =====
+
+    @property
+    def domain(self) -> str:
+        if self._domain is None:
+            self._domain = publisher_domain(self.canon_url or self.url, self.source_url)
+        return self._domain
+
+    @domain.setter
+    def domain(self, value: str):
+        self._domain = value
+
+    @property
+    def source_name(self) -> str:
+        if self._source_name is None:
+            self._source_name = get_source_name(self.domain)
+        return self._source_name
+
+    @source_name.setter
+    def source_name(self, value: str):
+        self._source_name = value
+
+    @property
+    def simple_summary(self) -> str:
+        """สรุปแบบ batch (ถ้าตั้งค่าไว้) มิฉะนั้นใช้ประโยคแรกของ summary"""
+        if self._simple_summary is None:
+            self._simple_summary = create_simple_summary(self.summary, SIMPLE_SUMMARY_LENGTH)
+        return self._simple_summary
+
+    @simple_summary.setter
+    def simple_summary(self, value: str):
+        self._simple_summary = value
+
+    # ===== dict-compatible API =====
+
+    def _has(self, key: str) -> bool:
+        if key in self.KEYS:
+            return True
+        return key == '_analysis' and self._analysis is not None
+
+    def __getitem__(self, key: str):
+        if not self._has(key):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in self.KEYS and key != '_analysis':
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._has(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if self._has(key) else default
+
+    def setdefault(self, key: str, default=None):
+        if self._has(key):
+            return getattr(self, key)
+        self[key] = default
+        return default
+
+    def keys(self) -> List[str]:
+        return list(self.KEYS) + (['_analysis'] if self._analysis is not None else [])
+
+    def values(self) -> list:
+        return [getattr(self, key) for key in self.keys()]
+
+    def items(self) -> list:
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def copy(self) -> "NewsItem":
+        """สำเนาแบบ shallow (ค่าที่คำนวณแล้วและผลวิเคราะห์ข้อความใช้ร่วมกัน)"""
+        item = NewsItem.__new__(NewsItem)
+        for slot in self.__slots__:
+            setattr(item, slot, getattr(self, slot))
+        return item
+
+    def to_dict(self) -> dict:
+        """dict ของค่าข่าว (ไม่รวมผลวิเคราะห์ข้อความ)"""
+        return {key: getattr(self, key) for key in self.KEYS}
+
+    def __repr__(self) -> str:
+        return f"NewsItem(title={self.title[:40]!r}, country={self.country!r}, url={self.url!r})"
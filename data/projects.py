@@ -2,6 +2,8 @@
 """
 Project Database
 ฐานข้อมูลโครงการพลังงานแยกตามประเทศ
+
+PROJECT_ALIASES: ชื่ออื่นของโครงการ -> ชื่อหลัก (ใช้รวมผลของ filters/project_matcher.py)
 """
 
 PROJECTS_BY_COUNTRY = {
@@ -49,3 +51,34 @@ PROJECTS_BY_COUNTRY = {
         "OPEC", "IEA", "WTI", "Brent", "Global Energy Market"
     ]
 }
+
+PROJECT_ALIASES = {
+    # Thailand
+    "Arthit": "โครงการอาทิตย์",
+    "S1": "โครงการเอส 1",
+    "Contract 4": "โครงการสัมปทาน 4",
+    "PTTEP 1": "โครงการพีทีทีอีพี 1",
+    "E5": "โครงการอี 5",
+    "Sinphuhorm": "โครงการสินภูฮ่อม",
+    "B8/32": "โครงการบี 8/32",
+    "9เอ": "9A",
+
+    # Myanmar
+    "Zawtika": "โครงการซอติก้า",
+    "Yadana": "โครงการยาดานา",
+    "Myanmar M3": "โครงการเมียนมา เอ็ม 3",
+
+    # Malaysia
+    "SK309": "Malaysia SK309",
+    "SK311": "Malaysia SK311",
+    "Block H": "Malaysia Block H",
+
+    # Vietnam
+    "Vietnam 16-1": "โครงการเวียดนาม 16-1",
+    "16-1": "โครงการเวียดนาม 16-1",
+
+    # Indonesia / Kazakhstan / Oman
+    "Natuna Sea A": "โครงการนาทูน่า ซี เอ",
+    "Dunga": "โครงการดุงกา",
+    "Block 61": "Oman Block 61",
+}
@@ -6,27 +6,23 @@ Enhanced Deduplication System
 
 import re
 import hashlib
-from typing import List, Set, Tuple, Optional, Dict
-from difflib import SequenceMatcher
+from collections import Counter, defaultdict
+from typing import Iterable, List, Set, Tuple, Optional, Dict
 from utils.url_utils import normalize_url
-from config.settings import DEBUG_FILTERING
+from config.settings import settings
+from utils.metrics import metrics
+from filters.event_index import EventSignatureIndex
+from filters.similarity import normalized, similarity_ratio, similar_at_least, SimilarityIndex
+from filters.text_analysis import (
+    AnalyzedText, analyze_item, normalize_text, THAI_STOP_WORDS, ENGLISH_STOP_WORDS
+)
 
 class EnhancedDeduplication:
     """ระบบกันข่าวซ้ำที่ปรับปรุงใหม่"""
     
-    THAI_STOP_WORDS = {
-        'ที่', 'ใน', 'จาก', 'เป็น', 'การ', 'และ', 'ของ', 'ได้', 'มี', 'ว่า',
-        'กับ', 'โดย', 'ให้', 'แล้ว', 'ไป', 'มา', 'อยู่', 'ยัง', 'คือ', 'ถึง',
-        'นี้', 'นั้น', 'ซึ่ง', 'เพื่อ', 'แต่', 'ถ้า', 'จะ', 'ก็', 'ไม่', 'ขึ้น'
-    }
+    THAI_STOP_WORDS = THAI_STOP_WORDS
     
-    ENGLISH_STOP_WORDS = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
-        'those', 'it', 'its'
-    }
+    ENGLISH_STOP_WORDS = ENGLISH_STOP_WORDS
     
     GROUPING_KEYWORDS = {
         'pttep', 'ปตท.', 'murphy', 'shell', 'chevron', 'exxon', 'total',
@@ -63,49 +59,54 @@ class EnhancedDeduplication:
         self.seen_fingerprints: Set[str] = set()
         self.processed_items: List[dict] = []
         self.title_cache: List[Tuple[str, str]] = []
-        self.event_signatures: Dict[str, List[dict]] = {}  # ← เพิ่ม: เก็บ event signatures
+        
+        # Event signatures แยกตามชั่วโมง (บันทึกข้ามรอบได้เมื่อตั้ง EVENT_INDEX_FILE)
+        # event_index เก็บเฉพาะข่าวที่ส่งแล้ว ส่วนข่าวที่ผ่าน dedup ในรอบนี้อยู่ใน run_events
+        # (ข่าวที่ไม่ถูกเลือกส่งจะไม่ถูกบันทึก รอบถัดไปจึงยังส่งได้)
+        self.event_index = EventSignatureIndex(
+            match_hours=24, retention_hours=settings.WINDOW_HOURS + 24
+        )
+        self.run_events = EventSignatureIndex(match_hours=24)
+        if settings.EVENT_INDEX_FILE:
+            loaded = self.event_index.load(settings.EVENT_INDEX_FILE)
+            evicted = self.event_index.evict()
+            if loaded:
+                print(f"[DEDUP] โหลด event index {loaded - evicted} ข่าว (ลบข่าวเก่า {evicted})")
+        
+        # Inverted indexes สำหรับ Check 4/5: คำ -> ลำดับของข่าวใน processed_items
+        self._keyword_index: Dict[str, List[int]] = defaultdict(list)
+        self._term_index: Dict[str, List[int]] = defaultdict(list)
+        # Index สำหรับ Check 1/3: title -> ลำดับของข่าว และ normalized title ของ processed_items / title_cache
+        self._title_index: Dict[str, List[int]] = defaultdict(list)
+        self._similarity_index = SimilarityIndex()
+        self._cache_similarity_index = SimilarityIndex()
+        self._indexed_count = 0
+    
+    # รายชื่อองค์กร/โครงการสำคัญ (ใช้ใน event signature)
+    ENTITY_KEYWORDS = [
+        'pttep', 'ปตท', 'chevron', 'shell', 'exxon', 'total', 'bp',
+        'petrovietnam', 'petronas', 'pertamina', 'celcomdigi',
+        'egat', 'กฟผ', 'ptt', 'irpc', 'bangchak', 'บางจาก',
+        'congress', 'parliament', 'government', 'รัฐบาล'
+    ]
     
     def normalize_text(self, text: str) -> str:
         """Normalize text สำหรับการเปรียบเทียบ"""
-        if not text:
-            return ""
-        
-        text = text.lower()
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', '', text)
-        text = ' '.join(text.split())
-        
-        words = text.split()
-        filtered_words = [
-            w for w in words 
-            if w not in self.THAI_STOP_WORDS 
-            and w not in self.ENGLISH_STOP_WORDS
-            and len(w) > 1
-        ]
-        
-        return ' '.join(filtered_words)
+        return normalize_text(text)
     
-    def extract_keywords(self, text: str) -> Set[str]:
-        """ดึงคำสำคัญจากข้อความ"""
-        text_lower = text.lower()
-        found_keywords = set()
-        
-        for keyword in self.GROUPING_KEYWORDS:
-            if keyword in text_lower:
-                found_keywords.add(keyword)
-        
-        return found_keywords
+    def extract_keywords(self, text) -> Set[str]:
+        """ดึงคำสำคัญจากข้อความ (รับ str หรือ AnalyzedText)"""
+        return set(AnalyzedText.of(text).hits("grouping", self.GROUPING_KEYWORDS))
     
     # ← เพิ่มฟังก์ชันนี้: ตรวจจับ Event Type
-    def detect_event_type(self, text: str) -> Optional[str]:
+    def detect_event_type(self, text) -> Optional[str]:
         """
         ตรวจจับประเภทของเหตุการณ์
         
         Returns:
             event_type (str) หรือ None ถ้าไม่พบ
         """
-        text_lower = text.lower()
+        text_lower = AnalyzedText.of(text).lower
         
         for event_type, keywords in self.EVENT_SIGNATURES.items():
             for keyword in keywords:
@@ -125,10 +126,11 @@ class EnhancedDeduplication:
         
         จะได้ signature เดียวกัน
         """
-        full_text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
+        analysis = analyze_item(item)
+        full_text = analysis.lower
         
         # 1. ตรวจจับประเภทเหตุการณ์
-        event_type = self.detect_event_type(full_text)
+        event_type = self.detect_event_type(analysis)
         if not event_type:
             return None
         
@@ -140,7 +142,7 @@ class EnhancedDeduplication:
         numbers_str = '|'.join(sorted(set(numbers))[:3])  # เอาแค่ 3 ตัวแรก
         
         # 4. ดึงชื่อองค์กร/โครงการสำคัญ
-        important_entities = self._extract_entities(full_text)
+        important_entities = self._extract_entities(analysis)
         entities_str = '|'.join(sorted(important_entities)[:2])
         
         # 5. สร้าง signature
@@ -148,31 +150,17 @@ class EnhancedDeduplication:
         
         return hashlib.md5(signature.encode('utf-8')).hexdigest()
     
-    def _extract_entities(self, text: str) -> Set[str]:
-        """ดึงชื่อองค์กร/โครงการที่สำคัญ"""
-        entities = set()
-        
-        # รายชื่อองค์กรสำคัญ
-        organizations = [
-            'pttep', 'ปตท', 'chevron', 'shell', 'exxon', 'total', 'bp',
-            'petrovietnam', 'petronas', 'pertamina', 'celcomdigi',
-            'egat', 'กฟผ', 'ptt', 'irpc', 'bangchak', 'บางจาก',
-            'congress', 'parliament', 'government', 'รัฐบาล'
-        ]
-        
-        for org in organizations:
-            if org in text:
-                entities.add(org)
-        
-        return entities
+    def _extract_entities(self, text) -> Set[str]:
+        """ดึงชื่อองค์กร/โครงการที่สำคัญ (รับ str หรือ AnalyzedText)"""
+        return set(AnalyzedText.of(text).hits("entities", self.ENTITY_KEYWORDS))
     
     def create_content_fingerprint(self, item: dict) -> str:
         """สร้าง fingerprint จากเนื้อหาข่าว"""
-        title = self.normalize_text(item.get('title', ''))
-        title_clean = re.sub(r'\s+', ' ', title).strip()
+        analysis = analyze_item(item)
+        title_clean = analysis.normalized_title
         
         country = item.get('country', '')
-        keywords = self.extract_keywords(f"{item.get('title', '')} {item.get('summary', '')}")
+        keywords = self.extract_keywords(analysis)
         keywords_str = '|'.join(sorted(keywords))
         
         content = f"{title_clean}|{country}|{keywords_str}"
@@ -180,13 +168,14 @@ class EnhancedDeduplication:
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """คำนวณความคล้ายคลึงระหว่างข้อความ"""
-        norm1 = self.normalize_text(text1)
-        norm2 = self.normalize_text(text2)
-        
-        if not norm1 or not norm2:
-            return 0.0
-        
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        return similarity_ratio(normalized(text1), normalized(text2))
+    
+    def _title_similarity(self, analysis: AnalyzedText, existing: dict, threshold: float) -> float:
+        """
+        ความคล้ายคลึงของ title กับข่าวที่มีอยู่ (ใช้ normalized title ที่ cache ไว้)
+        ค่าจริงเมื่อเกิน threshold มิฉะนั้นเป็นค่าที่ไม่เกิน threshold (ดู similar_at_least)
+        """
+        return similar_at_least(analysis.normalized_title, analyze_item(existing).normalized_title, threshold)
     
     def is_duplicate_content(self, item: dict) -> Tuple[bool, Optional[str]]:
         """ตรวจสอบว่าเนื้อหาข่าวซ้ำหรือไม่"""
@@ -198,29 +187,28 @@ class EnhancedDeduplication:
         # ← เพิ่ม Check 0.5: Event Signature (ตรวจสอบก่อนอื่นหมด)
         event_sig = self.create_event_signature(item)
         if event_sig:
-            # ตรวจสอบว่ามี event นี้อยู่แล้วหรือไม่
-            if event_sig in self.event_signatures:
-                existing_items = self.event_signatures[event_sig]
-                
-                # ถ้ามีข่าวที่พูดถึง event เดียวกันแล้ว
-                for existing in existing_items:
-                    time_diff = abs((item.get('published_dt') - existing.get('published_dt')).total_seconds() / 3600)
-                    
-                    # ถ้าเผยแพร่ห่างกันไม่เกิน 24 ชั่วโมง = เหตุการณ์เดียวกัน
-                    if time_diff <= 24:
-                        return True, f"เป็นข่าวเหตุการณ์เดียวกันกับ '{existing.get('title', '')[:40]}...'"
-            else:
-                # สร้าง list ใหม่สำหรับ event นี้
-                self.event_signatures[event_sig] = []
+            # ข่าวที่พูดถึง event เดียวกันและเผยแพร่ห่างกันไม่เกิน 24 ชั่วโมง
+            # (ข่าวที่ไม่มีเวลาเผยแพร่ถือว่าตรงกับทุกข่าวของ event นั้น)
+            existing = self.event_index.find(event_sig, item.get('published_dt')) or \
+                self.run_events.find(event_sig, item.get('published_dt'))
+            if existing:
+                return True, f"เป็นข่าวเหตุการณ์เดียวกันกับ '{existing.title[:40]}...'"
         
         # Check 1: Title เหมือนกันทุกตัวอักษร
+        # (เทียบเฉพาะข่าวที่ title ตรงกัน หรืออาจคล้ายกันเกิน 95% ตามลำดับเดิม)
+        analysis = analyze_item(item)
         title = item.get('title', '')
-        for existing in self.processed_items:
+        self._index_new_items()
+        candidates = set(self._title_index.get(title, ()))
+        candidates.update(self._similarity_index.candidates(analysis.normalized_title, 0.95))
+        metrics.incr("dedup_candidates_total", len(candidates), check="title")
+        for index in sorted(candidates):
+            existing = self.processed_items[index]
             existing_title = existing.get('title', '')
             if title == existing_title:
                 return True, "Title เหมือนกันทุกตัวอักษร"
             
-            similarity = self.calculate_similarity(title, existing_title)
+            similarity = self._title_similarity(analysis, existing, 0.95)
             if similarity > 0.95:
                 return True, f"Title เหมือนกันเกือบทุกคำ ({similarity:.1%})"
         
@@ -230,31 +218,35 @@ class EnhancedDeduplication:
             return True, "Fingerprint ซ้ำ (เนื้อหาเดียวกัน)"
         self.seen_fingerprints.add(fingerprint)
         
-        # Check 3: Title คล้ายกันมาก
-        for cached_norm_title, cached_orig_title in self.title_cache:
-            similarity = self.calculate_similarity(title, cached_norm_title)
+        # Check 3: Title คล้ายกันมาก (เฉพาะ title ที่อาจคล้ายกันเกิน 80%)
+        similar_titles = self._cache_similarity_index.candidates(analysis.normalized_title, 0.80)
+        metrics.incr("dedup_candidates_total", len(similar_titles), check="similar_title")
+        for position in similar_titles:
+            cached_norm_title, cached_orig_title = self.title_cache[position]
+            # normalize_text ซ้ำได้ค่าเดิม จึงเทียบกับ title ที่ normalize แล้วได้โดยตรง
+            similarity = similar_at_least(analysis.normalized_title, cached_norm_title, 0.80)
             
             if similarity > 0.90:
                 return True, f"Title เหมือนกันเกือบทุกคำ ({similarity:.1%})"
             
             if similarity > 0.80:
-                for existing in self.processed_items:
-                    if existing.get('title') == cached_orig_title:
-                        if existing.get('country') != item.get('country'):
-                            continue
-                        return True, f"Title คล้ายกันมาก + ประเทศเดียวกัน ({similarity:.1%})"
-        
-        # Check 4: คำสำคัญตรงกันมาก
-        current_keywords = self.extract_keywords(f"{item.get('title', '')} {item.get('summary', '')}")
+                for index in self._title_index.get(cached_orig_title, ()):
+                    if self.processed_items[index].get('country') != item.get('country'):
+                        continue
+                    return True, f"Title คล้ายกันมาก + ประเทศเดียวกัน ({similarity:.1%})"
+        
+        # Check 4: คำสำคัญตรงกันมาก (เฉพาะข่าวที่มีคำสำคัญร่วมกันมากพอ จาก inverted index)
+        current_keywords = self.extract_keywords(analysis)
         if len(current_keywords) >= 3:
-            for existing in self.processed_items:
-                existing_keywords = self.extract_keywords(
-                    f"{existing.get('title', '')} {existing.get('summary', '')}"
-                )
+            candidates = self._candidates(self._keyword_index, current_keywords, len(current_keywords) * 0.85)
+            metrics.incr("dedup_candidates_total", len(candidates), check="keywords")
+            for index in candidates:
+                existing = self.processed_items[index]
+                existing_keywords = self.extract_keywords(analyze_item(existing))
                 
                 common_keywords = current_keywords & existing_keywords
                 if len(common_keywords) >= len(current_keywords) * 0.85:
-                    title_sim = self.calculate_similarity(item.get('title', ''), existing.get('title', ''))
+                    title_sim = self._title_similarity(analysis, existing, 0.70)
                     if title_sim > 0.70:
                         pub_dt1 = item.get('published_dt')
                         pub_dt2 = existing.get('published_dt')
@@ -264,26 +256,64 @@ class EnhancedDeduplication:
                                 return True, f"คำสำคัญตรงกัน {len(common_keywords)} คำ + title คล้ายกัน + เวลาใกล้กัน"
         
         # Check 5: คำเฉพาะเจาะจงซ้ำ
-        specific_terms = self._extract_specific_terms(title)
+        specific_terms = self._item_specific_terms(analysis)
         if len(specific_terms) >= 2:
-            for existing in self.processed_items:
-                existing_terms = self._extract_specific_terms(existing.get('title', ''))
+            candidates = self._candidates(self._term_index, specific_terms, 2)
+            metrics.incr("dedup_candidates_total", len(candidates), check="specific_terms")
+            for index in candidates:
+                existing = self.processed_items[index]
+                existing_terms = self._item_specific_terms(analyze_item(existing))
                 common_terms = specific_terms & existing_terms
                 if len(common_terms) >= 2:
-                    title_sim = self.calculate_similarity(title, existing.get('title', ''))
+                    title_sim = self._title_similarity(analysis, existing, 0.75)
                     if title_sim > 0.75:
                         return True, f"พบคำเฉพาะเจาะจงซ้ำ: {', '.join(common_terms)}"
         
         # ← เพิ่มข่าวเข้า event signature (ถ้ามี)
         if event_sig:
-            self.event_signatures[event_sig].append(item)
+            self.run_events.add(event_sig, item.get('published_dt'), item.get('title', ''))
         
         # เพิ่มข้อมูลลง cache
-        norm_title = self.normalize_text(title)
-        self.title_cache.append((norm_title, title))
+        self._cache_similarity_index.add(analysis.normalized_title)
+        self.title_cache.append((analysis.normalized_title, title))
         
         return False, None
     
+    def save_event_index(self, sent_items: Iterable[dict]):
+        """เพิ่ม event signature ของข่าวที่ส่งแล้วเข้า event index แล้วบันทึก (เมื่อตั้ง EVENT_INDEX_FILE)"""
+        if not settings.EVENT_INDEX_FILE:
+            return
+        for item in sent_items:
+            event_sig = self.create_event_signature(item)
+            if event_sig:
+                self.event_index.add(event_sig, item.get('published_dt'), item.get('title', ''))
+        self.event_index.evict()
+        self.event_index.save(settings.EVENT_INDEX_FILE)
+    
+    def _index_new_items(self):
+        """เพิ่มข่าวใน processed_items ที่ยังไม่อยู่ใน inverted indexes"""
+        while self._indexed_count < len(self.processed_items):
+            index = self._indexed_count
+            analysis = analyze_item(self.processed_items[index])
+            for keyword in self.extract_keywords(analysis):
+                self._keyword_index[keyword].append(index)
+            for term in self._item_specific_terms(analysis):
+                self._term_index[term].append(index)
+            self._title_index[self.processed_items[index].get('title', '')].append(index)
+            self._similarity_index.add(analysis.normalized_title)
+            self._indexed_count += 1
+    
+    @staticmethod
+    def _candidates(index: Dict[str, List[int]], terms: Iterable[str], min_common: float) -> List[int]:
+        """
+        ลำดับของข่าวที่มีคำใน terms ร่วมกันอย่างน้อย min_common คำ
+        (เรียงตามลำดับที่เพิ่มเข้ามา เหมือนการวนใน processed_items)
+        """
+        counts = Counter()
+        for term in terms:
+            counts.update(index.get(term, ()))
+        return sorted(i for i, count in counts.items() if count >= min_common)
+    
     def is_duplicate_url(self, url: str) -> bool:
         """ตรวจสอบ URL ซ้ำ"""
         normalized = normalize_url(url)
@@ -292,7 +322,25 @@ class EnhancedDeduplication:
         self.seen_urls.add(normalized)
         return False
     
-    def _extract_specific_terms(self, text: str) -> Set[str]:
+    @classmethod
+    def prepare_analysis(cls, analysis: AnalyzedText) -> AnalyzedText:
+        """
+        คำนวณค่าที่ dedup ใช้ไว้ล่วงหน้า (normalized title, คำสำคัญ, entities, คำเฉพาะเจาะจง)
+        ไม่ขึ้นกับข่าวอื่น จึงทำใน worker process ได้ แล้วส่งผลกลับมาพร้อม AnalyzedText
+        """
+        analysis.normalized_title
+        analysis.hits("grouping", cls.GROUPING_KEYWORDS)
+        analysis.hits("entities", cls.ENTITY_KEYWORDS)
+        cls._item_specific_terms(analysis)
+        return analysis
+    
+    @classmethod
+    def _item_specific_terms(cls, analysis: AnalyzedText) -> Set[str]:
+        """คำเฉพาะเจาะจงของ title (cache ไว้กับผลวิเคราะห์ของข่าว)"""
+        return analysis.memo("specific_terms", lambda a: cls._extract_specific_terms(a.title))
+    
+    @staticmethod
+    def _extract_specific_terms(text: str) -> Set[str]:
         """ดึงคำเฉพาะเจาะจง"""
         text_lower = text.lower()
         specific_terms = set()
@@ -324,12 +372,15 @@ class EnhancedDeduplication:
     
     def add_item(self, item: dict) -> bool:
         """เพิ่มข่าวเข้าระบบ (ถ้าไม่ซ้ำ)"""
-        is_dup, reason = self.is_duplicate_content(item)
+        with metrics.span("dedup_check"):
+            is_dup, reason = self.is_duplicate_content(item)
+        metrics.incr("dedup_items_total", result="duplicate" if is_dup else "unique")
         
         if is_dup:
-            if DEBUG_FILTERING:
+            if settings.DEBUG_FILTERING:
                 print(f"  ✗ ข่าวซ้ำ: {reason}")
             return False
         
         self.processed_items.append(item)
+        self._index_new_items()
         return True
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Event Signature Index
+ดัชนี event signature แยกตามชั่วโมงที่เผยแพร่ สำหรับหา "เหตุการณ์เดียวกันภายใน 24 ชั่วโมง"
+
+key คือ (signature, ชั่วโมง) จึงค้นหาเฉพาะช่วง ±24 ชั่วโมง แทนการวนทุกข่าวของ signature นั้น
+ชั่วโมงที่เก่ากว่า retention จะถูกลบ และบันทึกลงไฟล์เพื่อใช้ข้ามรอบการทำงานได้
+"""
+
+import os
+import json
+import math
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+INDEX_VERSION = 1
+
+
+class EventEntry(NamedTuple):
+    """ข่าวหนึ่งข่าวใน index (seq = ลำดับที่เพิ่ม)"""
+    seq: int
+    signature: str
+    published_dt: Optional[datetime]
+    title: str
+    added_at: datetime
+
+
+def _hour_bucket(dt: datetime) -> int:
+    return math.floor(dt.timestamp() / 3600)
+
+
+class EventSignatureIndex:
+    """
+    ดัชนี (signature, hour bucket) -> ข่าว
+
+    - ข่าวที่มีเวลาเผยแพร่: ตรงกันเมื่อห่างกันไม่เกิน match_hours (เทียบเวลาจริงอีกครั้ง)
+    - ข่าวที่ไม่มีเวลาเผยแพร่: ถือว่าตรงกับทุกข่าวที่มี signature เดียวกัน
+    - ถ้าตรงหลายข่าว จะคืนข่าวที่เพิ่มเข้ามาก่อน
+    """
+
+    def __init__(self, match_hours: int = 24, retention_hours: Optional[int] = None):
+        """
+        Args:
+            match_hours: ระยะห่างสูงสุดของเวลาเผยแพร่ที่ถือเป็นเหตุการณ์เดียวกัน
+            retention_hours: เก็บข่าวย้อนหลังกี่ชั่วโมง (None = ไม่ลบ)
+        """
+        self.match_hours = match_hours
+        self.retention_hours = retention_hours
+        self._dated: Dict[Tuple[str, int], List[EventEntry]] = defaultdict(list)
+        self._undated: Dict[str, List[EventEntry]] = defaultdict(list)
+        self._signature_buckets: Dict[str, Set[int]] = defaultdict(set)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._dated.values()) + \
+            sum(len(entries) for entries in self._undated.values())
+
+    def __contains__(self, signature: str) -> bool:
+        return bool(self._signature_buckets.get(signature) or self._undated.get(signature))
+
+    def find(self, signature: str, published_dt: Optional[datetime]) -> Optional[EventEntry]:
+        """ข่าวที่เป็นเหตุการณ์เดียวกัน (signature เดียวกันและเวลาใกล้กัน) หรือ None"""
+        if signature not in self:
+            return None
+
+        matches = list(self._undated.get(signature, ()))
+        if published_dt is None:
+            for bucket in self._signature_buckets.get(signature, ()):
+                matches.extend(self._dated[(signature, bucket)])
+        else:
+            bucket = _hour_bucket(published_dt)
+            for candidate in range(bucket - self.match_hours, bucket + self.match_hours + 1):
+                for entry in self._dated.get((signature, candidate), ()):
+                    time_diff = abs((published_dt - entry.published_dt).total_seconds() / 3600)
+                    if time_diff <= self.match_hours:
+                        matches.append(entry)
+
+        return min(matches, key=lambda entry: entry.seq) if matches else None
+
+    def add(self, signature: str, published_dt: Optional[datetime], title: str = "",
+            added_at: Optional[datetime] = None) -> EventEntry:
+        """เพิ่มข่าวเข้า index"""
+        entry = EventEntry(self._seq, signature, published_dt, title,
+                           added_at or datetime.now(timezone.utc))
+        self._seq += 1
+        if published_dt is None:
+            self._undated[signature].append(entry)
+        else:
+            bucket = _hour_bucket(published_dt)
+            self._dated[(signature, bucket)].append(entry)
+            self._signature_buckets[signature].add(bucket)
+        return entry
+
+    def evict(self, now: Optional[datetime] = None) -> int:
+        """ลบข่าวที่เก่ากว่า retention_hours (ข่าวไม่มีเวลาใช้เวลาที่เพิ่มแทน) คืนจำนวนที่ลบ"""
+        if self.retention_hours is None:
+            return 0
+        now = now or datetime.now(timezone.utc)
+        cutoff = now.timestamp() - self.retention_hours * 3600
+        cutoff_bucket = math.floor(cutoff / 3600)
+        removed = 0
+
+        for key in [key for key in self._dated if key[1] < cutoff_bucket]:
+            removed += len(self._dated.pop(key))
+            buckets = self._signature_buckets[key[0]]
+            buckets.discard(key[1])
+            if not buckets:
+                del self._signature_buckets[key[0]]
+
+        for signature in list(self._undated):
+            kept = [entry for entry in self._undated[signature] if entry.added_at.timestamp() >= cutoff]
+            removed += len(self._undated[signature]) - len(kept)
+            if kept:
+                self._undated[signature] = kept
+            else:
+                del self._undated[signature]
+
+        return removed
+
+    def entries(self) -> List[EventEntry]:
+        """ข่าวทั้งหมดตามลำดับที่เพิ่ม"""
+        all_entries = [entry for entries in self._dated.values() for entry in entries]
+        all_entries.extend(entry for entries in self._undated.values() for entry in entries)
+        return sorted(all_entries, key=lambda entry: entry.seq)
+
+    def save(self, path: str):
+        """บันทึก index ลงไฟล์ JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "entries": [
+                {
+                    "signature": entry.signature,
+                    "published": entry.published_dt.isoformat() if entry.published_dt else None,
+                    "title": entry.title,
+                    "added_at": entry.added_at.isoformat(),
+                }
+                for entry in self.entries()
+            ],
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> int:
+        """โหลด index จากไฟล์ (ไฟล์ไม่มี/รูปแบบไม่ตรง = ข้าม) คืนจำนวนข่าวที่โหลด"""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[DEDUP] อ่าน event index ไม่สำเร็จ: {str(e)}")
+            return 0
+        if data.get("version") != INDEX_VERSION:
+            return 0
+
+        for record in data.get("entries", []):
+            published = record.get("published")
+            self.add(
+                record["signature"],
+                datetime.fromisoformat(published) if published else None,
+                record.get("title", ""),
+                datetime.fromisoformat(record["added_at"]),
+            )
+        return len(data.get("entries", []))
@@ -2,8 +2,22 @@
 """
 Keyword Filter
 กรองข่าวตามคำสำคัญ
+
+คำสำคัญตรวจแบบคำเต็มตามภาษาของข้อความ (AnalyzedText.term_hits):
+คำอังกฤษต้องตรงทั้งคำ ('car' ไม่ตรงกับ 'carbon') และคำไทยไม่นับในคำที่ไม่เกี่ยวข้อง ('รถ' ใน 'สามารถ')
 """
 
+import json
+import hashlib
+
+from filters.text_analysis import AnalyzedText
+from utils.lang_utils import THAI_FALSE_POSITIVES
+
+# ข้อมูลกฎระดับ module ที่มีผลต่อผลการกรอง (รวมใน rules_version)
+MODULE_RULES = {
+    "lang_utils.THAI_FALSE_POSITIVES": THAI_FALSE_POSITIVES,
+}
+
 class KeywordFilter:
     """กรองข่าวตามคำสำคัญพลังงาน"""
     
@@ -64,21 +78,77 @@ class KeywordFilter:
         'car', 'automotive', 'vehicle', 'automobile'
     ]
     
+    PRIMARY_COUNTRIES = {
+        "Thailand": ['ไทย', 'ประเทศไทย', 'thailand', 'bangkok', 'กรุงเทพ'],
+        "Myanmar": ['เมียนมา', 'myanmar', 'ย่างกุ้ง', 'yangon', 'burma'],
+        "Malaysia": ['มาเลเซีย', 'malaysia', 'กัวลาลัมเปอร์', 'kuala lumpur'],
+        "Vietnam": ['เวียดนาม', 'vietnam', 'ฮานอย', 'hanoi', 'ญวน'],
+        "Indonesia": ['อินโดนีเซีย', 'indonesia', 'จาการ์ตา', 'jakarta'],
+        "Kazakhstan": ['คาซัคสถาน', 'kazakhstan', 'astana', 'kazakh'],
+        "Oman": ['โอมาน', 'oman', 'muscat'],
+        "UAE": ['ยูเออี', 'uae', 'ดูไบ', 'dubai', 'อาบูดาบี', 'abu dhabi', 'emirates']
+    }
+    
+    INTERNATIONAL_KEYWORDS = [
+        'opec', 'โอเปก', 'iea', 'global oil', 'world energy', 'crude oil',
+        'brent', 'wti', 'oil market', 'gas market', 'energy market',
+        'ตลาดน้ำมันโลก', 'ตลาดพลังงานโลก', 'น้ำมันโลก',
+        'saudi', 'russia', 'united states', 'สหรัฐ', 'รัสเซีย', 'ซาอุดีอาระเบีย',
+        'iran', 'iraq', 'venezuela', 'อิหร่าน', 'อิรัก', 'เวเนซุเอลา',
+        'europe', 'european union', 'china', 'japan', 'korea',
+        'ยุโรป', 'จีน', 'ญี่ปุ่น', 'เกาหลี', 'อียู'
+    ]
+    
+    # ชื่อประเทศเป้าหมาย (คำพลังงาน + ชื่อประเทศ = ผ่าน)
+    COUNTRY_NAME_KEYWORDS = [
+        'thailand', 'vietnam', 'malaysia', 'indonesia', 'myanmar',
+        'oman', 'uae', 'kazakhstan', 'ไทย', 'เวียดนาม', 'มาเลเซีย',
+        'อินโดนีเซีย', 'เมียนมา', 'โอมาน', 'ยูเออี', 'คาซัคสถาน'
+    ]
+    
+    # คำบ่งบอกข่าวสำคัญ (คำพลังงาน + คำเหล่านี้ = ผ่าน)
+    IMPORTANCE_KEYWORDS = [
+        'สำคัญ', 'ใหญ่', 'หลัก', 'โลก', 'global',
+        'major', 'significant', 'important', 'key'
+    ]
+    
+    # เพิ่มเลขนี้เมื่อเปลี่ยนเงื่อนไขการกรอง (นอกเหนือจากรายการคำ) เพื่อล้าง verdict cache
+    RULES_REVISION = 2
+    
+    @classmethod
+    def rules_version(cls) -> str:
+        """
+        hash ของรายการคำสำคัญทั้งหมด + RULES_REVISION + MODULE_RULES (เปลี่ยนเมื่อกฎการกรองเปลี่ยน)
+        """
+        rules = {
+            name: sorted(value) if isinstance(value, (set, frozenset)) else value
+            for name, value in sorted(vars(cls).items())
+            if name.isupper() and isinstance(value, (list, tuple, set, frozenset, dict, int))
+        }
+        rules.update(MODULE_RULES)
+        payload = json.dumps(rules, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+    
     @classmethod
-    def check_valid_energy_news(cls, text: str) -> tuple:
-        """ตรวจสอบว่าเป็นข่าวพลังงานที่เกี่ยวข้องกับธุรกิจหรือไม่"""
-        text_lower = text.lower()
+    def check_valid_energy_news(cls, text) -> tuple:
+        """
+        ตรวจสอบว่าเป็นข่าวพลังงานที่เกี่ยวข้องกับธุรกิจหรือไม่
+        
+        Args:
+            text: ข้อความ หรือ AnalyzedText ของข่าว (ใช้ผลวิเคราะห์ที่ cache ไว้)
+        """
+        analysis = AnalyzedText.of(text)
         reasons = []
         
         # เช็คคำต้องห้ามก่อน
-        for exclude in cls.EXCLUDE_KEYWORDS:
-            if exclude.lower() in text_lower:
-                reasons.append(f"มีคำต้องห้าม: '{exclude}'")
-                return False, "ข่าวสังคม", reasons
+        excluded = analysis.term_hits("exclude", cls.EXCLUDE_KEYWORDS)
+        if excluded:
+            reasons.append(f"มีคำต้องห้าม: '{excluded[0]}'")
+            return False, "ข่าวสังคม", reasons
         
-        found_energy_keywords = [kw for kw in cls.ENERGY_KEYWORDS if kw.lower() in text_lower]
-        found_market_keywords = [kw for kw in cls.ENERGY_MARKET_KEYWORDS if kw.lower() in text_lower]
-        found_business_keywords = [kw for kw in cls.BUSINESS_KEYWORDS if kw.lower() in text_lower]
+        found_energy_keywords = analysis.term_hits("energy", cls.ENERGY_KEYWORDS)
+        found_market_keywords = analysis.term_hits("energy_market", cls.ENERGY_MARKET_KEYWORDS)
+        found_business_keywords = analysis.term_hits("business", cls.BUSINESS_KEYWORDS)
         
         # ถ้าไม่มีคำพลังงานเลย
         if not found_energy_keywords and not found_market_keywords:
@@ -101,20 +171,15 @@ class KeywordFilter:
             reasons.append("มีคำพลังงาน + คำธุรกิจ")
             return True, "ผ่าน", reasons
         
-        country_keywords = ['thailand', 'vietnam', 'malaysia', 'indonesia', 'myanmar', 
-                           'oman', 'uae', 'kazakhstan', 'ไทย', 'เวียดนาม', 'มาเลเซีย', 
-                           'อินโดนีเซีย', 'เมียนมา', 'โอมาน', 'ยูเออี', 'คาซัคสถาน']
-        if found_energy_keywords and any(country in text_lower for country in country_keywords):
+        if found_energy_keywords and analysis.term_hits("country_names", cls.COUNTRY_NAME_KEYWORDS):
             reasons.append("มีคำพลังงาน + ชื่อประเทศ")
             return True, "ผ่าน", reasons
         
-        if found_energy_keywords and any(word in text_lower for word in 
-                                         ['สำคัญ', 'ใหญ่', 'หลัก', 'โลก', 'global', 
-                                          'major', 'significant', 'important', 'key']):
+        if found_energy_keywords and analysis.term_hits("importance", cls.IMPORTANCE_KEYWORDS):
             reasons.append("เป็นข่าวพลังงานสำคัญ")
             return True, "ผ่าน", reasons
         
-        if found_energy_keywords and len(text) > 100:
+        if found_energy_keywords and len(analysis.text) > 100:
             reasons.append("มีคำพลังงาน + ข่าวยาวพอสมควร")
             return True, "ผ่าน", reasons
         
@@ -122,36 +187,15 @@ class KeywordFilter:
         return False, "ไม่ใช่ข่าวธุรกิจ", reasons
     
     @classmethod
-    def detect_country(cls, text: str) -> str:
-        """ตรวจสอบประเทศจากข้อความ"""
-        text_lower = text.lower()
-        
-        primary_countries = {
-            "Thailand": ['ไทย', 'ประเทศไทย', 'thailand', 'bangkok', 'กรุงเทพ'],
-            "Myanmar": ['เมียนมา', 'myanmar', 'ย่างกุ้ง', 'yangon', 'burma'],
-            "Malaysia": ['มาเลเซีย', 'malaysia', 'กัวลาลัมเปอร์', 'kuala lumpur'],
-            "Vietnam": ['เวียดนาม', 'vietnam', 'ฮานอย', 'hanoi', 'ญวน'],
-            "Indonesia": ['อินโดนีเซีย', 'indonesia', 'จาการ์ตา', 'jakarta'],
-            "Kazakhstan": ['คาซัคสถาน', 'kazakhstan', 'astana', 'kazakh'],
-            "Oman": ['โอมาน', 'oman', 'muscat'],
-            "UAE": ['ยูเออี', 'uae', 'ดูไบ', 'dubai', 'อาบูดาบี', 'abu dhabi', 'emirates']
-        }
+    def detect_country(cls, text) -> str:
+        """ตรวจสอบประเทศจากข้อความ (รับ str หรือ AnalyzedText)"""
+        analysis = AnalyzedText.of(text)
         
-        for country, patterns in primary_countries.items():
-            if any(pattern in text_lower for pattern in patterns):
+        for country, patterns in cls.PRIMARY_COUNTRIES.items():
+            if analysis.term_hits(f"country:{country}", patterns):
                 return country
         
-        international_keywords = [
-            'opec', 'โอเปก', 'iea', 'global oil', 'world energy', 'crude oil',
-            'brent', 'wti', 'oil market', 'gas market', 'energy market',
-            'ตลาดน้ำมันโลก', 'ตลาดพลังงานโลก', 'น้ำมันโลก',
-            'saudi', 'russia', 'united states', 'สหรัฐ', 'รัสเซีย', 'ซาอุดีอาระเบีย',
-            'iran', 'iraq', 'venezuela', 'อิหร่าน', 'อิรัก', 'เวเนซุเอลา',
-            'europe', 'european union', 'china', 'japan', 'korea',
-            'ยุโรป', 'จีน', 'ญี่ปุ่น', 'เกาหลี', 'อียู'
-        ]
-        
-        if any(keyword in text_lower for keyword in international_keywords):
+        if analysis.term_hits("international", cls.INTERNATIONAL_KEYWORDS):
             return "International"
         
         return ""
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+Keyword Trends
+นับความถี่ของคำสำคัญในข่าวตามช่วงเวลา เพื่อหาหัวข้อพลังงานที่ถูกพูดถึงมากผิดปกติ
+
+- ช่วงเวลาแบ่งเป็น bucket ละ TREND_BUCKET_HOURS ชั่วโมง (ตามเวลาเผยแพร่ของข่าว)
+- แต่ละ bucket มี count-min sketch (ขนาดคงที่) สำหรับประมาณจำนวนข่าวของคำใดๆ
+  และ heavy hitters (Space-Saving) เก็บคำที่พบบ่อยที่สุดไว้เป็นตัวเลือก
+- คำที่ "มาแรง" = จำนวนข่าวในช่วงล่าสุด (WINDOW_HOURS) สูงกว่าค่าเฉลี่ยของช่วงก่อนหน้า
+  TREND_BASELINE_WINDOWS ช่วง อย่างน้อย TREND_SPIKE_RATIO เท่า
+
+บันทึกลงไฟล์ (TREND_FILE) เพื่อใช้ข้ามรอบ ข่าวแต่ละข่าวนับครั้งเดียว:
+รอบถัดไปนับเฉพาะข่าวที่เผยแพร่หลังข่าวล่าสุดที่เคยนับแล้ว (ข่าวที่ไม่มีเวลาเผยแพร่ไม่นับ)
+"""
+
+import os
+import sys
+import json
+import math
+import zlib
+import base64
+import hashlib
+from array import array
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from config.settings import settings
+from filters.deduplication import EnhancedDeduplication
+from filters.keyword_filter import KeywordFilter
+from filters.text_analysis import AnalyzedText
+
+TRENDS_VERSION = 1
+
+# ขนาดของ count-min sketch ต่อ bucket (ค่าเกินจริงไม่เกิน ~ e/WIDTH ของจำนวนทั้งหมด ด้วยความน่าจะเป็น 1 - e^-DEPTH)
+CMS_WIDTH = 512
+CMS_DEPTH = 4
+HEAVY_HITTERS_CAPACITY = 32
+
+
+class Trend(NamedTuple):
+    """คำที่มาแรง: จำนวนข่าวในช่วงล่าสุด เทียบกับค่าเฉลี่ยของช่วงก่อนหน้า"""
+    keyword: str
+    count: int
+    baseline: float
+    ratio: float
+
+
+@lru_cache(maxsize=4096)
+def _hash_pair(key: str) -> Tuple[int, int]:
+    """hash 2 ค่าของ key (ค่าเดิมทุกครั้งที่รัน ไม่ขึ้นกับ PYTHONHASHSEED)"""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest[:4], "little"), int.from_bytes(digest[4:], "little") | 1
+
+
+def _encode_counts(counts: array) -> str:
+    if sys.byteorder == "big":
+        counts = array(counts.typecode, counts)
+        counts.byteswap()
+    return base64.b64encode(zlib.compress(counts.tobytes())).decode("ascii")
+
+
+def _decode_counts(data: str) -> array:
+    counts = array("I")
+    counts.frombytes(zlib.decompress(base64.b64decode(data)))
+    if sys.byteorder == "big":
+        counts.byteswap()
+    return counts
+
+
+class CountMinSketch:
+    """ตารางนับขนาด depth x width (ประมาณจำนวนได้ไม่ต่ำกว่าจริง)"""
+
+    def __init__(self, width: int = CMS_WIDTH, depth: int = CMS_DEPTH, counts: Optional[array] = None):
+        self.width = width
+        self.depth = depth
+        self.counts = counts if counts is not None else array("I", bytes(4 * width * depth))
+
+    def _cells(self, key: str) -> List[int]:
+        h1, h2 = _hash_pair(key)
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1):
+        for cell in self._cells(key):
+            self.counts[cell] += count
+
+    def estimate(self, key: str) -> int:
+        return min(self.counts[cell] for cell in self._cells(key))
+
+    def to_dict(self) -> dict:
+        return {"width": self.width, "depth": self.depth, "counts": _encode_counts(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CountMinSketch":
+        counts = _decode_counts(data["counts"])
+        if len(counts) != data["width"] * data["depth"]:
+            raise ValueError("count-min sketch size mismatch")
+        return cls(data["width"], data["depth"], counts)
+
+
+class HeavyHitters:
+    """คำที่พบบ่อยที่สุดไม่เกิน capacity คำ (Space-Saving: count อาจเกินจริงไม่เกิน error)"""
+
+    def __init__(self, capacity: int = HEAVY_HITTERS_CAPACITY):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, key: str, count: int = 1):
+        if key in self.counts:
+            self.counts[key] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = count
+            self.errors[key] = 0
+        else:
+            # แทนที่คำที่นับได้น้อยที่สุด (ค่าของคำเดิมกลายเป็นขอบของความคลาดเคลื่อน)
+            victim = min(self.counts, key=self.counts.__getitem__)
+            floor = self.counts.pop(victim)
+            del self.errors[victim]
+            self.counts[key] = floor + count
+            self.errors[key] = floor
+
+    def __iter__(self):
+        return iter(self.counts)
+
+    def to_dict(self) -> dict:
+        return {key: [count, self.errors[key]] for key, count in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict, capacity: int = HEAVY_HITTERS_CAPACITY) -> "HeavyHitters":
+        hitters = cls(capacity)
+        for key, (count, error) in data.items():
+            hitters.counts[key] = count
+            hitters.errors[key] = error
+        return hitters
+
+
+# (ชื่อกลุ่มใน AnalyzedText, รายการคำ, ตรวจแบบคำเต็ม) ที่ KeywordFilter / EnhancedDeduplication คำนวณไว้แล้ว
+TREND_KEYWORD_GROUPS = (
+    ("energy", KeywordFilter.ENERGY_KEYWORDS, True),
+    ("energy_market", KeywordFilter.ENERGY_MARKET_KEYWORDS, True),
+    ("grouping", EnhancedDeduplication.GROUPING_KEYWORDS, False),
+)
+
+
+def trend_keywords(analysis: AnalyzedText) -> Set[str]:
+    """คำสำคัญของข่าว (lowercase) ที่ใช้นับ trend"""
+    keywords = set()
+    for name, group, whole_terms in TREND_KEYWORD_GROUPS:
+        hits = analysis.term_hits(name, group) if whole_terms else analysis.hits(name, group)
+        keywords.update(keyword.lower() for keyword in hits)
+    return keywords
+
+
+@lru_cache(maxsize=1)
+def _display_names() -> Dict[str, str]:
+    """lowercase -> คำตามรายการของ filter (เช่น 'lng' -> 'LNG')"""
+    names = {}
+    for _, group, _ in reversed(TREND_KEYWORD_GROUPS):
+        names.update((keyword.lower(), keyword) for keyword in group)
+    return names
+
+
+def display_keyword(keyword: str) -> str:
+    return _display_names().get(keyword, keyword)
+
+
+class KeywordTrends:
+    """จำนวนข่าวต่อคำสำคัญแยกตาม bucket เวลา (เก็บไม่เกิน (baseline_windows + 1) ช่วง)"""
+
+    def __init__(self, bucket_hours: float = 6, window_hours: float = 24, baseline_windows: int = 7):
+        self.bucket_hours = bucket_hours
+        self.window_buckets = max(math.ceil(window_hours / bucket_hours), 1)
+        self.baseline_windows = baseline_windows
+        self._buckets: Dict[int, Tuple[CountMinSketch, HeavyHitters]] = {}
+        self.first_bucket: Optional[int] = None
+        # เวลาเผยแพร่ของข่าวล่าสุดที่นับแล้ว (รอบก่อนหน้า / รอบนี้)
+        self.counted_until: Optional[datetime] = None
+        self.latest: Optional[datetime] = None
+
+    @classmethod
+    def from_settings(cls) -> Optional["KeywordTrends"]:
+        """สร้างจาก TREND_* settings และโหลด TREND_FILE (None ถ้าไม่ได้ตั้ง TREND_FILE)"""
+        if not settings.TREND_FILE:
+            return None
+        trends = cls(settings.TREND_BUCKET_HOURS, settings.WINDOW_HOURS, settings.TREND_BASELINE_WINDOWS)
+        trends.load(settings.TREND_FILE)
+        return trends
+
+    def _bucket(self, dt: datetime) -> int:
+        return math.floor(dt.timestamp() / (self.bucket_hours * 3600))
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def observe(self, keywords: Iterable[str], published_dt: Optional[datetime]) -> bool:
+        """นับคำสำคัญของข่าวหนึ่งข่าว (False = ไม่นับ: ไม่มีเวลาเผยแพร่ หรือเคยนับแล้วในรอบก่อน)"""
+        if published_dt is None or (self.counted_until is not None and published_dt <= self.counted_until):
+            return False
+        bucket = self._bucket(published_dt)
+        if bucket not in self._buckets:
+            self._buckets[bucket] = (CountMinSketch(), HeavyHitters())
+        sketch, hitters = self._buckets[bucket]
+        for keyword in keywords:
+            sketch.add(keyword)
+            hitters.add(keyword)
+        if self.first_bucket is None or bucket < self.first_bucket:
+            self.first_bucket = bucket
+        if self.latest is None or published_dt > self.latest:
+            self.latest = published_dt
+        return True
+
+    def count(self, keyword: str, buckets: Iterable[int]) -> int:
+        """จำนวนข่าว (ประมาณ) ของคำใน buckets"""
+        return sum(self._buckets[b][0].estimate(keyword) for b in buckets if b in self._buckets)
+
+    def evict(self, now: datetime) -> int:
+        """ลบ bucket ที่เก่ากว่าช่วง baseline คืนจำนวน bucket ที่ลบ"""
+        oldest = self._bucket(now) - (self.baseline_windows + 1) * self.window_buckets + 1
+        expired = [bucket for bucket in self._buckets if bucket < oldest]
+        for bucket in expired:
+            del self._buckets[bucket]
+        return len(expired)
+
+    def spikes(self, now: datetime, ratio: float = 2.0, min_count: int = 3, limit: int = 5) -> List[Trend]:
+        """
+        คำที่จำนวนข่าวในช่วงล่าสุดสูงกว่าค่าเฉลี่ยของช่วงก่อนหน้าอย่างน้อย ratio เท่า
+        (ใช้เฉพาะช่วงก่อนหน้าที่อยู่หลังข่าวแรกที่นับทั้งช่วง ถ้ายังไม่มีเลยจะไม่มีคำที่มาแรง)
+        """
+        self.evict(now)
+        end = self._bucket(now)
+        current = range(end - self.window_buckets + 1, end + 1)
+        baselines = []
+        for window in range(1, self.baseline_windows + 1):
+            first = end - (window + 1) * self.window_buckets + 1
+            if self.first_bucket is None or first < self.first_bucket:
+                break
+            baselines.append(range(first, first + self.window_buckets))
+        if not baselines:
+            return []
+
+        candidates = set()
+        for bucket in current:
+            if bucket in self._buckets:
+                candidates.update(self._buckets[bucket][1])
+
+        trends = []
+        for keyword in candidates:
+            count = self.count(keyword, current)
+            if count < min_count:
+                continue
+            baseline = sum(self.count(keyword, buckets) for buckets in baselines) / len(baselines)
+            if count >= ratio * max(baseline, 1.0):
+                trends.append(Trend(display_keyword(keyword), count, round(baseline, 2),
+                                    round(count / max(baseline, 1.0), 2)))
+        trends.sort(key=lambda trend: (-trend.ratio, -trend.count, trend.keyword))
+        return trends[:limit]
+
+    def save(self, path: str):
+        """บันทึกลงไฟล์ JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        counted_until = max(filter(None, [self.counted_until, self.latest]), default=None)
+        data = {
+            "version": TRENDS_VERSION,
+            "bucket_hours": self.bucket_hours,
+            "first_bucket": self.first_bucket,
+            "counted_until": counted_until.isoformat() if counted_until else None,
+            "buckets": {
+                str(bucket): {"sketch": sketch.to_dict(), "heavy_hitters": hitters.to_dict()}
+                for bucket, (sketch, hitters) in sorted(self._buckets.items())
+            },
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> int:
+        """โหลดจากไฟล์ (ไฟล์ไม่มี/รูปแบบหรือขนาด bucket ไม่ตรง = เริ่มใหม่) คืนจำนวน bucket ที่โหลด"""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != TRENDS_VERSION or data.get("bucket_hours") != self.bucket_hours:
+                return 0
+            buckets = {
+                int(bucket): (CountMinSketch.from_dict(record["sketch"]),
+                              HeavyHitters.from_dict(record["heavy_hitters"]))
+                for bucket, record in data.get("buckets", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, zlib.error) as e:
+            print(f"[TRENDS] อ่านไฟล์ trend ไม่สำเร็จ: {str(e)}")
+            return 0
+
+        self._buckets = buckets
+        self.first_bucket = data.get("first_bucket")
+        counted_until = data.get("counted_until")
+        self.counted_until = datetime.fromisoformat(counted_until) if counted_until else None
+        return len(buckets)
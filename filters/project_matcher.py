@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Project Name Matcher
+หาชื่อโครงการ (data/projects.py) ที่ข่าวกล่าวถึงจริง ด้วย Aho-Corasick automaton
+อ่านข้อความรอบเดียวต่อข่าว ไม่ว่าจะมีชื่อโครงการกี่ชื่อ
+
+- ไม่สนตัวพิมพ์เล็ก/ใหญ่ และถือว่าช่องว่างหลายตัวเป็นช่องว่างเดียว
+- ชื่อที่ขึ้นต้น/ลงท้ายด้วยตัวอักษร ASCII หรือตัวเลข ต้องไม่ติดกับตัวอักษร ASCII/ตัวเลขอื่น
+  ("S1" ไม่ตรงกับ "S10" หรือ "GPS1", "9A" ไม่ตรงกับ "19A")
+- ชื่อที่ทับกันเลือกตัวที่เริ่มก่อนและยาวที่สุด ("Malaysia SK309" ก่อน "SK309")
+- ชื่ออื่น (PROJECT_ALIASES) นับรวมเป็นโครงการเดียวกัน
+
+automaton ถูกสร้างครั้งเดียวต่อ process และบันทึกเป็น JSON (PROJECT_INDEX_CACHE_FILE)
+key ของ cache คือ hash ของรายชื่อโครงการ จึงสร้างใหม่เองเมื่อแก้ data/projects.py
+"""
+
+import os
+import re
+import json
+import hashlib
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MATCHER_VERSION = 1
+
+_SPACES_RE = re.compile(r'\s+')
+
+
+def _normalize(text: str) -> str:
+    return _SPACES_RE.sub(" ", text.lower())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class ProjectMatcher:
+    """Aho-Corasick automaton ของชื่อโครงการทั้งหมด"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            patterns: (ชื่อที่ใช้ค้นหา, ชื่อโครงการที่แสดง)
+        """
+        seen = set()
+        self.patterns = []
+        for text, project in patterns:
+            text = _normalize(text).strip()
+            if text and text not in seen:
+                seen.add(text)
+                self.patterns.append((text, project, _is_word_char(text[0]), _is_word_char(text[-1])))
+        self.key = self.index_key(self.patterns)
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._out: List[List[int]] = []
+
+    @staticmethod
+    def index_key(patterns: list) -> str:
+        data = json.dumps([MATCHER_VERSION, patterns], ensure_ascii=False)
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def from_projects(cls, projects: Dict[str, List[str]], aliases: Dict[str, str],
+                      cache_file: str = "") -> "ProjectMatcher":
+        """สร้างจากรายชื่อโครงการแยกประเทศ (โหลด automaton จาก cache_file ถ้าตรงกัน)"""
+        matcher = cls(
+            (name, aliases.get(name, name))
+            for names in projects.values()
+            for name in names
+        )
+        if not (cache_file and matcher._load(cache_file)):
+            matcher.build()
+            if cache_file:
+                matcher._save(cache_file)
+        return matcher
+
+    # ===== automaton =====
+
+    def build(self):
+        """สร้าง goto/fail/output ของ automaton"""
+        goto = [{}]
+        out = [[]]
+        for index, (text, _, _, _) in enumerate(self.patterns):
+            state = 0
+            for ch in text:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    out.append([])
+                state = next_state
+            out[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[next_state] = goto[link].get(ch, 0)
+                out[next_state].extend(out[fail[next_state]])
+
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def _load(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[PROJECTS] อ่าน project index ไม่สำเร็จ: {str(e)}")
+            return False
+        if data.get("key") != self.key:
+            return False
+        self._goto, self._fail, self._out = data["goto"], data["fail"], data["out"]
+        return True
+
+    def _save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {"key": self.key, "goto": self._goto, "fail": self._fail, "out": self._out}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    # ===== การค้นหา =====
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """ชื่อโครงการที่พบ (start, end, project) เรียงตามตำแหน่ง ไม่ทับกัน"""
+        if not self._goto:
+            self.build()
+        text = _normalize(text)
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        length = len(text)
+
+        found = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                pattern, project, left, right = patterns[index]
+                start = i - len(pattern) + 1
+                if left and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if right and i + 1 < length and _is_word_char(text[i + 1]):
+                    continue
+                found.append((start, i + 1, project))
+
+        found.sort(key=lambda match: (match[0], match[0] - match[1]))
+        matches = []
+        end = 0
+        for match in found:
+            if match[0] >= end:
+                matches.append(match)
+                end = match[1]
+        return matches
+
+    def match(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """
+        โครงการที่ข้อความกล่าวถึง เรียงตามจำนวนครั้ง (มากก่อน) แล้วตามตำแหน่งที่พบครั้งแรก
+        """
+        counts = {}
+        first = {}
+        for start, _, project in self.find(text):
+            counts[project] = counts.get(project, 0) + 1
+            first.setdefault(project, start)
+        ranked = sorted(counts, key=lambda project: (-counts[project], first[project]))
+        return ranked[:limit] if limit is not None else ranked
+
+
+@lru_cache(maxsize=1)
+def get_project_matcher() -> ProjectMatcher:
+    """ProjectMatcher ของ process (cache ไฟล์จาก PROJECT_INDEX_CACHE_FILE)"""
+    from config.settings import settings
+    from data.projects import PROJECTS_BY_COUNTRY, PROJECT_ALIASES
+    return ProjectMatcher.from_projects(PROJECTS_BY_COUNTRY, PROJECT_ALIASES, settings.PROJECT_INDEX_CACHE_FILE)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Relevance Scoring
+คะแนนความเกี่ยวข้องของข่าวที่ผ่าน filter และการเลือกข่าวคะแนนสูงสุด K ข่าวต่อกลุ่ม
+
+คะแนน = (คำสำคัญ + โครงการที่กล่าวถึง + ระดับของเว็บข่าว) x ค่าลดตามอายุข่าว
+- คำสำคัญ: น้ำหนักตามกลุ่มคำของ KeywordFilter (นับไม่เกิน MAX_HITS_PER_GROUP คำต่อกลุ่ม)
+  และโบนัสเมื่อหัวข้อข่าวมีคำพลังงาน
+- โครงการ: project_hints (ชื่อโครงการที่ข่าวกล่าวถึงจริง)
+- ระดับเว็บข่าว: tier ใน data/publishers.json (เว็บที่ไม่อยู่ในทะเบียนได้ 0)
+- อายุข่าว: ลดลงครึ่งหนึ่งทุก RELEVANCE_HALF_LIFE_HOURS ชั่วโมง
+
+check_valid_energy_news ยังเป็นเงื่อนไขผ่าน/ไม่ผ่านเหมือนเดิม คะแนนใช้จัดลำดับและเลือกข่าวที่จะส่ง
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from data.domain_registry import get_registry
+from filters.keyword_filter import KeywordFilter
+from filters.text_analysis import AnalyzedText
+
+
+class RelevanceScorer:
+    """คะแนนความเกี่ยวข้องของข่าว"""
+
+    # (ชื่อกลุ่มใน AnalyzedText.term_hits, รายการคำ, น้ำหนักต่อคำ)
+    KEYWORD_WEIGHTS = (
+        ("energy", KeywordFilter.ENERGY_KEYWORDS, 3.0),
+        ("energy_market", KeywordFilter.ENERGY_MARKET_KEYWORDS, 1.5),
+        ("business", KeywordFilter.BUSINESS_KEYWORDS, 1.0),
+    )
+    MAX_HITS_PER_GROUP = 3
+    TITLE_KEYWORD_BONUS = 2.0
+    PROJECT_WEIGHT = 4.0
+    MAX_PROJECTS = 2
+    TIER_WEIGHTS = {1: 3.0, 2: 2.0, 3: 1.0}
+
+    @classmethod
+    def keyword_score(cls, analysis: AnalyzedText) -> float:
+        score = 0.0
+        for name, keywords, weight in cls.KEYWORD_WEIGHTS:
+            score += weight * min(len(analysis.term_hits(name, keywords)), cls.MAX_HITS_PER_GROUP)
+        title_lower = analysis.title_lower
+        if any(keyword.lower() in title_lower for keyword in analysis.term_hits("energy", KeywordFilter.ENERGY_KEYWORDS)):
+            score += cls.TITLE_KEYWORD_BONUS
+        return score
+
+    @classmethod
+    def source_score(cls, domain: str) -> float:
+        publisher = get_registry().lookup(domain)
+        return cls.TIER_WEIGHTS.get(publisher.tier, 0.0) if publisher is not None else 0.0
+
+    @staticmethod
+    def recency_factor(published_dt: Optional[datetime], now: datetime, half_life_hours: float) -> float:
+        """1.0 สำหรับข่าวล่าสุด ลดลงครึ่งหนึ่งทุก half_life_hours (ไม่มีเวลา = อายุ 1 half-life)"""
+        if half_life_hours <= 0:
+            return 1.0
+        if published_dt is None:
+            return 0.5
+        age_hours = max((now - published_dt).total_seconds() / 3600, 0.0)
+        return 0.5 ** (age_hours / half_life_hours)
+
+    @classmethod
+    def score(cls, item, analysis: AnalyzedText, now: datetime, half_life_hours: float) -> float:
+        """คะแนนของ NewsItem (analysis = ผลวิเคราะห์ title + summary ของข่าว)"""
+        base = (
+            cls.keyword_score(analysis)
+            + cls.PROJECT_WEIGHT * min(len(item.project_hints), cls.MAX_PROJECTS)
+            + cls.source_score(item.domain)
+        )
+        return round(base * cls.recency_factor(item.published_dt, now, half_life_hours), 4)
+
+
+class TopK:
+    """
+    เก็บ K รายการที่คะแนนสูงสุดด้วย min-heap ขนาดไม่เกิน K (เพิ่มทีละรายการ O(log K))
+
+    คะแนนเท่ากัน: ข่าวที่ใหม่กว่าก่อน แล้วจึงเป็นข่าวที่เพิ่มเข้ามาก่อน
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []
+        self._seq = itertools.count()
+
+    def push(self, item, score: float):
+        if self.k <= 0:
+            return
+        published_dt = item.get('published_dt')
+        entry = (score, published_dt.timestamp() if published_dt else float("-inf"), -next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def items(self) -> list:
+        """รายการที่เลือกไว้ เรียงคะแนนจากมากไปน้อย"""
+        return [entry[-1] for entry in sorted(self._heap, reverse=True)]
+
+
+def news_group(item) -> str:
+    """กลุ่มของข่าวที่ส่งเป็น carousel เดียวกัน ('country' / 'international' หรือ '' ถ้าไม่มีประเทศ)"""
+    country = item.get('country', '')
+    if country == 'International':
+        return 'international'
+    return 'country' if country else ''
+
+
+def select_top(items: Iterable, k: int) -> Dict[str, List]:
+    """ข่าวคะแนนสูงสุดไม่เกิน k ข่าวต่อกลุ่ม -> {'country': [...], 'international': [...]}"""
+    groups = {'country': TopK(k), 'international': TopK(k)}
+    for item in items:
+        top = groups.get(news_group(item))
+        if top is not None:
+            top.push(item, item.get('score') or 0.0)
+    return {name: top.items() for name, top in groups.items()}
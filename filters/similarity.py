@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Text Similarity
+ความคล้ายคลึงของข้อความ (SequenceMatcher.ratio) แบบรู้ threshold
+
+similar_at_least() ตรวจขอบบนที่คำนวณถูกกว่าก่อน (ความยาว, จำนวนตัวอักษรร่วม)
+ถ้าขอบบนไม่เกิน threshold จะไม่ต้องรัน SequenceMatcher เต็มรูปแบบ
+SimilarityIndex คำนวณขอบบนเดียวกันกับข้อความทั้งหมดที่เก็บไว้ในครั้งเดียว (numpy)
+"""
+
+import math
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from filters.text_analysis import normalize_text
+
+
+@lru_cache(maxsize=8192)
+def normalized(text: str) -> str:
+    """normalize_text แบบ cache (ข้อความเดิมไม่ต้อง normalize ซ้ำ)"""
+    return normalize_text(text)
+
+
+@lru_cache(maxsize=8192)
+def _char_counts(text: str) -> Counter:
+    return Counter(text)
+
+
+def _common_chars(a: str, b: str) -> int:
+    """จำนวนตัวอักษรร่วมแบบ multiset (เท่ากับที่ quick_ratio ใช้)"""
+    counts_a, counts_b = _char_counts(a), _char_counts(b)
+    if len(counts_a) > len(counts_b):
+        counts_a, counts_b = counts_b, counts_a
+    return sum(min(count, counts_b[char]) for char, count in counts_a.items() if char in counts_b)
+
+
+def similarity_ratio(a: str, b: str) -> float:
+    """SequenceMatcher ratio ของข้อความที่ normalize แล้ว (ข้อความว่าง = 0.0)"""
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def similar_at_least(a: str, b: str, threshold: float) -> float:
+    """
+    ความคล้ายคลึงของข้อความที่ normalize แล้ว เมื่อต้องการรู้แค่ว่าเกิน threshold หรือไม่
+
+    Returns:
+        ค่า ratio จริง (เท่ากับ similarity_ratio) ถ้า ratio > threshold
+        มิฉะนั้นคืนค่าที่ <= threshold (อาจเป็นขอบบนแทนค่าจริง)
+        จึงใช้ผลกับเงื่อนไข `> threshold` (และ threshold ที่สูงกว่า) ได้เหมือนเดิม
+    """
+    if not a or not b:
+        return 0.0
+
+    total = len(a) + len(b)
+
+    # ขอบบนจากความยาว (real_quick_ratio)
+    upper = 2.0 * min(len(a), len(b)) / total
+    if upper <= threshold:
+        return upper
+
+    # ขอบบนจากตัวอักษรร่วม (quick_ratio)
+    upper = 2.0 * _common_chars(a, b) / total
+    if upper <= threshold:
+        return upper
+
+    return SequenceMatcher(None, a, b).ratio()
+
+
+class SimilarityIndex:
+    """
+    ข้อความที่ normalize แล้ว (เพิ่มตามลำดับ) สำหรับหาข้อความที่อาจคล้ายกันเกิน threshold
+
+    candidates() คืนลำดับของข้อความที่ขอบบนจากตัวอักษรร่วม (quick_ratio) เกิน threshold
+    ข้อความอื่น similar_at_least ไม่มีทางเกิน threshold จึงข้ามได้โดยผลไม่เปลี่ยน
+    ไม่มี numpy: ใช้ขอบบนจากความยาวอย่างเดียว (แบ่งข้อความตามความยาว)
+    """
+
+    def __init__(self):
+        self._size = 0
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+        self._columns: Dict[str, int] = {}
+        self._lengths = np.zeros(64, dtype=np.int64) if np is not None else None
+        self._counts = np.zeros((64, 64), dtype=np.int32) if np is not None else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, text: str) -> int:
+        """เพิ่มข้อความ คืนลำดับของข้อความนั้น"""
+        position = self._size
+        self._size += 1
+        if np is None:
+            self._by_length[len(text)].append(position)
+            return position
+
+        counts = _char_counts(text)
+        for char in counts:
+            if char not in self._columns:
+                self._columns[char] = len(self._columns)
+        rows, cols = self._counts.shape
+        if self._size > rows or len(self._columns) > cols:
+            grown = np.zeros((max(rows, self._size) * 2 if self._size > rows else rows,
+                              cols * 2 if len(self._columns) > cols else cols), dtype=np.int32)
+            grown[:rows, :cols] = self._counts
+            self._counts = grown
+            if self._size > len(self._lengths):
+                self._lengths = np.resize(self._lengths, grown.shape[0])
+        for char, count in counts.items():
+            self._counts[position, self._columns[char]] = count
+        self._lengths[position] = len(text)
+        return position
+
+    def candidates(self, text: str, threshold: float) -> List[int]:
+        """ลำดับ (จากน้อยไปมาก) ของข้อความที่อาจคล้ายกับ text เกิน threshold"""
+        if not text or not self._size:
+            return []
+        if np is None:
+            low = math.floor(len(text) * threshold / (2 - threshold))
+            high = math.ceil(len(text) * (2 - threshold) / threshold)
+            return sorted(i for length in range(low, high + 1) for i in self._by_length.get(length, ()))
+
+        counts = _char_counts(text)
+        known = [(self._columns[char], count) for char, count in counts.items() if char in self._columns]
+        lengths = self._lengths[:self._size]
+        if known:
+            columns = np.fromiter((column for column, _ in known), dtype=np.int64, count=len(known))
+            query = np.fromiter((count for _, count in known), dtype=np.int32, count=len(known))
+            common = np.minimum(self._counts[:self._size, columns], query).sum(axis=1)
+        else:
+            common = np.zeros(self._size, dtype=np.int64)
+        # เหมือน similar_at_least: ข้ามเมื่อ 2 * common / total <= threshold
+        upper = 2.0 * common / (len(text) + lengths)
+        return np.flatnonzero((upper > threshold) & (lengths > 0)).tolist()
+
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Text Analysis Cache
+วิเคราะห์ข้อความของข่าวครั้งเดียวแล้วเก็บผลไว้กับข่าว
+
+KeywordFilter และ EnhancedDeduplication ใช้ผลเดียวกัน (lowercase, normalized title,
+คำสำคัญที่พบ, entities, คำเฉพาะเจาะจง) แทนการ lower/scan ข้อความซ้ำทุกครั้งที่เปรียบเทียบ
+และตรวจเฉพาะคำสำคัญของภาษาที่มีในข้อความ (ดู utils/lang_utils.py)
+
+normalize_text ตัดคำภาษาไทยด้วย ThaiTokenizer (utils/thai_tokenizer.py) ก่อนตัด stop words
+dictionary = data/thai_words.txt + stop words + คำสำคัญของ KeywordFilter/EnhancedDeduplication
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, List, Set, Tuple, Union
+
+from utils.lang_utils import keyword_set, latin_words, text_language
+from utils.thai_tokenizer import ThaiTokenizer
+
+THAI_STOP_WORDS = {
+    'ที่', 'ใน', 'จาก', 'เป็น', 'การ', 'และ', 'ของ', 'ได้', 'มี', 'ว่า',
+    'กับ', 'โดย', 'ให้', 'แล้ว', 'ไป', 'มา', 'อยู่', 'ยัง', 'คือ', 'ถึง',
+    'นี้', 'นั้น', 'ซึ่ง', 'เพื่อ', 'แต่', 'ถ้า', 'จะ', 'ก็', 'ไม่', 'ขึ้น'
+}
+
+ENGLISH_STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'it', 'its'
+}
+
+# stop words ทั้งสองภาษา (คำไทยกับคำอังกฤษไม่ซ้ำกัน จึงตรวจใน set เดียวได้)
+_STOP_WORDS = frozenset(THAI_STOP_WORDS | ENGLISH_STOP_WORDS)
+
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+# เครื่องหมายวรรคตอน (สระ/วรรณยุกต์ไทยไม่ใช่ \w แต่เป็นส่วนของคำ จึงต้องเก็บไว้)
+_PUNCT_RE = re.compile(r'[^\w\s\u0E01-\u0E3A\u0E40-\u0E4E]')
+_DIGITS_RE = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=1)
+def get_thai_tokenizer() -> ThaiTokenizer:
+    """ThaiTokenizer ที่ใช้ร่วมกันทั้งโปรแกรม (สร้างครั้งแรกที่เรียก)"""
+    from filters.deduplication import EnhancedDeduplication
+    from filters.keyword_filter import KeywordFilter
+
+    keyword_lists = [
+        KeywordFilter.ENERGY_KEYWORDS, KeywordFilter.ENERGY_MARKET_KEYWORDS,
+        KeywordFilter.BUSINESS_KEYWORDS, KeywordFilter.EXCLUDE_KEYWORDS,
+        KeywordFilter.INTERNATIONAL_KEYWORDS, KeywordFilter.COUNTRY_NAME_KEYWORDS,
+        KeywordFilter.IMPORTANCE_KEYWORDS, *KeywordFilter.PRIMARY_COUNTRIES.values(),
+        EnhancedDeduplication.GROUPING_KEYWORDS, EnhancedDeduplication.ENTITY_KEYWORDS,
+        *EnhancedDeduplication.EVENT_SIGNATURES.values(),
+    ]
+    extra = [word for keywords in keyword_lists for word in keywords]
+    return ThaiTokenizer.load(extra=[*THAI_STOP_WORDS, *extra])
+
+
+@lru_cache(maxsize=8192)
+def normalized_tokens(text: str) -> Tuple[str, ...]:
+    """
+    คำของข้อความหลัง normalize
+    (lowercase, ตัด URL/เครื่องหมาย/ตัวเลข, ตัดคำภาษาไทย, ตัด stop words และคำที่ยาว 1 ตัวอักษร)
+    """
+    if not text:
+        return ()
+
+    text = text.lower()
+    text = _URL_RE.sub('', text)
+    text = _PUNCT_RE.sub(' ', text)
+    text = _DIGITS_RE.sub('', text)
+
+    return tuple(
+        w for w in get_thai_tokenizer().tokenize(text)
+        if w not in _STOP_WORDS
+        and len(w) > 1
+    )
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text สำหรับการเปรียบเทียบ (คำจาก normalized_tokens คั่นด้วยช่องว่าง)
+
+    ผลลัพธ์ normalize ซ้ำแล้วได้ค่าเดิม จึงเก็บไว้ใช้แทนข้อความต้นฉบับได้
+    """
+    return ' '.join(normalized_tokens(text))
+
+
+class AnalyzedText:
+    """
+    ผลการวิเคราะห์ข้อความของข่าวหนึ่งข่าว (title + summary)
+
+    ค่าที่คำนวณแล้วจะถูก cache ไว้ในตัว object:
+        lower / title_lower   - ข้อความ lowercase
+        normalized_title      - normalize_text(title)
+        language              - ภาษาของข้อความ (th / en / mixed)
+        hits(name, keywords)  - คำสำคัญที่เป็น substring ของ lower (ตามลำดับของ keywords)
+        term_hits(name, keywords) - คำสำคัญที่พบแบบคำเต็ม (ดู KeywordSet.term_hits)
+        memo(name, func)      - ค่าอื่นๆ ที่ filter ต้องการเก็บ (เช่น entities, คำเฉพาะเจาะจง)
+    """
+
+    __slots__ = (
+        "title", "summary", "text", "_lower", "_title_lower", "_normalized_title", "_language", "_words", "_cache"
+    )
+
+    def __init__(self, title: str = "", summary: str = ""):
+        self.title = title or ""
+        self.summary = summary or ""
+        self.text = f"{self.title} {self.summary}"
+        self._lower = None
+        self._title_lower = None
+        self._normalized_title = None
+        self._language = None
+        self._words = None
+        self._cache = {}
+
+    @classmethod
+    def of(cls, text: Union[str, "AnalyzedText"]) -> "AnalyzedText":
+        """รับได้ทั้ง str และ AnalyzedText (str จะถือเป็นข้อความทั้งหมด)"""
+        if isinstance(text, AnalyzedText):
+            return text
+        analysis = cls(text or "")
+        analysis.text = text or ""
+        return analysis
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def title_lower(self) -> str:
+        if self._title_lower is None:
+            self._title_lower = self.title.lower()
+        return self._title_lower
+
+    @property
+    def normalized_title(self) -> str:
+        if self._normalized_title is None:
+            self._normalized_title = normalize_text(self.title)
+        return self._normalized_title
+
+    @property
+    def language(self) -> str:
+        if self._language is None:
+            self._language = text_language(self.lower)
+        return self._language
+
+    @property
+    def latin_words(self) -> Set[str]:
+        if self._words is None:
+            self._words = latin_words(self.lower)
+        return self._words
+
+    def hits(self, name: str, keywords: Iterable[str]) -> List[str]:
+        """คำใน keywords ที่พบในข้อความ (เทียบแบบ lowercase substring) - cache ตามชื่อ"""
+        key = ("hits", name)
+        if key not in self._cache:
+            self._cache[key] = keyword_set(keywords).substring_hits(self.lower, self.language)
+        return self._cache[key]
+
+    def term_hits(self, name: str, keywords: Iterable[str]) -> List[str]:
+        """คำใน keywords ที่พบแบบคำเต็ม (คำอังกฤษตรงทั้งคำ, คำไทยไม่นับในคำที่ไม่เกี่ยวข้อง) - cache ตามชื่อ"""
+        key = ("terms", name)
+        if key not in self._cache:
+            self._cache[key] = keyword_set(keywords).term_hits(self.lower, self.language, self.latin_words)
+        return self._cache[key]
+
+    def memo(self, name: str, func: Callable[["AnalyzedText"], object]):
+        """คำนวณ func(self) ครั้งเดียวแล้ว cache ตามชื่อ"""
+        key = ("memo", name)
+        if key not in self._cache:
+            self._cache[key] = func(self)
+        return self._cache[key]
+
+
+def analyze_item(item: dict) -> AnalyzedText:
+    """
+    คืน AnalyzedText ของข่าว (เก็บไว้ที่ item['_analysis'])
+    ถ้า title/summary ของข่าวเปลี่ยนไปจะวิเคราะห์ใหม่
+    """
+    title = item.get('title', '') or ''
+    summary = item.get('summary', '') or ''
+    analysis = item.get('_analysis')
+    if analysis is None or analysis.title != title or analysis.summary != summary:
+        analysis = AnalyzedText(title, summary)
+        item['_analysis'] = analysis
+    return analysis
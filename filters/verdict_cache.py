@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Entry Verdict Cache
+เก็บผล parse + ผลตรวจคำสำคัญ/ประเทศ ของ feed entry ข้ามรอบการทำงาน
+
+Google News คืน entry ชุดเดิมเกือบทั้งหมดในรอบถัดไป entry ที่เคยประมวลผลแล้ว
+(key = guid/link + hash ของเนื้อหา) จึงใช้ผลเดิมได้โดยไม่ต้องทำความสะอาด HTML
+และตรวจคำสำคัญใหม่ ส่วนการเช็คข่าวที่ส่งแล้ว ช่วงเวลา และ dedup ยังทำทุกรอบ
+
+cache ทั้งไฟล์จะถูกล้างเมื่อ rules version (KeywordFilter.rules_version() + เวอร์ชันของ parser)
+เปลี่ยน และ entry ที่เก่ากว่า TTL จะถูกลบ
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Tuple
+
+from config.settings import settings
+from filters.text_analysis import AnalyzedText
+from utils.metrics import metrics
+
+CACHE_VERSION = 1
+CACHE_FILE = "verdicts.json"
+
+
+def entry_key(entry) -> str:
+    """key ของ entry: guid (หรือ link) + hash ของ title/summary/เวลาเผยแพร่"""
+    parts = [
+        getattr(entry, "id", "") or getattr(entry, "link", "") or "",
+        getattr(entry, "title", "") or "",
+        getattr(entry, "summary", "") or "",
+        getattr(entry, "published", "") or getattr(entry, "updated", "") or "",
+    ]
+    return hashlib.sha1("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """cache ผล parse/ตรวจคำสำคัญของ entry (บันทึกเป็น JSON ในโฟลเดอร์ cache)"""
+
+    def __init__(self, directory: str, rules_version: str, ttl_hours: float = 72):
+        self.path = os.path.join(directory, CACHE_FILE)
+        self.rules_version = rules_version
+        self.ttl = timedelta(hours=ttl_hours)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def from_settings(cls, rules_version: str) -> Optional["VerdictCache"]:
+        """สร้างจาก VERDICT_CACHE_DIR / VERDICT_CACHE_TTL_HOURS (None ถ้าไม่ได้ตั้ง)"""
+        if not settings.VERDICT_CACHE_DIR:
+            return None
+        return cls(settings.VERDICT_CACHE_DIR, rules_version, settings.VERDICT_CACHE_TTL_HOURS)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[CACHE] อ่าน verdict cache ไม่สำเร็จ: {str(e)}")
+            return
+        if data.get("version") != CACHE_VERSION or data.get("rules_version") != self.rules_version:
+            print("[CACHE] กฎการกรองเปลี่ยน - ล้าง verdict cache")
+            self._dirty = True
+            return
+
+        cutoff = (datetime.now(timezone.utc) - self.ttl).isoformat()
+        entries = data.get("entries", {})
+        self.entries = {key: value for key, value in entries.items() if value.get("cached_at", "") >= cutoff}
+        self._dirty = len(self.entries) != len(entries)
+
+    def get(self, key: str, feed_name: str, feed_type: str) -> Optional[Tuple[dict, Optional[tuple]]]:
+        """
+        (item, classified) ในรูปแบบเดียวกับ NewsProcessor._parse_and_classify หรือ None ถ้าไม่มีใน cache
+        """
+        record = self.entries.get(key)
+        if record is None:
+            self.misses += 1
+            metrics.incr("verdict_cache_total", result="miss")
+            return None
+        self.hits += 1
+        metrics.incr("verdict_cache_total", result="hit")
+
+        published = record["published"]
+        item = {
+            "title": record["title"],
+            "url": record["url"],
+            "canon_url": record["canon_url"],
+            "summary": record["summary"],
+            "source_url": record.get("source_url", ""),
+            "published_dt": datetime.fromisoformat(published).astimezone(settings.TZ) if published else None,
+            "feed": feed_name,
+            "section": feed_type,
+        }
+        verdict = record["verdict"]
+        if verdict is None:
+            return item, None
+        analysis = AnalyzedText(item["title"], item["summary"])
+        return item, (analysis, (verdict["valid"], verdict["reason"], verdict["details"]), verdict["country"])
+
+    def put(self, key: str, item: dict, classified: Optional[tuple]):
+        """บันทึกผลของ entry"""
+        verdict = None
+        if classified is not None:
+            _, (is_valid, reason, details), country = classified
+            verdict = {"valid": is_valid, "reason": reason, "details": details, "country": country}
+        published_dt = item["published_dt"]
+        self.entries[key] = {
+            "title": item["title"],
+            "url": item["url"],
+            "canon_url": item["canon_url"],
+            "summary": item["summary"],
+            "source_url": item["source_url"],
+            "published": published_dt.isoformat() if published_dt else None,
+            "verdict": verdict,
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._dirty = True
+
+    def save(self):
+        """เขียน cache ลงไฟล์ (เฉพาะเมื่อมีการเปลี่ยนแปลง)"""
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "version": CACHE_VERSION,
+            "rules_version": self.rules_version,
+            "entries": self.entries,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
@@ -4,14 +4,9 @@ Enhanced News Aggregator - Main Entry Point
 ระบบรวบรวมข่าวพลังงาน + ราคา WTI Futures + Dynamic Price Alert
 """
 
-from config.settings import (
-    LINE_CHANNEL_ACCESS_TOKEN, 
-    EIA_API_KEY,
-    USE_LLM_SUMMARY,
-    GROQ_API_KEY,
-    WINDOW_HOURS,
-    DRY_RUN
-)
+import sys
+
+from config.settings import settings
 from services.news_processor import NewsProcessor
 from services.wti_fetcher import WTIFuturesFetcher
 from services.line_sender import LineSender
@@ -20,6 +15,14 @@ from builders.wti_message import WTIMessageBuilder
 from builders.alert_message import WTIPriceAlert
 from builders.alert_config import AlertConfig  # ← เพิ่มบรรทัดนี้
 from utils.storage import append_sent_link
+from utils.stage_graph import StageGraph
+from utils.metrics import metrics
+from utils.profiling import profiler_from_env
+
+# เวลาสูงสุดของแต่ละขั้นตอน (วินาที)
+WTI_STAGE_TIMEOUT = 180
+NEWS_STAGE_TIMEOUT = 1200
+SEND_STAGE_TIMEOUT = 120
 
 def main():
     """Main function"""
@@ -27,136 +30,201 @@ def main():
     print("ระบบติดตามข่าวพลังงาน + WTI Futures + Dynamic Price Alert")
     print("="*60)
     
-    # ตรวจสอบ configuration
-    if not LINE_CHANNEL_ACCESS_TOKEN:
-        print("[ERROR] LINE_CHANNEL_ACCESS_TOKEN is required")
-        return
-    
-    if not EIA_API_KEY:
-        print("[ERROR] EIA_API_KEY is required")
-        print("        Get one from: https://www.eia.gov/opendata/")
-        return
+    # ตรวจสอบ configuration (raise ConfigError ถ้าไม่ครบ)
+    settings.validate("LINE_CHANNEL_ACCESS_TOKEN", "EIA_API_KEY")
     
     # ← เพิ่มส่วนนี้: โหลด Alert Config
     alert_config = AlertConfig()
-    print(f"\n[CONFIG] Use LLM: {'Yes' if USE_LLM_SUMMARY and GROQ_API_KEY else 'No'}")
-    print(f"[CONFIG] Time window: {WINDOW_HOURS} hours")
-    print(f"[CONFIG] Dry run: {'Yes' if DRY_RUN else 'No'}")
+    print(f"\n[CONFIG] Use LLM: {'Yes' if settings.USE_LLM_SUMMARY and settings.GROQ_API_KEY else 'No'}")
+    print(f"[CONFIG] Time window: {settings.WINDOW_HOURS} hours")
+    print(f"[CONFIG] Dry run: {'Yes' if settings.DRY_RUN else 'No'}")
+    if settings.ALLOWED_NEWS_SOURCES_LIST:
+        print(f"[CONFIG] เลือกเฉพาะเว็บข่าว: {settings.ALLOWED_NEWS_SOURCES_LIST}")
+    else:
+        print("[CONFIG] รับข่าวจากทุกเว็บข่าว")
     print(f"\n{alert_config.get_alert_summary()}")
     
     # Initialize services
     processor = NewsProcessor()
-    line_sender = LineSender(LINE_CHANNEL_ACCESS_TOKEN)
-    
-    # STEP 1: ตรวจสอบราคา WTI และส่ง Alert (ถ้าจำเป็น)
-    print("\n[1] กำลังตรวจสอบราคา WTI...")
-    wti_alert_sent = False
-    wti_data = None
-    
-    try:
-        wti_fetcher = WTIFuturesFetcher(api_key=EIA_API_KEY)
-        wti_data = wti_fetcher.get_current_and_futures()
-        current_price = wti_data.get("current", {}).get("current_price", 0)
-        
-        print(f"[WTI] ราคาปัจจุบัน: ${current_price:.2f}/barrel")
-        
-        # ← แก้ไขส่วนนี้: ใช้ AlertConfig แทน
-        should_send, triggered_alert, reason = alert_config.should_send_alert(current_price)
+    line_sender = LineSender(settings.LINE_CHANNEL_ACCESS_TOKEN)
+    
+    # STEP 1: ดึงราคา WTI (ทำงานพร้อมกับการดึงข่าว)
+    def fetch_wti(results):
+        print("\n[1] กำลังตรวจสอบราคา WTI...")
+        wti_fetcher = WTIFuturesFetcher(api_key=settings.EIA_API_KEY)
+        return wti_fetcher.get_current_and_futures()
+    
+    # ตรวจสอบราคา WTI และส่ง Alert (ถ้าจำเป็น)
+    def send_alert(results):
+        wti = results["wti_fetch"]
+        if not wti.ok:
+            print(f"[ALERT] ✗ ตรวจสอบราคาไม่สำเร็จ: {str(wti.error)}")
+            return None
         
-        if should_send:
-            print(f"[ALERT] {triggered_alert['emoji']} {triggered_alert['name']} triggered!")
-            print(f"[ALERT] Reason: {reason}")
+        alert_sent = False
+        try:
+            wti_data = wti.value
+            current_price = wti_data.get("current", {}).get("current_price", 0)
             
-            # สร้างข้อความ alert พร้อม config
-            alert_message = WTIPriceAlert.create_alert_message(wti_data, triggered_alert)
+            print(f"[WTI] ราคาปัจจุบัน: ${current_price:.2f}/barrel")
             
-            if line_sender.send_message(alert_message):
-                wti_alert_sent = True
+            # ← แก้ไขส่วนนี้: ใช้ AlertConfig แทน
+            should_send, triggered_alert, reason = alert_config.should_send_alert(current_price)
+            
+            if should_send:
+                print(f"[ALERT] {triggered_alert['emoji']} {triggered_alert['name']} triggered!")
+                print(f"[ALERT] Reason: {reason}")
                 
-                # บันทึกว่าส่ง alert แล้ว
-                alert_config.record_alert_sent(triggered_alert["name"], current_price)
+                # สร้างข้อความ alert พร้อม config
+                alert_message = WTIPriceAlert.create_alert_message(wti_data, triggered_alert)
                 
-                print(f"[ALERT] ✓ ส่งการแจ้งเตือนสำเร็จ")
+                if line_sender.send_message(alert_message):
+                    alert_sent = True
+                    
+                    # บันทึกว่าส่ง alert แล้ว
+                    alert_config.record_alert_sent(triggered_alert["name"], current_price)
+                    
+                    print(f"[ALERT] ✓ ส่งการแจ้งเตือนสำเร็จ")
+                else:
+                    print("[ALERT] ✗ ส่งการแจ้งเตือนไม่สำเร็จ")
             else:
-                print("[ALERT] ✗ ส่งการแจ้งเตือนไม่สำเร็จ")
-        else:
-            print(f"[ALERT] ✓ ราคาปกติ - {reason}")
-    
-    except Exception as e:
-        print(f"[ALERT] ✗ ตรวจสอบราคาไม่สำเร็จ: {str(e)}")
+                print(f"[ALERT] ✓ ราคาปกติ - {reason}")
+        
+        except Exception as e:
+            print(f"[ALERT] ✗ ตรวจสอบราคาไม่สำเร็จ: {str(e)}")
+        
+        return True if alert_sent else None
     
     # STEP 2: ดึงและกรองข่าว
-    print("\n[2] กำลังดึงและกรองข่าว...")
-    news_items = processor.fetch_and_filter_news()
-    
-    print(f"\n[FILTER STATISTICS]")
-    print(f"  รวมข่าวที่ประมวลผล: {processor.filter_stats['total_processed']}")
-    print(f"  ผ่านการกรอง: {processor.filter_stats['filtered_by']['passed']}")
+    def fetch_news(results):
+        print("\n[2] กำลังดึงและกรองข่าว...")
+        news_items = processor.fetch_and_filter_news()
+        
+        print(f"\n[FILTER STATISTICS]")
+        print(f"  รวมข่าวที่ประมวลผล: {processor.filter_stats['total_processed']}")
+        print(f"  ผ่านการกรอง: {processor.filter_stats['filtered_by']['passed']}")
+        print(f"  เลือกส่ง (คะแนนสูงสุด): {len(news_items)}")
+        if processor.trends:
+            print(f"  หัวข้อมาแรง: {', '.join(f'{trend.keyword} x{trend.ratio:g}' for trend in processor.trends)}")
+        return news_items
+    
+    # หัวข้อมาแรงที่แสดงท้าย carousel ข่าวประเทศเฉพาะ (TREND_BUBBLE)
+    def country_trends():
+        return processor.trends if settings.TREND_BUBBLE else None
     
     # แยกข่าวเป็น 2 กลุ่ม
-    country_news = []
-    international_news = []
-    
-    for item in news_items:
-        country = item.get('country', '')
-        if country == 'International':
-            international_news.append(item)
-        elif country:
-            country_news.append(item)
-    
-    print(f"\n[3] แยกข่าวตามประเภท:")
-    print(f"   - ข่าวประเทศเฉพาะ: {len(country_news)} ข่าว")
-    print(f"   - ข่าวระดับโลก: {len(international_news)} ข่าว")
-    
-    # นับจำนวนข้อความที่ส่ง
-    success_count = 1 if wti_alert_sent else 0
-    total_messages = 1 if wti_alert_sent else 0
+    def split_news(results):
+        country_news = []
+        international_news = []
+        
+        for item in results["news"].value:
+            country = item.get('country', '')
+            if country == 'International':
+                international_news.append(item)
+            elif country:
+                country_news.append(item)
+        
+        # ข่าวที่เกินจำนวน bubble ของ carousel จะไม่ถูกส่ง จึงไม่บันทึกว่าส่งแล้ว
+        country_news = country_news[:NewsMessageBuilder.news_limit(country_trends())]
+        
+        print(f"\n[3] แยกข่าวตามประเภท:")
+        print(f"   - ข่าวประเทศเฉพาะ: {len(country_news)} ข่าว")
+        print(f"   - ข่าวระดับโลก: {len(international_news)} ข่าว")
+        return country_news, international_news
     
     # STEP 3: ส่งข่าวประเทศเฉพาะ
-    if country_news:
+    def send_country_news(results):
+        country_news, _ = results["split"].value
+        if not country_news:
+            return None
+        
         print("\n[4] กำลังส่งข่าวประเทศเฉพาะ...")
-        country_message = NewsMessageBuilder.create_carousel_message(country_news)
+        country_message = NewsMessageBuilder.create_carousel_message(country_news, country_trends())
+        if not country_message:
+            return None
         
-        if country_message:
-            total_messages += 1
-            if line_sender.send_message(country_message):
-                success_count += 1
-                print("   ✓ ส่งข่าวประเทศเฉพาะสำเร็จ")
+        if line_sender.send_message(country_message):
+            print("   ✓ ส่งข่าวประเทศเฉพาะสำเร็จ")
+            return True
+        return False
     
     # STEP 4: ส่งข่าว International
-    if international_news:
+    def send_international_news(results):
+        _, international_news = results["split"].value
+        if not international_news:
+            return None
+        
         print("\n[5] กำลังส่งข่าวระดับโลก...")
         intl_message = NewsMessageBuilder.create_carousel_message(international_news)
+        if not intl_message:
+            return None
         
-        if intl_message:
-            total_messages += 1
-            if line_sender.send_message(intl_message):
-                success_count += 1
-                print("   ✓ ส่งข่าวระดับโลกสำเร็จ")
+        if line_sender.send_message(intl_message):
+            print("   ✓ ส่งข่าวระดับโลกสำเร็จ")
+            return True
+        return False
     
     # STEP 5: ส่งข้อมูล WTI Futures ปกติ
-    print("\n[6] กำลังส่งข้อมูล WTI Futures...")
-    try:
-        if not wti_data:
-            wti_fetcher = WTIFuturesFetcher(api_key=EIA_API_KEY)
-            wti_data = wti_fetcher.get_current_and_futures()
-        
-        wti_message = WTIMessageBuilder.create_wti_futures_message(wti_data)
+    def send_wti_futures(results):
+        print("\n[6] กำลังส่งข้อมูล WTI Futures...")
+        try:
+            wti_data = results["wti_fetch"].value
+            if not wti_data:
+                wti_fetcher = WTIFuturesFetcher(api_key=settings.EIA_API_KEY)
+                wti_data = wti_fetcher.get_current_and_futures()
+            
+            wti_message = WTIMessageBuilder.create_wti_futures_message(wti_data)
+            
+            if line_sender.send_message(wti_message):
+                print("   ✓ ส่ง WTI Futures สำเร็จ")
+                return True
+            return False
         
-        total_messages += 1
-        if line_sender.send_message(wti_message):
-            success_count += 1
-            print("   ✓ ส่ง WTI Futures สำเร็จ")
-    
-    except Exception as e:
-        print(f"   ✗ WTI ERROR: {str(e)}")
+        except Exception as e:
+            print(f"   ✗ WTI ERROR: {str(e)}")
+            return None
     
     # STEP 6: บันทึกข่าวที่ส่งแล้ว
-    if (country_news or international_news) and not DRY_RUN:
-        all_sent_news = country_news + international_news
-        for item in all_sent_news:
-            append_sent_link(item.get('canon_url') or item.get('url'))
-        print("\n[SUCCESS] อัปเดตฐานข้อมูลข่าวที่ส่งแล้ว")
+    def record_sent(results):
+        country_news, international_news = results["split"].value
+        if (country_news or international_news) and not settings.DRY_RUN:
+            all_sent_news = country_news + international_news
+            for item in all_sent_news:
+                append_sent_link(item.get('canon_url') or item.get('url'))
+            processor.dedup.save_event_index(all_sent_news)
+            processor.save_trends()
+            print("\n[SUCCESS] อัปเดตฐานข้อมูลข่าวที่ส่งแล้ว")
+    
+    # ดึง WTI และข่าวพร้อมกัน ส่วนการส่ง LINE ยังเรียงลำดับเหมือนเดิม
+    # Profiling: PROFILE=1 หรือ python main.py --profile
+    profiler = profiler_from_env("daily_news", sys.argv[1:])
+    graph = StageGraph(stage_wrapper=profiler.wrap)
+    graph.add_stage("wti_fetch", fetch_wti, timeout=WTI_STAGE_TIMEOUT)
+    graph.add_stage("alert", send_alert, deps=["wti_fetch"], timeout=SEND_STAGE_TIMEOUT)
+    # ดึงข่าวใช้เวลานาน จึงเขียน log ออกทันทีไม่ buffer
+    graph.add_stage("news", fetch_news, timeout=NEWS_STAGE_TIMEOUT, critical=True, buffered=False)
+    graph.add_stage("split", split_news, deps=["news"], critical=True)
+    graph.add_stage("country_send", send_country_news, deps=["split", "alert"],
+                    timeout=SEND_STAGE_TIMEOUT, critical=True)
+    graph.add_stage("intl_send", send_international_news, deps=["country_send"],
+                    timeout=SEND_STAGE_TIMEOUT, critical=True)
+    # WTI Futures ส่งหลังข่าวเสมอ แต่ยังส่งแม้ขั้นตอนข่าวล้มเหลว (ไม่ใช้ข้อมูลข่าว)
+    graph.add_stage("wti_send", send_wti_futures, deps=["wti_fetch"], after=["intl_send"],
+                    timeout=WTI_STAGE_TIMEOUT + SEND_STAGE_TIMEOUT)
+    graph.add_stage("record", record_sent, deps=["split", "wti_send"], critical=True)
+    
+    try:
+        results = graph.run()
+    finally:
+        report_path = metrics.write_report(settings.METRICS_DIR, "daily_news", settings.METRICS_PROMETHEUS)
+        print(f"\n[METRICS] บันทึกรายงาน: {report_path}")
+    
+    # นับจำนวนข้อความที่ส่ง
+    wti_alert_sent = results["alert"].value is True
+    sends = [results[name].value for name in ("alert", "country_send", "intl_send", "wti_send")]
+    success_count = sum(1 for sent in sends if sent is True)
+    total_messages = sum(1 for sent in sends if sent is not None)
+    country_news, international_news = results["split"].value
     
     # สรุปผล
     print("\n" + "="*60)
@@ -13,27 +13,30 @@ from datetime import datetime
 # เพิ่ม path เพื่อให้ import ได้
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.settings import LINE_CHANNEL_ACCESS_TOKEN, EIA_API_KEY, TZ
+from config.settings import settings, ConfigError
 from services.wti_fetcher import WTIFuturesFetcher
 from services.line_sender import LineSender
 from builders.alert_message import WTIPriceAlert
 from builders.alert_config import AlertConfig
+from utils.metrics import metrics
+from utils.profiling import profiler_from_env
+
+# Profiling: PROFILE=1 หรือ python scripts/check_wti_alert.py --profile
+profiler = profiler_from_env("wti_alert", sys.argv[1:])
 
 
 def main():
     """ตรวจสอบราคาและส่ง alert"""
     print("="*60)
     print("WTI Price Alert Monitor - Real-time Check")
-    print(f"Time: {datetime.now(TZ).strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    print(f"Time: {datetime.now(settings.TZ).strftime('%Y-%m-%d %H:%M:%S %Z')}")
     print("="*60)
     
     # ตรวจสอบ config
-    if not LINE_CHANNEL_ACCESS_TOKEN:
-        print("[ERROR] LINE_CHANNEL_ACCESS_TOKEN is required")
-        return 1
-    
-    if not EIA_API_KEY:
-        print("[ERROR] EIA_API_KEY is required")
+    try:
+        settings.validate("LINE_CHANNEL_ACCESS_TOKEN", "EIA_API_KEY")
+    except ConfigError as e:
+        print(f"[ERROR] {str(e)}")
         return 1
     
     # โหลด alert config
@@ -46,8 +49,9 @@ def main():
     try:
         # 1. ดึงราคา WTI
         print("\n[1] Fetching WTI price...")
-        wti_fetcher = WTIFuturesFetcher(api_key=EIA_API_KEY)
-        wti_data = wti_fetcher.get_current_and_futures()
+        with profiler.stage("wti_fetch"):
+            wti_fetcher = WTIFuturesFetcher(api_key=settings.EIA_API_KEY)
+            wti_data = wti_fetcher.get_current_and_futures()
         
         current_price = wti_data.get("current", {}).get("current_price", 0)
         source = wti_data.get("current", {}).get("source", "Unknown")
@@ -68,7 +72,8 @@ def main():
             triggered_alert = alert_config.config["wti_alerts"][0]
             reason = "Test mode enabled"
         else:
-            should_send, triggered_alert, reason = alert_config.should_send_alert(current_price)
+            with profiler.stage("alert_check"):
+                should_send, triggered_alert, reason = alert_config.should_send_alert(current_price)
         
         print(f"[ALERT] Should send: {should_send}")
         print(f"[ALERT] Reason: {reason}")
@@ -77,10 +82,12 @@ def main():
         if should_send:
             print("\n[3] Sending alert...")
             
-            line_sender = LineSender(LINE_CHANNEL_ACCESS_TOKEN)
-            alert_message = WTIPriceAlert.create_alert_message(wti_data, triggered_alert)
+            with profiler.stage("alert_send"):
+                line_sender = LineSender(settings.LINE_CHANNEL_ACCESS_TOKEN)
+                alert_message = WTIPriceAlert.create_alert_message(wti_data, triggered_alert)
+                sent = line_sender.send_message(alert_message)
             
-            if line_sender.send_message(alert_message):
+            if sent:
                 print(f"[SUCCESS] ✓ Alert sent: {triggered_alert['name']}")
                 print(f"           Price: ${current_price:.2f}")
                 print(f"           Threshold: ${triggered_alert['threshold']:.2f}")
@@ -110,6 +117,10 @@ def main():
 if __name__ == "__main__":
     exit_code = main()
     
+    metrics.incr("alert_runs_total", exit_code=exit_code)
+    report_path = metrics.write_report(settings.METRICS_DIR, "wti_alert", settings.METRICS_PROMETHEUS)
+    print(f"\n[METRICS] Report: {report_path}")
+    
     print("\n" + "="*60)
     print(f"Finished with exit code: {exit_code}")
     print("="*60)
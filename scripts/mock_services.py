@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Mock Services
+เซิร์ฟเวอร์จำลอง API ภายนอกที่ระบบเรียกใช้ (สำหรับ load test / ทดสอบแบบ offline)
+
+Endpoints:
+    POST /v2/bot/message/broadcast        LINE Messaging API
+    GET  /v8/finance/chart/<symbol>       Yahoo Finance chart
+    GET  /v2/petroleum/pri/spt/data/      EIA spot price
+    POST /openai/v1/chat/completions      Groq chat completions
+    GET  /rss/search                      Google News RSS
+    GET  /_stats                          จำนวน request แยกตาม endpoint/status
+
+Usage:
+    python scripts/mock_services.py --port 8900 --latency-ms 50 --error-rate 0.01 --rate-limit-rate 0.02
+
+    LINE_API_BASE_URL=http://127.0.0.1:8900 \\
+    YAHOO_CHART_BASE_URL=http://127.0.0.1:8900 \\
+    EIA_API_BASE_URL=http://127.0.0.1:8900/v2 \\
+    GNEWS_BASE_URL=http://127.0.0.1:8900 \\
+    GROQ_ENDPOINT=http://127.0.0.1:8900/openai/v1/chat/completions \\
+    python main.py
+"""
+
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+# หัวข้อข่าวตัวอย่างสำหรับ RSS
+HEADLINES_TH = [
+    "กกพ. เคาะค่าไฟงวดใหม่ {n} สตางค์ต่อหน่วย",
+    "ปตท.สผ. เร่งผลิตก๊าซแหล่งเอราวัณเพิ่ม {n} ล้านลูกบาศก์ฟุต",
+    "กระทรวงพลังงานเปิดประมูลโรงไฟฟ้าพลังงานทดแทน {n} เมกะวัตต์",
+    "ราคาน้ำมันดิบปรับขึ้น {n} ดอลลาร์ ตามตลาดโลก",
+    "บางจากลงทุนโครงการ LNG มูลค่า {n} ล้านบาท",
+]
+HEADLINES_EN = [
+    "Vietnam approves {n} MW LNG-to-power project",
+    "Malaysia's Petronas signs gas deal worth ${n} million",
+    "Indonesia grid operator adds {n} MW of solar capacity",
+    "Thailand electricity tariff to fall {n} satang per unit",
+    "Oil prices rise ${n} as supply concerns grow",
+]
+PUBLISHERS = [
+    ("Reuters", "https://www.reuters.com"),
+    ("Bangkok Post", "https://www.bangkokpost.com"),
+    ("ประชาชาติธุรกิจ", "https://www.prachachat.net"),
+    ("ฐานเศรษฐกิจ", "https://www.thansettakij.com"),
+]
+
+
+class MockConfig:
+    """พฤติกรรมของ mock server"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, rss_items: int = 30, padding_bytes: int = 0,
+                 seed: int = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rss_items = rss_items
+        self.padding_bytes = padding_bytes
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+    def delay(self) -> float:
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(self.latency_ms + jitter, 0.0) / 1000.0
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """จัดการ request ของทุก endpoint"""
+
+    server_version = "AutoNewsMock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # ------------------------------------------------------------------ dispatch
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        path, query = parts.path, parse_qs(parts.query)
+        body = self._read_body()
+
+        if method == "GET" and path == "/_stats":
+            return self._send_json(200, self.server.stats_snapshot(), count=False)
+
+        routes = [
+            ("POST", "/v2/bot/message/broadcast", "line", self._line_broadcast),
+            ("GET", "/v8/finance/chart/", "yahoo", self._yahoo_chart),
+            ("GET", "/v2/petroleum/pri/spt/data", "eia", self._eia_spot),
+            ("POST", "/openai/v1/chat/completions", "groq", self._groq_chat),
+            ("GET", "/rss/search", "gnews", self._gnews_rss),
+        ]
+        for route_method, prefix, endpoint, handler in routes:
+            if method == route_method and path.startswith(prefix):
+                self.endpoint = endpoint
+                break
+        else:
+            self.endpoint = "unknown"
+            return self._send_json(404, {"message": f"No mock for {method} {path}"})
+
+        config = self.server.config
+        time.sleep(config.delay())
+
+        roll = config.roll()
+        if roll < config.rate_limit_rate:
+            return self._send_json(429, {"message": "Too Many Requests"}, headers={"Retry-After": "1"})
+        if roll < config.rate_limit_rate + config.error_rate:
+            return self._send_json(500, {"message": "Internal Server Error"})
+
+        handler(path, query, body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    # ------------------------------------------------------------------ endpoints
+    def _line_broadcast(self, path, query, body):
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self._send_json(401, {"message": "Authentication failed"})
+        try:
+            messages = json.loads(body or b"{}").get("messages")
+        except ValueError:
+            return self._send_json(400, {"message": "The request body has 1 error(s)"})
+        if not messages or len(messages) > 5:
+            return self._send_json(400, {"message": "Size must be between 1 and 5"})
+        self._send_json(200, {})
+
+    def _yahoo_chart(self, path, query, body):
+        symbol = path.rsplit("/", 1)[-1]
+        price = self._price_for(symbol)
+        self._send_json(200, {
+            "chart": {
+                "result": [{
+                    "meta": {
+                        "symbol": symbol,
+                        "currency": "USD",
+                        "regularMarketPrice": price,
+                        "chartPreviousClose": round(price - 0.42, 2),
+                    },
+                    "timestamp": [],
+                    "indicators": {"quote": [{}]},
+                }],
+                "error": None,
+            }
+        })
+
+    def _eia_spot(self, path, query, body):
+        if not query.get("api_key"):
+            return self._send_json(403, {"error": {"code": "API_KEY_MISSING"}})
+        period = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+        self._send_json(200, {
+            "response": {
+                "total": 1,
+                "data": [{"period": period, "product": "EPCWTI", "value": str(self._price_for("EPCWTI"))}],
+            }
+        })
+
+    def _groq_chat(self, path, query, body):
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            return self._send_json(400, {"error": {"message": "invalid JSON"}})
+        prompt = " ".join(str(m.get("content", "")) for m in request.get("messages", []))
+        self._send_json(200, {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": prompt[:150] or "สรุปข่าว"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": 40, "total_tokens": len(prompt) // 4 + 40},
+        })
+
+    def _gnews_rss(self, path, query, body):
+        q = query.get("q", [""])[0]
+        thai = query.get("hl", ["en"])[0] == "th"
+        headlines = HEADLINES_TH if thai else HEADLINES_EN
+        rng = random.Random(hashlib.md5(q.encode("utf-8")).hexdigest())
+        now = datetime.now(timezone.utc)
+
+        items = []
+        for i in range(self.server.config.rss_items):
+            title = rng.choice(headlines).format(n=rng.randint(2, 900))
+            publisher, site = rng.choice(PUBLISHERS)
+            published = now - timedelta(minutes=rng.randint(5, 72 * 60))
+            article_id = hashlib.sha1(f"{q}-{i}".encode("utf-8")).hexdigest()
+            link = f"https://news.google.com/rss/articles/MOCK{article_id}?oc=5"
+            description = f'<a href="{link}" target="_blank">{escape(title)}</a>&nbsp;&nbsp;<font color="#6f6f6f">{escape(publisher)}</font>'
+            items.append(
+                "<item>"
+                f"<title>{escape(title)} - {escape(publisher)}</title>"
+                f"<link>{link}</link>"
+                f'<guid isPermaLink="false">MOCK{article_id}</guid>'
+                f"<pubDate>{format_datetime(published)}</pubDate>"
+                f"<description>{escape(description)}</description>"
+                f'<source url="{site}">{escape(publisher)}</source>'
+                "</item>"
+            )
+
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+            f"<title>\"{escape(q)}\" - Google News</title>"
+            "<link>https://news.google.com/</link>"
+            + "".join(items) +
+            f"<!--{self._padding()}-->"
+            "</channel></rss>"
+        )
+        self._send(200, xml.encode("utf-8"), "application/rss+xml; charset=utf-8")
+
+    # ------------------------------------------------------------------ helpers
+    def _price_for(self, symbol: str) -> float:
+        """ราคาคงที่ต่อ symbol (ผลเหมือนเดิมทุกครั้ง)"""
+        offset = int(hashlib.md5(symbol.encode("utf-8")).hexdigest()[:4], 16) % 400
+        return round(58.0 + offset / 100, 2)
+
+    def _padding(self) -> str:
+        return " " * self.server.config.padding_bytes
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None, count: bool = True):
+        body = json.dumps(payload, ensure_ascii=False)
+        if count and self.server.config.padding_bytes and status == 200:
+            body = body + self._padding()
+        self._send(status, body.encode("utf-8"), "application/json; charset=utf-8", headers, count)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None, count: bool = True):
+        if count:
+            self.server.count(getattr(self, "endpoint", "unknown"), status)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class MockServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer ที่เก็บ config และสถิติ"""
+
+    daemon_threads = True
+    request_queue_size = 512
+
+    def __init__(self, address, config: MockConfig, verbose: bool = False):
+        super().__init__(address, MockHandler)
+        self.config = config
+        self.verbose = verbose
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def count(self, endpoint: str, status: int):
+        with self._stats_lock:
+            self._stats[f"{endpoint}:{status}"] += 1
+
+    def stats_snapshot(self) -> dict:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def service_env(self) -> dict:
+        """environment variables ที่ชี้ทุก service มาที่ server นี้"""
+        return {
+            "LINE_API_BASE_URL": self.base_url,
+            "YAHOO_CHART_BASE_URL": self.base_url,
+            "EIA_API_BASE_URL": f"{self.base_url}/v2",
+            "GNEWS_BASE_URL": self.base_url,
+            "GROQ_ENDPOINT": f"{self.base_url}/openai/v1/chat/completions",
+        }
+
+
+def start_mock_server(config: MockConfig = None, host: str = "127.0.0.1", port: int = 0,
+                      verbose: bool = False) -> MockServer:
+    """เริ่ม mock server ใน background thread (port=0 = เลือก port ว่างอัตโนมัติ)"""
+    server = MockServer((host, port), config or MockConfig(), verbose)
+    threading.Thread(target=server.serve_forever, name="mock-services", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="เวลาตอบกลับเฉลี่ย (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="ความแปรปรวนของเวลาตอบกลับ (+/- ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="สัดส่วน response 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="สัดส่วน response 429")
+    parser.add_argument("--rss-items", type=int, default=30, help="จำนวนข่าวต่อ RSS feed")
+    parser.add_argument("--padding-bytes", type=int, default=0, help="เพิ่มขนาด response สำเร็จ (bytes)")
+    parser.add_argument("--seed", type=int, help="seed สำหรับ error/latency (ผลซ้ำได้)")
+    parser.add_argument("--verbose", action="store_true", help="แสดง access log")
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, rss_items=args.rss_items,
+        padding_bytes=args.padding_bytes, seed=args.seed,
+    )
+    server = MockServer((args.host, args.port), config, args.verbose)
+
+    print(f"[MOCK] listening on {server.base_url}")
+    for name, value in server.service_env().items():
+        print(f"  {name}={value}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[MOCK] stats: {json.dumps(server.stats_snapshot())}")
+
+
+if __name__ == "__main__":
+    main()
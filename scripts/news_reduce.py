@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+News Reduce
+รวมไฟล์ผลลัพธ์จาก scripts/news_shard.py ทุก shard แล้ว dedup รวม
+(EnhancedDeduplication ตามลำดับ feed/entry ของ FEEDS) สร้าง carousel และส่ง LINE ทีเดียว
+
+Usage:
+    python scripts/news_reduce.py shards/
+    python scripts/news_reduce.py shards/shard-0.json.gz shards/shard-1.json.gz --wti
+"""
+
+import os
+import sys
+import argparse
+
+# เพิ่ม path เพื่อให้ import ได้
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings, ConfigError
+from services.news_processor import NewsProcessor
+from services.news_shards import ShardFormatError, read_shard, merge_shards
+from services.line_sender import LineSender
+from builders.news_message import NewsMessageBuilder
+from utils.storage import append_sent_link
+from utils.metrics import metrics
+
+
+def _shard_paths(inputs: list) -> list:
+    """ไฟล์ shard จาก argument (ไฟล์ หรือโฟลเดอร์ที่มี *.json / *.json.gz)"""
+    paths = []
+    for path in inputs:
+        if os.path.isdir(path):
+            paths.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.endswith(".json") or name.endswith(".json.gz")
+            )
+        else:
+            paths.append(path)
+    return paths
+
+
+def _send_news(line_sender: LineSender, label: str, news_items: list, trends: list = None):
+    """ส่ง carousel ของข่าวหนึ่งกลุ่ม -> True/False (None = ไม่มีข่าว)"""
+    if not news_items:
+        return None
+    message = NewsMessageBuilder.create_carousel_message(news_items, trends)
+    if not message:
+        return None
+    if line_sender.send_message(message):
+        print(f"   ✓ ส่ง{label}สำเร็จ")
+        return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="ไฟล์ shard หรือโฟลเดอร์ที่เก็บไฟล์ shard")
+    parser.add_argument("--allow-missing", action="store_true", help="รวมผลแม้ shard ไม่ครบ")
+    parser.add_argument("--wti", action="store_true", help="ส่งข้อมูล WTI Futures ต่อท้าย (เหมือน main.py)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("News Reduce - รวมผลจากทุก shard")
+    print("=" * 60)
+
+    try:
+        settings.validate("LINE_CHANNEL_ACCESS_TOKEN", *(["EIA_API_KEY"] if args.wti else []))
+        shard_data = [read_shard(path) for path in _shard_paths(args.inputs)]
+        items, filter_stats = merge_shards(shard_data, allow_missing=args.allow_missing)
+    except (ConfigError, ShardFormatError) as e:
+        print(f"[ERROR] {str(e)}")
+        return 1
+
+    print(f"\n[REDUCE] {len(shard_data)} shards, รวมข่าวที่ประมวลผล: {filter_stats['total_processed']}")
+    print(f"[REDUCE] ผ่านการกรองใน shard: {len(items)} ข่าว")
+
+    processor = NewsProcessor()
+    news_items = processor.merge_items(items)
+    unique_count = processor.filter_stats['filtered_by']['passed']
+    metrics.incr("news_reduce_items_total", len(items), result="input")
+    metrics.incr("news_reduce_items_total", unique_count, result="unique")
+    print(f"[REDUCE] ไม่ซ้ำหลัง dedup รวม: {unique_count} ข่าว")
+    print(f"[REDUCE] เลือกส่ง (คะแนนสูงสุด): {len(news_items)} ข่าว")
+    if processor.trends:
+        print(f"[REDUCE] หัวข้อมาแรง: {', '.join(f'{trend.keyword} x{trend.ratio:g}' for trend in processor.trends)}")
+
+    trends = processor.trends if settings.TREND_BUBBLE else None
+    country_news = [item for item in news_items if item.get('country') and item.get('country') != 'International']
+    country_news = country_news[:NewsMessageBuilder.news_limit(trends)]
+    international_news = [item for item in news_items if item.get('country') == 'International']
+
+    line_sender = LineSender(settings.LINE_CHANNEL_ACCESS_TOKEN)
+    sends = [
+        _send_news(line_sender, "ข่าวประเทศเฉพาะ", country_news, trends),
+        _send_news(line_sender, "ข่าวระดับโลก", international_news),
+    ]
+
+    if args.wti:
+        from services.wti_fetcher import WTIFuturesFetcher
+        from builders.wti_message import WTIMessageBuilder
+        try:
+            wti_data = WTIFuturesFetcher(api_key=settings.EIA_API_KEY).get_current_and_futures()
+            sends.append(line_sender.send_message(WTIMessageBuilder.create_wti_futures_message(wti_data)))
+        except Exception as e:
+            print(f"   ✗ WTI ERROR: {str(e)}")
+            sends.append(False)
+
+    if (country_news or international_news) and not settings.DRY_RUN:
+        for item in country_news + international_news:
+            append_sent_link(item.get('canon_url') or item.get('url'))
+        processor.dedup.save_event_index(country_news + international_news)
+        processor.save_trends()
+        print("\n[SUCCESS] อัปเดตฐานข้อมูลข่าวที่ส่งแล้ว")
+
+    report_path = metrics.write_report(settings.METRICS_DIR, "news_reduce", settings.METRICS_PROMETHEUS)
+    print(f"\n[METRICS] บันทึกรายงาน: {report_path}")
+
+    success_count = sum(1 for sent in sends if sent is True)
+    total_messages = sum(1 for sent in sends if sent is not None)
+    print("\n" + "=" * 60)
+    print(f"ดำเนินการเสร็จสิ้น - ส่งสำเร็จ {success_count}/{total_messages} ข้อความ")
+    print(f"  • ข่าวประเทศเฉพาะ: {len(country_news)} ข่าว")
+    print(f"  • ข่าวระดับโลก: {len(international_news)} ข่าว")
+    print("=" * 60)
+    return 0 if success_count == total_messages else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
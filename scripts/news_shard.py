@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+News Shard (map)
+ดึงและกรองข่าวเฉพาะ FEEDS[shard::shards] แล้วเขียนผลเป็นไฟล์ shard
+ให้ scripts/news_reduce.py รวมผล dedup และส่ง LINE ทีเดียว
+
+--no-local-dedup: ไม่ dedup ใน shard (ไฟล์ใหญ่ขึ้น แต่ผลของ reduce
+เหมือนการรัน main.py บน runner เดียวทุกประการ)
+
+Usage:
+    python scripts/news_shard.py --shard 0 --shards 3 --output shards/shard-0.json.gz
+"""
+
+import os
+import sys
+import argparse
+
+# เพิ่ม path เพื่อให้ import ได้
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from services.news_processor import NewsProcessor
+from services.news_shards import select_feeds, item_to_record, write_shard
+from utils.metrics import metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shard", type=int, required=True, help="ลำดับ shard (เริ่มที่ 0)")
+    parser.add_argument("--shards", type=int, required=True, help="จำนวน shard ทั้งหมด")
+    parser.add_argument("--output", required=True, help="ไฟล์ผลลัพธ์ (.json หรือ .json.gz)")
+    parser.add_argument("--no-local-dedup", action="store_true", help="ไม่ dedup ใน shard")
+    args = parser.parse_args()
+
+    try:
+        feeds = select_feeds(args.shard, args.shards)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print("=" * 60)
+    print(f"News Shard {args.shard + 1}/{args.shards}: {len(feeds)} feeds")
+    print("=" * 60)
+
+    local_dedup = not args.no_local_dedup
+    processor = NewsProcessor(deduplicate=local_dedup)
+    records = [
+        item_to_record(news_item, feeds[feed_index][0], entry_index)
+        for feed_index, entry_index, news_item in processor.filter_feeds([feed for _, feed in feeds])
+    ]
+    processor.record_filter_metrics()
+
+    write_shard(args.output, args.shard, args.shards, feeds, records, processor.filter_stats, local_dedup)
+
+    print(f"\n[SHARD] รวมข่าวที่ประมวลผล: {processor.filter_stats['total_processed']}")
+    print(f"[SHARD] ผ่านการกรอง: {len(records)} -> {args.output}")
+
+    report_path = metrics.write_report(settings.METRICS_DIR, f"news_shard_{args.shard}", settings.METRICS_PROMETHEUS)
+    print(f"[METRICS] บันทึกรายงาน: {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
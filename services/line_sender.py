@@ -5,14 +5,15 @@ LINE Sender Service
 """
 
 import json
-import requests
-from config.settings import LINE_CHANNEL_ACCESS_TOKEN, DRY_RUN
+from config.settings import settings
+from utils import http_client
 
 class LineSender:
     """ส่งข้อความผ่าน LINE"""
     
-    def __init__(self, access_token: str = None):
-        self.access_token = access_token or LINE_CHANNEL_ACCESS_TOKEN
+    def __init__(self, access_token: str = None, api_base_url: str = None):
+        self.access_token = access_token or settings.LINE_CHANNEL_ACCESS_TOKEN
+        self.api_base_url = api_base_url or settings.LINE_API_BASE_URL
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
@@ -20,18 +21,19 @@ class LineSender:
     
     def send_message(self, message_obj: dict) -> bool:
         """ส่งข้อความไปยัง LINE"""
-        if DRY_RUN:
+        if settings.DRY_RUN:
             print("\n" + "="*60)
             print("DRY RUN - Would send message")
             print("="*60)
             print(json.dumps(message_obj, indent=2, ensure_ascii=False)[:500])
             return True
         
-        url = "https://api.line.me/v2/bot/message/broadcast"
+        url = f"{self.api_base_url}/v2/bot/message/broadcast"
         
         try:
-            response = requests.post(
+            response = http_client.post(
                 url,
+                service="line",
                 headers=self.headers,
                 json={"messages": [message_obj]},
                 timeout=30
@@ -5,42 +5,59 @@ News Processor Service
 """
 
 import time
-import feedparser
 from datetime import datetime, timedelta
-from dateutil import parser as dateutil_parser
+from types import SimpleNamespace
 
-from config.settings import (
-    TZ, MAX_PER_FEED, WINDOW_HOURS, DEBUG_FILTERING,
-    USE_LLM_SUMMARY, GROQ_API_KEY, GROQ_MODEL, GROQ_ENDPOINT
-)
-from data.feeds import FEEDS
-from data.projects import PROJECTS_BY_COUNTRY
+from config.settings import settings
+from data.feeds import get_feeds
+from data.news_item import NewsItem
 from filters.keyword_filter import KeywordFilter
 from filters.deduplication import EnhancedDeduplication
+from filters.text_analysis import AnalyzedText, analyze_item
+from filters.verdict_cache import VerdictCache, entry_key
+from filters.project_matcher import get_project_matcher
+from filters.relevance import RelevanceScorer, select_top
+from filters.keyword_trends import KeywordTrends, trend_keywords
 from utils.storage import read_sent_links
-from utils.url_utils import normalize_url, shorten_google_news_url, extract_domain
-from utils.text_utils import create_simple_summary
+from utils.url_utils import normalize_url, shorten_google_news_url, publisher_domain
+from utils.date_utils import parse_entry_datetime
+from utils.summarizer import summarize_batch
 from utils.html_utils import clean_google_news_text  # ← เพิ่มบรรทัดนี้
+from utils.metrics import metrics
+from utils import http_client
+
+# field ของ feedparser entry ที่ _parse_entry ใช้ (ส่งให้ worker process)
+ENTRY_FIELDS = ("title", "link", "summary", "published", "updated", "published_parsed", "source")
+
+
+def _entry_fields(entry) -> SimpleNamespace:
+    """คัดเฉพาะ field ที่ใช้ เพื่อให้ส่งข้าม process ได้ (pickle)"""
+    return SimpleNamespace(**{name: getattr(entry, name) for name in ENTRY_FIELDS if hasattr(entry, name)})
+
+
+def _classify_chunk(entries: list, feed_name: str, feed_type: str) -> list:
+    """(worker process) parse + ตรวจคำสำคัญ/ประเทศ ของ entries หนึ่งชุด"""
+    return [NewsProcessor._parse_and_classify(entry, feed_name, feed_type) for entry in entries]
 
-# News sources mapping
-NEWS_SOURCES = {
-    'reuters.com': 'Reuters',
-    'bloomberg.com': 'Bloomberg',
-    'bangkokpost.com': 'Bangkok Post',
-    'thansettakij.com': 'ฐานเศรษฐกิจ',
-    'posttoday.com': 'Post Today',
-    'prachachat.net': 'ประชาชาติธุรกิจ',
-    'mgronline.com': 'ผู้จัดการออนไลน์',
-    'komchadluek.net': 'คมชัดลึก',
-    'nationthailand.com': 'The Nation Thailand',
-}
 
 class NewsProcessor:
     """ประมวลผลและกรองข่าว"""
     
-    def __init__(self):
+    # เพิ่มเลขนี้เมื่อเปลี่ยนวิธี parse entry (HTML cleaning, URL, วันที่) เพื่อล้าง verdict cache
+    PARSE_VERSION = 3
+    
+    def __init__(self, deduplicate: bool = True):
+        """
+        Args:
+            deduplicate: ตรวจข่าวซ้ำ (Filter 7) ระหว่างกรอง (False = ให้ขั้นตอน reduce ทำทีเดียว)
+        """
         self.sent_links = read_sent_links()
         self.dedup = EnhancedDeduplication()
+        self.deduplicate = deduplicate
+        self.verdict_cache = VerdictCache.from_settings(self.rules_version())
+        self.keyword_trends = KeywordTrends.from_settings()
+        self.trends = []
+        self._window_start = None
         self.filter_stats = {
             'total_processed': 0,
             'filtered_by': {
@@ -56,41 +73,221 @@ class NewsProcessor:
             }
         }
     
-    def fetch_and_filter_news(self):
-        """ดึงและกรองข่าวจากทุก feeds"""
-        all_news = []
+    def fetch_and_filter_news(self, feeds: list = None):
+        """
+        ดึงและกรองข่าวจากทุก feeds (หรือเฉพาะ feeds ที่ระบุ)
+
+        PROCESS_WORKERS > 0: parse และตรวจคำสำคัญ/ประเทศใน process pool
+        ส่วนการเช็คข่าวที่ส่งแล้ว ช่วงเวลา และ dedup ทำใน process หลักตามลำดับ feed/entry เดิม
+        ผลลัพธ์จึงเหมือนกับการทำงานแบบ process เดียว
+
+        คืนเฉพาะข่าวที่จะส่ง (คะแนนสูงสุดไม่เกิน BUBBLES_PER_CAROUSEL ข่าวต่อกลุ่ม ดู finalize_items)
+        """
+        all_news = [news_item for _, _, news_item in self.filter_feeds(get_feeds() if feeds is None else feeds)]
+        self.record_filter_metrics()
+        return self.finalize_items(all_news)
+    
+    def filter_feeds(self, feeds: list):
+        """
+        ดึงและกรองข่าวของ feeds ตามลำดับ
         
-        for feed_name, feed_type, feed_url in FEEDS:
-            print(f"\n[Fetching] {feed_name} ({feed_type})...")
-            
+        Yields:
+            (ลำดับ feed ใน feeds, ลำดับ entry ใน feed, NewsItem) ของข่าวที่ผ่านทุก filter
+        """
+        # เวลาเริ่มของช่วงข่าว คำนวณครั้งเดียวต่อรอบ
+        self._window_start = self._window_start_time()
+        
+        if settings.PROCESS_WORKERS > 0:
+            classified_feeds = self._classify_feeds_parallel(
+                feeds, settings.PROCESS_WORKERS, settings.PROCESS_CHUNK_SIZE
+            )
+        else:
+            classified_feeds = self._classify_feeds_serial(feeds)
+        
+        for feed_index, (feed_name, feed_type, results) in enumerate(classified_feeds):
             try:
-                entries = self._fetch_feed_with_retry(feed_name, feed_url)
-                
-                for entry in entries[:MAX_PER_FEED]:
+                for entry_index, (item, classified) in enumerate(results):
                     self.filter_stats['total_processed'] += 1
-                    news_item, filter_reason = self._process_entry(entry, feed_name, feed_type)
+                    with metrics.span("entry_process", feed=feed_name):
+                        news_item, filter_reason = self._filter_item(item, feed_type, classified)
                     
                     if news_item:
-                        all_news.append(news_item)
                         self.filter_stats['filtered_by']['passed'] += 1
                         print(f"  ✓ {news_item['title'][:50]}...")
-                    elif filter_reason and DEBUG_FILTERING:
+                        yield feed_index, entry_index, news_item
+                    elif filter_reason and settings.DEBUG_FILTERING:
                         print(f"  ✗ {filter_reason}")
                         
             except Exception as e:
+                metrics.incr("feed_errors_total", feed=feed_name)
                 print(f"  ✗ Error: {str(e)}")
         
-        # Sort by published date
-        all_news.sort(key=lambda x: -((x.get('published_dt') or datetime.min).timestamp()))
+        if self.verdict_cache is not None:
+            self.verdict_cache.save()
+            print(f"\n[CACHE] verdict cache: ใช้ผลเดิม {self.verdict_cache.hits} entries, "
+                  f"ประมวลผลใหม่ {self.verdict_cache.misses} entries")
+    
+    @classmethod
+    def rules_version(cls) -> str:
+        """เวอร์ชันของกฎการ parse/กรอง (ใช้ตรวจว่า verdict cache ยังใช้ได้)"""
+        return f"{KeywordFilter.rules_version()}-p{cls.PARSE_VERSION}"
+    
+    def record_filter_metrics(self):
+        """บันทึกสถิติการกรองลง metrics"""
+        metrics.incr("news_entries_total", self.filter_stats['total_processed'])
+        for reason, count in self.filter_stats['filtered_by'].items():
+            metrics.incr("news_filter_total", count, reason=reason)
+    
+    def merge_items(self, items: list) -> list:
+        """
+        dedup ข่าวที่ผ่าน filter มาแล้ว (เช่น จากหลาย shard) ตามลำดับที่ให้มา
+        แล้วเลือกและสรุปแบบเดียวกับ fetch_and_filter_news (จำนวนข่าวที่ไม่ซ้ำอยู่ใน filter_stats)
+        """
+        kept = [item for item in items if self.dedup.add_item(item)]
+        self.filter_stats['total_processed'] += len(items)
+        self.filter_stats['filtered_by']['duplicate'] += len(items) - len(kept)
+        self.filter_stats['filtered_by']['passed'] += len(kept)
+        return self.finalize_items(kept)
+    
+    def finalize_items(self, items) -> list:
+        """
+        เลือกข่าวคะแนนสูงสุดไม่เกิน BUBBLES_PER_CAROUSEL ข่าวต่อกลุ่ม (ข่าวประเทศเฉพาะ / ข่าวระดับโลก)
+        แล้วสรุปทีเดียวทั้ง batch เฉพาะข่าวที่เลือก
+        ข่าวที่ไม่ซ้ำทั้งหมดถูกนับเข้า keyword trends (คำที่มาแรงอยู่ใน self.trends)
+        
+        Returns:
+            ข่าวประเทศเฉพาะ ตามด้วยข่าวระดับโลก (แต่ละกลุ่มเรียงคะแนนจากมากไปน้อย)
+        """
+        items = list(items)
+        self.trends = self._update_trends(items)
+        selected = select_top(items, settings.BUBBLES_PER_CAROUSEL)
+        for group, group_items in selected.items():
+            metrics.incr("news_selected_total", len(group_items), group=group)
+        items = selected['country'] + selected['international']
+        self._summarize_items(items)
+        return items
+    
+    def _update_trends(self, items: list) -> list:
+        """นับคำสำคัญของข่าวเข้า keyword trends แล้วคืนคำที่มาแรง (ไม่ได้ตั้ง TREND_FILE = [])"""
+        if self.keyword_trends is None:
+            return []
+        with metrics.span("trend_update"):
+            observed = sum(
+                1 for item in items
+                if self.keyword_trends.observe(trend_keywords(analyze_item(item)), item.get('published_dt'))
+            )
+            trends = self.keyword_trends.spikes(
+                self._reference_time(), settings.TREND_SPIKE_RATIO, settings.TREND_MIN_COUNT
+            )
+        metrics.incr("trend_items_total", observed)
+        metrics.incr("trend_spikes_total", len(trends))
+        return trends
+    
+    def save_trends(self):
+        """บันทึก keyword trends (เมื่อตั้ง TREND_FILE)"""
+        if self.keyword_trends is not None:
+            self.keyword_trends.save(settings.TREND_FILE)
+    
+    def _summarize_items(self, items: list):
+        """สรุปข่าวแบบ extractive ทีเดียวทั้ง batch (สำหรับข่าวที่ไม่มี LLM summary)"""
+        pending = [item for item in items if not item.get('llm_summary')]
+        if not pending:
+            return
+        
+        texts = [f"{item['title']} {item['summary']}" for item in pending]
+        with metrics.span("summarize_batch"):
+            summaries = summarize_batch(texts, 100)
+        metrics.incr("summarized_items_total", len(pending))
+        
+        for item, summary in zip(pending, summaries):
+            item['simple_summary'] = summary
+    
+    def _fetch_entries(self, feed_name: str, feed_type: str, feed_url: str) -> list:
+        """ดึง entries ของ feed หนึ่ง (ไม่เกิน MAX_PER_FEED, error = ไม่มี entries)"""
+        print(f"\n[Fetching] {feed_name} ({feed_type})...")
+        try:
+            with metrics.span("feed_fetch", feed=feed_name):
+                entries = self._fetch_feed_with_retry(feed_name, feed_url)
+        except Exception as e:
+            metrics.incr("feed_errors_total", feed=feed_name)
+            print(f"  ✗ Error: {str(e)}")
+            return []
+        metrics.incr("feed_entries_total", len(entries), feed=feed_name)
+        return entries[:settings.MAX_PER_FEED]
+    
+    def _classify_feeds_serial(self, feeds: list):
+        """ดึงทีละ feed แล้ว parse ทีละ entry (ตรวจคำสำคัญภายหลังใน _filter_item)"""
+        for feed_name, feed_type, feed_url in feeds:
+            entries = self._fetch_entries(feed_name, feed_type, feed_url)
+            if self.verdict_cache is None:
+                yield feed_name, feed_type, (
+                    (self._parse_entry(entry, feed_name, feed_type), None) for entry in entries
+                )
+            else:
+                yield feed_name, feed_type, (
+                    self._parse_cached(entry, feed_name, feed_type) for entry in entries
+                )
+    
+    def _parse_cached(self, entry, feed_name: str, feed_type: str) -> tuple:
+        """ผลจาก verdict cache หรือ parse + ตรวจคำสำคัญใหม่แล้วเก็บลง cache"""
+        key = entry_key(entry)
+        cached = self.verdict_cache.get(key, feed_name, feed_type)
+        if cached is not None:
+            return cached
+        result = self._parse_and_classify(entry, feed_name, feed_type)
+        self.verdict_cache.put(key, *result)
+        return result
+    
+    def _classify_feeds_parallel(self, feeds: list, workers: int, chunk_size: int):
+        """
+        ดึงทีละ feed และส่ง entries เป็นชุดให้ process pool ทันที (ทำงานซ้อนกับการดึง feed ถัดไป)
+        แล้วคืนผลตามลำดับ feed/entry เดิม (entry ที่มีใน verdict cache ไม่ต้องส่งให้ worker)
+        """
+        from concurrent.futures import ProcessPoolExecutor
         
-        return all_news
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            submitted = []
+            for feed_name, feed_type, feed_url in feeds:
+                entries = self._fetch_entries(feed_name, feed_type, feed_url)
+                if self.verdict_cache is None:
+                    keys, cached = [None] * len(entries), [None] * len(entries)
+                else:
+                    keys = [entry_key(entry) for entry in entries]
+                    cached = [self.verdict_cache.get(key, feed_name, feed_type) for key in keys]
+                misses = [_entry_fields(entry) for entry, hit in zip(entries, cached) if hit is None]
+                futures = [
+                    pool.submit(_classify_chunk, misses[i:i + chunk_size], feed_name, feed_type)
+                    for i in range(0, len(misses), chunk_size)
+                ]
+                submitted.append((feed_name, feed_type, keys, cached, futures))
+            
+            for feed_name, feed_type, keys, cached, futures in submitted:
+                yield feed_name, feed_type, self._merge_cached(keys, cached, futures)
+    
+    def _merge_cached(self, keys: list, cached: list, futures: list):
+        """รวมผลจาก cache กับผลจาก worker ตามลำดับ entry เดิม (ผลใหม่เก็บลง cache)"""
+        computed = (result for future in futures for result in future.result())
+        for key, hit in zip(keys, cached):
+            if hit is not None:
+                yield hit
+                continue
+            result = next(computed)
+            if self.verdict_cache is not None:
+                self.verdict_cache.put(key, *result)
+            yield result
     
     def _fetch_feed_with_retry(self, name: str, url: str, retries: int = 3):
         """ดึง feed พร้อมระบบ retry"""
+        import feedparser  # import เมื่อใช้งาน (โมดูลใหญ่ ไม่ต้องโหลดตอน startup)
+        
         for attempt in range(retries):
             try:
                 print(f"[FEED] ดึงข้อมูลจาก {name} (ครั้งที่ {attempt+1}/{retries})...")
-                d = feedparser.parse(url)
+                response = http_client.get(
+                    url, service="gnews", headers={"User-Agent": feedparser.USER_AGENT}, timeout=30
+                )
+                response.raise_for_status()
+                d = feedparser.parse(response.content)
                 entries = d.entries or []
                 print(f"[FEED] {name}: พบ {len(entries)} entries")
                 return entries
@@ -103,9 +300,38 @@ class NewsProcessor:
     
     def _process_entry(self, entry, feed_name: str, feed_type: str):
         """ประมวลผล entry หนึ่งรายการ"""
-        # Parse entry
         item = self._parse_entry(entry, feed_name, feed_type)
+        return self._filter_item(item, feed_type)
+    
+    @staticmethod
+    def _classify(item: dict) -> tuple:
+        """ตรวจคำสำคัญและประเทศ -> (analysis, (is_valid, reason, details), country)"""
+        analysis = AnalyzedText(item['title'], item['summary'])
+        verdict = KeywordFilter.check_valid_energy_news(analysis)
+        country = KeywordFilter.detect_country(analysis) if verdict[0] else None
+        return analysis, verdict, country
+    
+    @classmethod
+    def _parse_and_classify(cls, entry, feed_name: str, feed_type: str) -> tuple:
+        """
+        parse + ตรวจคำสำคัญ/ประเทศ + เตรียมค่าที่ dedup ใช้ (ไม่ขึ้นกับ state ของ processor)
+        ใช้ใน worker process
+        """
+        item = cls._parse_entry(entry, feed_name, feed_type)
+        if not item["title"] or not item["url"]:
+            return item, None
+        classified = cls._classify(item)
+        if classified[1][0]:
+            EnhancedDeduplication.prepare_analysis(classified[0])
+        return item, classified
+    
+    def _filter_item(self, item: dict, feed_type: str, classified: tuple = None):
+        """
+        กรองข่าวที่ parse แล้ว
         
+        Args:
+            classified: ผลของ _classify() ที่คำนวณไว้แล้ว (จาก worker process) หรือ None
+        """
         # Filter 1: ไม่มีหัวข้อ
         if not item["title"]:
             self.filter_stats['filtered_by']['no_title'] += 1
@@ -126,17 +352,19 @@ class NewsProcessor:
             self.filter_stats['filtered_by']['out_of_window'] += 1
             return None, f"เกินเวลา: {item['title'][:30]}..."
         
+        # Filter 4.5: เฉพาะเว็บข่าวที่กำหนด (ALLOWED_NEWS_SOURCES)
+        if settings.ALLOWED_NEWS_SOURCES_LIST and not self._is_allowed_source(item):
+            self.filter_stats['filtered_by']['not_allowed_source'] += 1
+            return None, f"ไม่ใช่เว็บข่าวที่กำหนด: {item['title'][:30]}..."
+        
         # Filter 5: ตรวจสอบคำสำคัญ
-        full_text = f"{item['title']} {item['summary']}"
-        is_valid, reason, details = KeywordFilter.check_valid_energy_news(full_text)
+        analysis, (is_valid, reason, details), country = classified or self._classify(item)
         
         if not is_valid:
             self.filter_stats['filtered_by']['invalid_energy_news'] += 1
             return None, f"{reason}: {item['title'][:30]}..."
         
         # Filter 6: ตรวจสอบประเทศ
-        country = KeywordFilter.detect_country(full_text)
-        
         if not country:
             if feed_type == "direct":
                 country = "Thailand"
@@ -144,84 +372,83 @@ class NewsProcessor:
                 self.filter_stats['filtered_by']['no_country'] += 1
                 return None, f"ไม่พบประเทศที่เกี่ยวข้อง: {item['title'][:30]}..."
         
-        # เพิ่มข้อมูลเพิ่มเติม
-        project_hints = PROJECTS_BY_COUNTRY.get(country, [])[:2]
-        display_url = item["canon_url"] or item["url"]
-        source_name = self._get_source_name(display_url)
-        
-        final_item = {
-            'title': item['title'][:100],
-            'url': item['url'],
-            'canon_url': item['canon_url'],
-            'source_name': source_name,
-            'domain': extract_domain(display_url),
-            'summary': item['summary'][:200],
-            'published_dt': item['published_dt'],
-            'country': country,
-            'project_hints': project_hints,
-            'llm_summary': '',
-            'feed': feed_name,
-            'feed_type': feed_type,
-            'simple_summary': create_simple_summary(full_text, 100)
-        }
+        final_item = self._build_news_item(item, country)
+        
+        # ใช้ผลวิเคราะห์เดิมต่อใน dedup ถ้า title/summary ไม่ถูกตัด
+        if final_item.title == analysis.title and final_item.summary == analysis.summary:
+            final_item['_analysis'] = analysis
         
         # Filter 7: ตรวจสอบซ้ำ
-        if not self.dedup.add_item(final_item):
+        if self.deduplicate and not self.dedup.add_item(final_item):
             self.filter_stats['filtered_by']['duplicate'] += 1
             return None, f"ข่าวซ้ำ: {item['title'][:30]}..."
         
+        final_item.score = RelevanceScorer.score(
+            final_item, analysis, self._reference_time(), settings.RELEVANCE_HALF_LIFE_HOURS
+        )
         return final_item, None
     
-    def _parse_entry(self, e, feed_name: str, section: str):
+    @staticmethod
+    def _parse_entry(e, feed_name: str, section: str):
         """แปลง feedparser entry เป็น dict"""
         # ← แก้ไขส่วนนี้: ทำความสะอาด HTML entities
         title = clean_google_news_text(getattr(e, "title", "") or "")
         link = (getattr(e, "link", "") or "").strip()
         summary = clean_google_news_text(getattr(e, "summary", "") or "")
         published = getattr(e, "published", None) or getattr(e, "updated", None)
-
-        if not published and hasattr(e, 'published_parsed'):
-            try:
-                import time as time_module
-                published = time_module.strftime('%Y-%m-%dT%H:%M:%SZ', e.published_parsed)
-            except:
-                pass
-
-        try:
-            published_dt = dateutil_parser.parse(published) if published else None
-            if published_dt and published_dt.tzinfo is None:
-                published_dt = TZ.localize(published_dt)
-            if published_dt:
-                published_dt = published_dt.astimezone(TZ)
-        except Exception:
-            published_dt = None
+        published_dt = parse_entry_datetime(published, getattr(e, "published_parsed", None), settings.TZ)
 
         canon = shorten_google_news_url(link)
+        source = getattr(e, "source", None) or {}
 
         return {
             "title": title,
             "url": normalize_url(link),
             "canon_url": normalize_url(canon),
             "summary": summary,
+            "source_url": normalize_url(source.get("href", "") or ""),
             "published_dt": published_dt,
             "feed": feed_name,
             "section": section,
         }
     
+    def _window_start_time(self) -> datetime:
+        return http_client.reference_now(settings.TZ) - timedelta(hours=settings.WINDOW_HOURS)
+    
+    def _reference_time(self) -> datetime:
+        """เวลาอ้างอิงของรอบนี้ (ปลายช่วงเวลาข่าว) สำหรับคิดอายุข่าว"""
+        if self._window_start is None:
+            self._window_start = self._window_start_time()
+        return self._window_start + timedelta(hours=settings.WINDOW_HOURS)
+    
     def _in_time_window(self, published_dt: datetime) -> bool:
         """ตรวจสอบว่าอยู่ในช่วงเวลาที่กำหนดหรือไม่"""
         if not published_dt:
             return False
-        return published_dt >= (datetime.now(TZ) - timedelta(hours=WINDOW_HOURS))
+        if self._window_start is None:
+            self._window_start = self._window_start_time()
+        return published_dt >= self._window_start
     
-    def _get_source_name(self, url: str) -> str:
-        """ดึงชื่อเว็บข่าวจาก URL"""
-        domain = extract_domain(url)
-        if not domain:
-            return domain
-        
-        for source_domain, source_name in NEWS_SOURCES.items():
-            if source_domain in domain:
-                return source_name
-        
-        return domain
+    def _build_news_item(self, item: dict, country: str) -> NewsItem:
+        """สร้าง NewsItem จากข่าวที่ผ่าน filter (domain/ชื่อเว็บ/สรุป คำนวณเมื่อใช้งาน)"""
+        return NewsItem(
+            title=item['title'][:100],
+            url=item['url'],
+            canon_url=item['canon_url'],
+            summary=item['summary'][:200],
+            published_dt=item['published_dt'],
+            country=country,
+            project_hints=get_project_matcher().match(f"{item['title']}\n{item['summary']}"),
+            feed=item['feed'],
+            feed_type=item['section'],
+            source_url=item['source_url'],
+        )
+    
+    @staticmethod
+    def _is_allowed_source(item: dict) -> bool:
+        """domain ของผู้เผยแพร่อยู่ใน ALLOWED_NEWS_SOURCES (รวม subdomain)"""
+        domain = publisher_domain(item["canon_url"] or item["url"], item["source_url"])
+        return any(
+            domain == allowed or domain.endswith("." + allowed)
+            for allowed in settings.ALLOWED_NEWS_SOURCES_LIST
+        )
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+News Shards
+แบ่ง FEEDS ให้หลาย runner (shard) ประมวลผล แล้วรวมผล (reduce) ในขั้นตอนเดียว
+
+shard i จาก n ดึงและกรอง FEEDS[i::n] แล้วเขียนไฟล์ผลลัพธ์ (JSON, .gz = gzip)
+ขั้นตอน reduce อ่านไฟล์ของทุก shard เรียงข่าวตามลำดับ (feed, entry) ของ FEEDS
+ซึ่งเป็นลำดับเดียวกับการรันแบบ runner เดียว แล้ว dedup รวมด้วย EnhancedDeduplication
+
+รูปแบบไฟล์:
+    {
+        "format": "auto-news-shard", "version": 1,
+        "shard": 0, "shards": 3, "created_at": "...", "local_dedup": true,
+        "feeds": [{"index": 0, "name": "...", "type": "..."}],
+        "filter_stats": {...},
+        "items": [{"feed_index": 0, "entry_index": 4, "title": "...", ...}]
+    }
+"""
+
+import os
+import gzip
+import json
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+from config.settings import settings
+from data.feeds import get_feeds
+from data.news_item import NewsItem
+
+SHARD_FORMAT = "auto-news-shard"
+SHARD_VERSION = 1
+
+# field ของ NewsItem ที่บันทึก (domain/ชื่อเว็บ/สรุป คำนวณใหม่ตอน reduce)
+ITEM_FIELDS = (
+    'title', 'url', 'canon_url', 'summary', 'country', 'project_hints', 'llm_summary', 'feed', 'feed_type',
+    'source_url', 'score',
+)
+
+# ค่าเริ่มต้นของ field ที่ไม่มีในไฟล์ (ไฟล์ shard ที่เขียนก่อนมี field นั้น)
+_FIELD_DEFAULTS = {'project_hints': [], 'score': 0.0}
+
+
+class ShardFormatError(ValueError):
+    """ไฟล์ shard อ่านไม่ได้ / format หรือ version ไม่ตรง / shard ไม่ครบ"""
+
+
+def select_feeds(shard: int, shards: int, feeds: list = None) -> List[Tuple[int, tuple]]:
+    """feeds ของ shard นี้ -> [(ลำดับใน FEEDS, (name, type, url)), ...]"""
+    if shards < 1 or not 0 <= shard < shards:
+        raise ValueError(f"invalid shard {shard}/{shards}")
+    feeds = get_feeds() if feeds is None else feeds
+    return list(enumerate(feeds))[shard::shards]
+
+
+def item_to_record(item, feed_index: int, entry_index: int) -> dict:
+    """NewsItem -> dict สำหรับไฟล์ shard"""
+    record = {"feed_index": feed_index, "entry_index": entry_index}
+    record.update({name: item.get(name) for name in ITEM_FIELDS})
+    published_dt = item.get('published_dt')
+    record["published"] = published_dt.isoformat() if published_dt else None
+    return record
+
+
+def record_to_item(record: dict) -> NewsItem:
+    """dict จากไฟล์ shard -> NewsItem"""
+    published = record.get("published")
+    return NewsItem(
+        published_dt=datetime.fromisoformat(published).astimezone(settings.TZ) if published else None,
+        **{name: record.get(name) or _FIELD_DEFAULTS.get(name, '') for name in ITEM_FIELDS}
+    )
+
+
+def write_shard(path: str, shard: int, shards: int, feeds: List[Tuple[int, tuple]], records: list,
+                filter_stats: dict, local_dedup: bool = True):
+    """เขียนไฟล์ผลลัพธ์ของ shard"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        "format": SHARD_FORMAT,
+        "version": SHARD_VERSION,
+        "shard": shard,
+        "shards": shards,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "local_dedup": local_dedup,
+        "feeds": [{"index": index, "name": name, "type": feed_type} for index, (name, feed_type, _) in feeds],
+        "filter_stats": filter_stats,
+        "items": records,
+    }
+    opener = gzip.open if path.endswith(".gz") else open
+    tmp_path = f"{path}.tmp"
+    with opener(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def read_shard(path: str) -> dict:
+    """อ่านไฟล์ shard (ตรวจ format/version)"""
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ShardFormatError(f"{path}: อ่านไฟล์ไม่สำเร็จ ({str(e)})")
+    if data.get("format") != SHARD_FORMAT or data.get("version") != SHARD_VERSION:
+        raise ShardFormatError(
+            f"{path}: format {data.get('format')} v{data.get('version')} "
+            f"(ต้องเป็น {SHARD_FORMAT} v{SHARD_VERSION})"
+        )
+    return data
+
+
+def merge_shards(shard_data: list, allow_missing: bool = False) -> Tuple[List[NewsItem], dict]:
+    """
+    รวมข่าวจากทุก shard ตามลำดับ (feed, entry) และรวมสถิติการกรอง
+
+    Raises:
+        ShardFormatError: จำนวน shard ไม่ตรงกัน, shard ซ้ำ หรือ shard ไม่ครบ (ถ้า allow_missing=False)
+    """
+    if not shard_data:
+        raise ShardFormatError("ไม่มีไฟล์ shard")
+
+    shards = {data["shards"] for data in shard_data}
+    if len(shards) != 1:
+        raise ShardFormatError(f"จำนวน shard ไม่ตรงกัน: {sorted(shards)}")
+    total = shards.pop()
+
+    ids = [data["shard"] for data in shard_data]
+    if len(set(ids)) != len(ids):
+        raise ShardFormatError(f"shard ซ้ำ: {sorted(ids)}")
+    missing = sorted(set(range(total)) - set(ids))
+    if missing and not allow_missing:
+        raise ShardFormatError(f"ไม่มีผลของ shard {missing} (จาก {total})")
+
+    records = [record for data in shard_data for record in data["items"]]
+    records.sort(key=lambda record: (record["feed_index"], record["entry_index"]))
+
+    filter_stats = {'total_processed': 0, 'filtered_by': {}}
+    for data in shard_data:
+        stats = data.get("filter_stats", {})
+        filter_stats['total_processed'] += stats.get('total_processed', 0)
+        for reason, count in stats.get('filtered_by', {}).items():
+            filter_stats['filtered_by'][reason] = filter_stats['filtered_by'].get(reason, 0) + count
+
+    return [record_to_item(record) for record in records], filter_stats
@@ -5,17 +5,19 @@ WTI Futures Fetcher
 """
 
 import time
-import requests
 from datetime import datetime, timedelta
 from typing import Tuple, List, Dict
-from config.settings import TZ
+from config.settings import settings
+from utils import http_client
+from utils.metrics import metrics
 
 class WTIFuturesFetcher:
     """ดึงข้อมูลราคา WTI Futures"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, eia_base_url: str = None, yahoo_base_url: str = None):
         self.eia_api_key = api_key
-        self.eia_base_url = "https://api.eia.gov/v2"
+        self.eia_base_url = eia_base_url or settings.EIA_API_BASE_URL
+        self.yahoo_base_url = yahoo_base_url or settings.YAHOO_CHART_BASE_URL
     
     def fetch_futures_from_yahoo(self) -> Tuple[List[Dict], float]:
         """ดึงข้อมูล WTI Futures จาก Yahoo Finance"""
@@ -43,11 +45,11 @@ class WTIFuturesFetcher:
             
             for symbol, month_label in contracts.items():
                 try:
-                    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+                    url = f"{self.yahoo_base_url}/v8/finance/chart/{symbol}"
                     params = {'interval': '1d', 'range': '5d'}
                     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
                     
-                    response = requests.get(url, params=params, headers=headers, timeout=10)
+                    response = http_client.get(url, service="yahoo", params=params, headers=headers, timeout=10)
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -112,7 +114,7 @@ class WTIFuturesFetcher:
         
         try:
             print(f"[WTI/EIA] กำลังดึงราคา WTI Spot Price (Fallback)...")
-            response = requests.get(url, params=params, timeout=15)
+            response = http_client.get(url, service="eia", params=params, timeout=15)
             response.raise_for_status()
             data = response.json()
             
@@ -131,7 +133,7 @@ class WTIFuturesFetcher:
     def _estimate_futures_from_spot(self, spot_price: float) -> List[Dict]:
         """คำนวณ futures จาก spot price"""
         futures_data = []
-        now = datetime.now(TZ)
+        now = datetime.now(settings.TZ)
         monthly_premium = 0.35
         
         for i in range(12):
@@ -150,6 +152,7 @@ class WTIFuturesFetcher:
         
         return futures_data
     
+    @metrics.timed("wti_fetch")
     def get_current_and_futures(self) -> Dict:
         """ดึงข้อมูลราคาปัจจุบันและ futures"""
         print("\n[WTI] กำลังดึงข้อมูลราคา WTI Futures...")
@@ -164,12 +167,12 @@ class WTIFuturesFetcher:
                 "current": {
                     "source": "Yahoo Finance (NYMEX)",
                     "current_price": current_price,
-                    "timestamp": datetime.now(TZ).isoformat(),
+                    "timestamp": datetime.now(settings.TZ).isoformat(),
                     "currency": "USD/barrel",
                     "commodity": "WTI Crude Oil Futures"
                 },
                 "futures": futures_data[:12],
-                "updated_at": datetime.now(TZ).strftime("%d/%m/%Y %H:%M"),
+                "updated_at": datetime.now(settings.TZ).strftime("%d/%m/%Y %H:%M"),
                 "is_estimated": False,
                 "method": "Real-time data from Yahoo Finance (NYMEX)"
             }
@@ -186,12 +189,12 @@ class WTIFuturesFetcher:
                 "current": {
                     "source": f"U.S. EIA Spot Price ({spot_date})",
                     "current_price": spot_price,
-                    "timestamp": datetime.now(TZ).isoformat(),
+                    "timestamp": datetime.now(settings.TZ).isoformat(),
                     "currency": "USD/barrel",
                     "commodity": "WTI Crude Oil (Cushing, OK)"
                 },
                 "futures": futures_data,
-                "updated_at": datetime.now(TZ).strftime("%d/%m/%Y %H:%M"),
+                "updated_at": datetime.now(settings.TZ).strftime("%d/%m/%Y %H:%M"),
                 "is_estimated": True,
                 "method": "EIA spot price + statistical estimation"
             }
@@ -204,12 +207,12 @@ class WTIFuturesFetcher:
             "current": {
                 "source": "Default Estimate",
                 "current_price": default_price,
-                "timestamp": datetime.now(TZ).isoformat(),
+                "timestamp": datetime.now(settings.TZ).isoformat(),
                 "currency": "USD/barrel",
                 "commodity": "WTI Crude Oil"
             },
             "futures": self._estimate_futures_from_spot(default_price),
-            "updated_at": datetime.now(TZ).strftime("%d/%m/%Y %H:%M"),
+            "updated_at": datetime.now(settings.TZ).strftime("%d/%m/%Y %H:%M"),
             "is_estimated": True,
             "method": "Emergency fallback (all sources failed)"
         }
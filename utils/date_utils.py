@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Date Utilities
+แปลงเวลาเผยแพร่ของ RSS entry เป็น datetime ตาม timezone ที่กำหนด
+
+รูปแบบที่พบใน feed จริง (RFC-822 "Mon, 19 Oct 2026 07:00:00 GMT" และ ISO-8601)
+ใช้ regex ที่ compile ไว้ ส่วนรูปแบบแปลกๆ ใช้ dateutil เหมือนเดิม
+ผลลัพธ์เหมือน dateutil_parser.parse + TZ.localize (ถ้าไม่มี timezone) + astimezone(TZ) ทุกกรณี
+"""
+
+import re
+import calendar
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# ท้าย pubDate แบบ RFC-822 ที่เป็น UTC (ไม่มีเศษวินาที จึงใช้ struct_time ของ feedparser แทนได้)
+# "UT", "EST" ฯลฯ dateutil ไม่รู้จัก (ได้เวลาแบบไม่มี timezone) จึงปล่อยให้ dateutil ตัดสินเหมือนเดิม
+_RFC822_UTC_SUFFIXES = (" GMT", " UTC", " +0000")
+
+_RFC822_RE = re.compile(
+    r'^\s*(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+'
+    r'(\d{1,2}):(\d{2})(?::(\d{2}))?'
+    r'(?:\s*(?:(GMT|UTC|Z)|([+-])(\d{2}):?(\d{2})))?\s*$'
+)
+_ISO_RE = re.compile(
+    r'^\s*(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?'
+    r'(?:\s*(?:(Z)|([+-])(\d{2}):?(\d{2})))?\s*$'
+)
+
+
+def _zone(utc: Optional[str], sign: Optional[str], hours: Optional[str], minutes: Optional[str]):
+    """tzinfo จากส่วน timezone ของ regex (None = ไม่ระบุ timezone)"""
+    if utc:
+        return timezone.utc
+    if sign:
+        offset = timedelta(hours=int(hours), minutes=int(minutes))
+        return timezone(-offset if sign == "-" else offset)
+    return None
+
+
+def _parse_rfc822(value: str) -> Optional[datetime]:
+    match = _RFC822_RE.match(value)
+    if not match:
+        return None
+    day, month, year, hour, minute, second, utc, sign, off_h, off_m = match.groups()
+    month_number = _MONTHS.get(month.lower())
+    if month_number is None:
+        return None
+    return datetime(int(year), month_number, int(day), int(hour), int(minute), int(second or 0),
+                    tzinfo=_zone(utc, sign, off_h, off_m))
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    match = _ISO_RE.match(value)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, utc, sign, off_h, off_m = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                    int((fraction or "0").ljust(6, "0")), tzinfo=_zone(utc, sign, off_h, off_m))
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str, tz) -> Optional[datetime]:
+    """
+    แปลงข้อความเวลาเป็น datetime ใน timezone tz (pytz)
+
+    ข้อความเดียวกันจะแปลงครั้งเดียว (Google News ส่ง pubDate ซ้ำกันมากในแต่ละรอบ)
+
+    Returns:
+        datetime ที่มี timezone หรือ None ถ้าแปลงไม่ได้
+    """
+    if not value:
+        return None
+    try:
+        dt = _parse_rfc822(value) or _parse_iso(value)
+        if dt is None:
+            from dateutil import parser as dateutil_parser
+            dt = dateutil_parser.parse(value)
+        if dt.tzinfo is None:
+            dt = tz.localize(dt)
+        return dt.astimezone(tz)
+    except Exception:
+        return None
+
+
+def _from_struct_time(value, tz) -> Optional[datetime]:
+    """struct_time (UTC) -> datetime ใน timezone tz"""
+    try:
+        return datetime.fromtimestamp(calendar.timegm(value), timezone.utc).astimezone(tz)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def parse_entry_datetime(published: Optional[str], published_parsed, tz) -> Optional[datetime]:
+    """
+    เวลาเผยแพร่ของ feed entry ใน timezone tz
+
+    Args:
+        published: ข้อความ published/updated ของ entry
+        published_parsed: struct_time (UTC) ที่ feedparser แปลงไว้แล้ว
+        tz: timezone ของผลลัพธ์ (pytz)
+    """
+    if not published:
+        return _from_struct_time(published_parsed, tz) if published_parsed else None
+    # pubDate แบบ UTC (กรณีเกือบทั้งหมดของ Google News) ใช้ struct_time ได้เลย
+    if published_parsed and published.rstrip().endswith(_RFC822_UTC_SUFFIXES):
+        published_dt = _from_struct_time(published_parsed, tz)
+        if published_dt is not None:
+            return published_dt
+    return parse_datetime(published, tz)
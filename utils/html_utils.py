@@ -6,8 +6,17 @@ HTML Utilities
 
 import re
 import html
+import threading
 from html.parser import HTMLParser
 
+# patterns ที่ใช้ทุก entry (compile ครั้งเดียวตอน import)
+_TAG_RE = re.compile(r'<[^>]+>')
+# เหมือน http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+ เดิม
+# ('%' และเลขฐานสิบหกอยู่ในช่วง $-_ อยู่แล้ว จึงรวมเป็น character class เดียวได้)
+_URL_RE = re.compile(r'http[s]?://[a-zA-Z0-9$-_@.&+!*\\(\\),]+')
+_QUOTE_RUN_RE = re.compile(r'"{2,}|\'{2,}')
+
+
 class HTMLTextExtractor(HTMLParser):
     """ดึงข้อความจาก HTML โดยไม่มี tags"""
     
@@ -15,6 +24,10 @@ class HTMLTextExtractor(HTMLParser):
         super().__init__()
         self.text_parts = []
     
+    def reset(self):
+        super().reset()
+        self.text_parts = []
+    
     def handle_data(self, data):
         self.text_parts.append(data)
     
@@ -22,6 +35,19 @@ class HTMLTextExtractor(HTMLParser):
         return ''.join(self.text_parts)
 
 
+# HTMLTextExtractor ของแต่ละ thread (reset แล้วใช้ซ้ำ แทนการสร้างใหม่ทุกครั้ง)
+_local = threading.local()
+
+
+def _text_extractor() -> HTMLTextExtractor:
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = HTMLTextExtractor()
+    else:
+        parser.reset()
+    return parser
+
+
 def decode_html_entities(text: str) -> str:
     """
     แปลง HTML entities เป็นข้อความปกติ
@@ -64,9 +90,13 @@ def strip_html_tags(text: str) -> str:
     if not text:
         return ""
     
+    # ไม่มี tag และ entity: HTMLParser คืนข้อความเดิมทั้งหมด
+    if '<' not in text and '&' not in text:
+        return text
+    
     # Method 1: ใช้ HTMLParser (ปลอดภัยกว่า)
     try:
-        parser = HTMLTextExtractor()
+        parser = _text_extractor()
         parser.feed(text)
         return parser.get_text()
     except Exception:
@@ -74,7 +104,7 @@ def strip_html_tags(text: str) -> str:
     
     # Method 2: ใช้ regex (fallback)
     # ลบ HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
     
     return text
 
@@ -92,6 +122,10 @@ def clean_html_text(text: str) -> str:
     if not text:
         return ""
     
+    # ไม่มี tag และ entity: เหลือแค่ลบช่องว่างเกิน (ไม่ต้องผ่าน HTMLParser/unescape)
+    if '<' not in text and '&' not in text:
+        return ' '.join(text.split())
+    
     # 1. ลบ HTML tags ก่อน
     text = strip_html_tags(text)
     
@@ -123,25 +157,25 @@ def clean_google_news_text(text: str) -> str:
         return ""
     
     # 1. แปลง HTML entities
-    text = html.unescape(text)
+    if '&' in text:
+        text = html.unescape(text)
     
     # 2. ลบ HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
     
     # 3. ลบ URLs (ถ้ามี)
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    if 'http' in text:
+        text = _URL_RE.sub('', text)
     
-    # 4. ลบ special characters ที่ไม่จำเป็น
-    text = re.sub(r'[\r\n\t]+', ' ', text)
-    
-    # 5. ลบช่องว่างเกิน
+    # 4. ลบช่องว่างเกิน (รวม \r \n \t)
     text = ' '.join(text.split())
     
-    # 6. ลบเครื่องหมายคำพูดซ้อน (ถ้ามี)
-    text = re.sub(r'"+', '"', text)
-    text = re.sub(r"'+", "'", text)
+    # 5. ลบเครื่องหมายคำพูดซ้อน (ถ้ามี)
+    if '""' in text or "''" in text:
+        text = _QUOTE_RUN_RE.sub(lambda m: m.group()[0], text)
     
-    return text.strip()
+    return text
 
 
 # ======================================================================
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP Client
+จุดเรียก HTTP กลางของทุก service พร้อมโหมดบันทึก/เล่นซ้ำ (record / replay)
+
+HTTP_MODE:
+    live    - เรียก API จริง (ค่าเริ่มต้น)
+    record  - เรียก API จริง และบันทึก response ทุกตัวลง HTTP_FIXTURES
+    replay  - ไม่ใช้ network ตอบกลับด้วย response ที่บันทึกไว้
+              (หน่วงเวลาเท่าเดิม x HTTP_REPLAY_LATENCY_SCALE)
+
+ไฟล์ fixture เป็น JSON (gzip) ที่มี format version และ response ตามลำดับการเรียก
+API key / token ใน query string จะถูกตัดออกก่อนบันทึก
+"""
+
+import os
+import gzip
+import json
+import time
+import atexit
+import base64
+import threading
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.settings import settings
+from utils.metrics import metrics
+
+FIXTURE_FORMAT = "auto-news-http-fixtures"
+FIXTURE_VERSION = 1
+
+# query parameters ที่ไม่บันทึกและไม่ใช้เป็น key
+SENSITIVE_PARAMS = {"api_key", "apikey", "key", "token", "access_token"}
+
+# response headers ที่ไม่บันทึก
+SKIPPED_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding", "content-length"}
+
+
+class ReplayMissError(requests.ConnectionError):
+    """ไม่มี response ที่บันทึกไว้สำหรับ request นี้"""
+
+
+def canonical_url(method: str, url: str, params=None) -> str:
+    """URL มาตรฐาน (รวม params, เรียง query, ตัด secrets) ใช้เป็น key ของ fixture"""
+    prepared = requests.Request(method, url, params=params).prepare().url
+    parts = urlsplit(prepared)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k.lower() not in SENSITIVE_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def make_entry(method: str, key: str, service: str, status: int, headers: dict,
+               body: bytes, encoding: Optional[str] = None, elapsed: float = 0.0) -> dict:
+    """สร้าง entry ของ fixture archive"""
+    return {
+        "method": method,
+        "key": key,
+        "service": service,
+        "status": status,
+        "headers": {k: v for k, v in headers.items() if k.lower() not in SKIPPED_HEADERS},
+        "encoding": encoding,
+        "elapsed": round(elapsed, 4),
+        "body_b64": base64.b64encode(body).decode("ascii"),
+    }
+
+
+def write_archive(path: str, entries: list, recorded_at: str):
+    """เขียน fixture archive (gzip JSON)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    archive = {
+        "format": FIXTURE_FORMAT,
+        "version": FIXTURE_VERSION,
+        "recorded_at": recorded_at,
+        "entries": entries,
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(archive, f, ensure_ascii=False)
+
+
+class _Recorder:
+    """เก็บ response ระหว่าง run แล้วเขียนเป็น fixture archive"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = []
+        self.lock = threading.Lock()
+        self.recorded_at = datetime.now(timezone.utc).isoformat()
+        atexit.register(self.save)
+
+    def add(self, method: str, key: str, service: str, response: requests.Response, elapsed: float):
+        entry = make_entry(method, key, service, response.status_code, response.headers,
+                           response.content, response.encoding, elapsed)
+        with self.lock:
+            self.entries.append(entry)
+
+    def save(self):
+        with self.lock:
+            if not self.entries:
+                return
+            write_archive(self.path, self.entries, self.recorded_at)
+        print(f"[HTTP] บันทึก {len(self.entries)} responses -> {self.path}")
+
+
+class _Player:
+    """เล่น response จาก fixture archive ตามลำดับที่บันทึก"""
+
+    def __init__(self, path: str, latency_scale: float):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            archive = json.load(f)
+        if archive.get("format") != FIXTURE_FORMAT:
+            raise ValueError(f"{path} is not an HTTP fixture archive")
+        if archive.get("version") != FIXTURE_VERSION:
+            raise ValueError(f"Unsupported fixture version {archive.get('version')} (expected {FIXTURE_VERSION})")
+
+        self.recorded_at = datetime.fromisoformat(archive["recorded_at"])
+        self.latency_scale = latency_scale
+        self.lock = threading.Lock()
+        self.queues: Dict[tuple, deque] = defaultdict(deque)
+        self.last: Dict[tuple, dict] = {}
+        for entry in archive["entries"]:
+            self.queues[(entry["method"], entry["key"])].append(entry)
+
+    def next_entry(self, method: str, key: str) -> dict:
+        """response ถัดไปของ key นี้ (ถ้าเรียกเกินจำนวนที่บันทึก จะใช้ตัวสุดท้ายซ้ำ)"""
+        with self.lock:
+            queue = self.queues.get((method, key))
+            if queue:
+                entry = queue.popleft()
+                self.last[(method, key)] = entry
+                return entry
+            if (method, key) in self.last:
+                return self.last[(method, key)]
+        raise ReplayMissError(f"No recorded response for {method} {key}")
+
+    def respond(self, method: str, key: str, prepared: requests.PreparedRequest) -> requests.Response:
+        entry = self.next_entry(method, key)
+        if self.latency_scale > 0:
+            time.sleep(entry["elapsed"] * self.latency_scale)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry.get("encoding")
+        response.url = prepared.url
+        response.request = prepared
+        response.elapsed = timedelta(seconds=entry["elapsed"])
+        response._content = base64.b64decode(entry["body_b64"])
+        return response
+
+
+_state_lock = threading.Lock()
+_recorder: Optional[_Recorder] = None
+_player: Optional[_Player] = None
+
+
+def _mode() -> str:
+    return settings.HTTP_MODE
+
+
+def _get_recorder() -> _Recorder:
+    global _recorder
+    with _state_lock:
+        if _recorder is None:
+            path = settings.HTTP_FIXTURES or os.path.join(
+                "fixtures", "http", datetime.now().strftime("%Y%m%d-%H%M%S") + ".json.gz")
+            _recorder = _Recorder(path)
+        return _recorder
+
+
+def get_player() -> _Player:
+    """โหลด fixture archive สำหรับโหมด replay (ครั้งเดียว)"""
+    global _player
+    with _state_lock:
+        if _player is None:
+            if not settings.HTTP_FIXTURES:
+                raise ValueError("HTTP_MODE=replay requires HTTP_FIXTURES")
+            _player = _Player(settings.HTTP_FIXTURES, settings.HTTP_REPLAY_LATENCY_SCALE)
+        return _player
+
+
+def reset():
+    """ล้าง fixture ที่โหลด/บันทึกไว้ (ใช้เมื่อเปลี่ยน HTTP_FIXTURES ภายใน process เดียวกัน)"""
+    global _recorder, _player
+    with _state_lock:
+        if _recorder is not None:
+            atexit.unregister(_recorder.save)
+            _recorder.save()
+        _recorder, _player = None, None
+
+
+def request(method: str, url: str, service: str = "", **kwargs) -> requests.Response:
+    """
+    เรียก HTTP (แทน requests.request) พร้อมเก็บ metrics และ record/replay
+
+    Args:
+        method: GET / POST
+        url: URL ปลายทาง
+        service: ชื่อบริการ (ใช้เป็น label ของ metrics เช่น yahoo, eia, line)
+        **kwargs: arguments เดียวกับ requests.request (params, headers, json, timeout, ...)
+    """
+    method = method.upper()
+    service = service or urlsplit(url).netloc
+    mode = _mode()
+    key = canonical_url(method, url, kwargs.get("params"))
+
+    started = time.perf_counter()
+    try:
+        with metrics.span("http_request", service=service):
+            if mode == "replay":
+                prepared = requests.Request(
+                    method, url, params=kwargs.get("params"), headers=kwargs.get("headers"),
+                    json=kwargs.get("json"), data=kwargs.get("data"),
+                ).prepare()
+                response = get_player().respond(method, key, prepared)
+            else:
+                response = requests.request(method, url, **kwargs)
+    except Exception:
+        metrics.incr("http_errors_total", service=service)
+        raise
+
+    elapsed = time.perf_counter() - started
+    metrics.incr("http_requests_total", service=service, status=response.status_code)
+    metrics.incr("http_response_bytes_total", len(response.content), service=service)
+    if response.request is not None and response.request.body:
+        metrics.incr("http_request_bytes_total", len(response.request.body), service=service)
+
+    if mode == "record":
+        _get_recorder().add(method, key, service, response, elapsed)
+
+    return response
+
+
+def get(url: str, service: str = "", **kwargs) -> requests.Response:
+    return request("GET", url, service, **kwargs)
+
+
+def post(url: str, service: str = "", **kwargs) -> requests.Response:
+    return request("POST", url, service, **kwargs)
+
+
+def reference_now(tz=None) -> datetime:
+    """
+    เวลาอ้างอิงของ run: โหมด replay ใช้เวลาที่บันทึก fixture
+    (ช่วงเวลาของข่าวจึงตัดสินเหมือนตอนบันทึก) โหมดอื่นใช้เวลาปัจจุบัน
+    """
+    if _mode() != "replay":
+        return datetime.now(tz)
+    return get_player().recorded_at.astimezone(tz)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Language Utilities
+แยกภาษาของข้อความจากตัวอักษร (ไทย = Unicode block U+0E00-U+0E7F, อังกฤษ = A-Z)
+และจับคู่คำสำคัญเฉพาะ script ที่มีในข้อความ
+
+KeywordSet แบ่งรายการคำสำคัญเป็นคำไทย / คำอังกฤษ / คำอื่น (เช่นตัวเลข) ครั้งเดียว
+ข้อความภาษาเดียวจึงตรวจเฉพาะคำของภาษานั้น (ข้อความผสมตรวจทั้งสองชุด)
+
+- substring_hits: เทียบแบบ substring เหมือน `kw in text` เดิมทุกกรณี (แค่ข้ามคำที่ตรงไม่ได้แน่นอน)
+- term_hits: คำอังกฤษต้องตรงทั้งคำ (รวมรูปพหูพจน์ -s/-es) และคำไทยไม่นับเมื่ออยู่ในคำอื่น
+  ที่รู้ว่าไม่เกี่ยวข้อง (THAI_FALSE_POSITIVES เช่น 'รถ' ใน 'สามารถ')
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+LANG_THAI = "th"
+LANG_LATIN = "en"
+LANG_MIXED = "mixed"
+LANG_NONE = ""
+
+_THAI_CHAR_RE = re.compile(r'[\u0E00-\u0E7F]')
+_LATIN_CHAR_RE = re.compile(r'[A-Za-z]')
+_LATIN_WORD_RE = re.compile(r'[a-z0-9]+')
+_SINGLE_WORD_RE = re.compile(r'[a-z0-9]+\Z')
+
+# คำไทย -> คำที่มีคำนั้นอยู่ข้างในแต่ความหมายไม่เกี่ยวข้อง
+THAI_FALSE_POSITIVES = {
+    'รถ': ('สามารถ', 'ปรารถนา', 'สมรรถ', 'อรรถ'),
+    'ตก': ('ตกลง',),
+    'มอบ': ('มอบหมาย',),
+}
+
+
+def script_counts(text: str) -> Tuple[int, int]:
+    """จำนวนตัวอักษรไทย และตัวอักษรอังกฤษในข้อความ"""
+    if not text:
+        return 0, 0
+    return len(_THAI_CHAR_RE.findall(text)), len(_LATIN_CHAR_RE.findall(text))
+
+
+def text_language(text: str) -> str:
+    """ภาษาของข้อความ: LANG_THAI / LANG_LATIN / LANG_MIXED / LANG_NONE (ไม่มีตัวอักษรของทั้งสองภาษา)"""
+    if not text:
+        return LANG_NONE
+    thai = _THAI_CHAR_RE.search(text) is not None
+    latin = _LATIN_CHAR_RE.search(text) is not None
+    if thai and latin:
+        return LANG_MIXED
+    if thai:
+        return LANG_THAI
+    return LANG_LATIN if latin else LANG_NONE
+
+
+def latin_words(text_lower: str) -> Set[str]:
+    """คำภาษาอังกฤษ/ตัวเลขในข้อความ lowercase (ตัวอักษรอื่นรวมถึงภาษาไทยถือเป็นตัวคั่น)"""
+    return set(_LATIN_WORD_RE.findall(text_lower))
+
+
+def _thai_term_found(keyword: str, text_lower: str) -> bool:
+    count = text_lower.count(keyword)
+    if not count:
+        return False
+    masked = sum(text_lower.count(word) * word.count(keyword) for word in THAI_FALSE_POSITIVES.get(keyword, ()))
+    return count > masked
+
+
+_KIND_OTHER = 0
+_KIND_THAI = 1
+_KIND_WORD = 2
+_KIND_PHRASE = 3
+
+
+class KeywordSet:
+    """
+    รายการคำสำคัญที่แยกตาม script ไว้แล้ว
+
+    เตรียมรายการคำของแต่ละภาษาไว้ล่วงหน้า (คงลำดับของรายการเดิม) จึงไม่ต้อง lower/เรียงผลใหม่ทุกข้อความ
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(keywords)
+        routes = {LANG_NONE: [], LANG_THAI: [], LANG_LATIN: [], LANG_MIXED: []}
+        for keyword in self.keywords:
+            lowered = keyword.lower()
+            if _THAI_CHAR_RE.search(lowered):
+                entry = (keyword, lowered, _KIND_THAI, None)
+                languages = (LANG_THAI, LANG_MIXED)
+            elif _LATIN_CHAR_RE.search(lowered):
+                if _SINGLE_WORD_RE.match(lowered):
+                    entry = (keyword, lowered, _KIND_WORD, None)
+                else:
+                    pattern = r'\s+'.join(re.escape(part) for part in lowered.split())
+                    entry = (keyword, lowered, _KIND_PHRASE,
+                             re.compile(r'(?<![a-z0-9])' + pattern + r'(?:s|es)?(?![a-z0-9])'))
+                languages = (LANG_LATIN, LANG_MIXED)
+            else:
+                entry = (keyword, lowered, _KIND_OTHER, None)
+                languages = tuple(routes)
+            for language in languages:
+                routes[language].append(entry)
+        self._routes = {language: tuple(entries) for language, entries in routes.items()}
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def route(self, language: str) -> tuple:
+        """คำที่ต้องตรวจสำหรับข้อความภาษา language"""
+        return self._routes.get(language, self._routes[LANG_MIXED])
+
+    def substring_hits(self, text_lower: str, language: str) -> List[str]:
+        """คำที่เป็น substring ของข้อความ (เท่ากับ [kw for kw in keywords if kw.lower() in text_lower])"""
+        return [keyword for keyword, lowered, _, _ in self.route(language) if lowered in text_lower]
+
+    def term_hits(self, text_lower: str, language: str, words: Set[str]) -> List[str]:
+        """
+        คำที่พบแบบคำเต็ม (words = latin_words(text_lower))
+
+        คำอังกฤษ: ทั้งคำ หรือ + s/es ('gas' ตรงกับ 'gases' แต่ไม่ตรงกับ 'gasoline', 'car' ไม่ตรงกับ 'carbon')
+        คำไทย: substring ที่ไม่ได้อยู่ใน THAI_FALSE_POSITIVES ของคำนั้น
+        """
+        found = []
+        for keyword, lowered, kind, pattern in self.route(language):
+            if kind == _KIND_WORD:
+                matched = lowered in words or lowered + "s" in words or lowered + "es" in words
+            elif kind == _KIND_THAI:
+                matched = _thai_term_found(lowered, text_lower)
+            elif kind == _KIND_PHRASE:
+                matched = lowered in text_lower and pattern.search(text_lower) is not None
+            else:
+                matched = lowered in text_lower
+            if matched:
+                found.append(keyword)
+        return found
+
+
+# KeywordSet ของรายการคำที่เป็น attribute ของ class (key = id ของรายการ เก็บรายการไว้ด้วยกัน id ถูกใช้ซ้ำ)
+_keyword_sets: Dict[int, Tuple[object, KeywordSet]] = {}
+
+
+def keyword_set(keywords: Iterable[str]) -> KeywordSet:
+    """KeywordSet ของรายการคำ (list/tuple/set ที่ใช้ซ้ำจะสร้างครั้งเดียว)"""
+    if isinstance(keywords, KeywordSet):
+        return keywords
+    if not isinstance(keywords, (list, tuple, set, frozenset)):
+        return KeywordSet(keywords)
+    cached = _keyword_sets.get(id(keywords))
+    if cached is not None and cached[0] is keywords:
+        return cached[1]
+    compiled = KeywordSet(keywords)
+    _keyword_sets[id(keywords)] = (keywords, compiled)
+    return compiled
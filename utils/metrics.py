@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Metrics & Instrumentation
+เก็บเวลา/จำนวน/ขนาดข้อมูลของแต่ละขั้นตอน แล้วเขียนรายงาน JSON (และ Prometheus)
+"""
+
+import os
+import json
+import functools
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+
+# bucket ของ histogram (วินาที) ใช้กับเวลาเรียก API ภายนอกและเวลาประมวลผล
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROMETHEUS_PREFIX = "auto_news_"
+
+
+def _label_key(labels: Dict[str, object]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Histogram แบบสะสม (count/sum/min/max + buckets)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min,
+            "max": self.max,
+            "avg": round(self.sum / self.count, 6) if self.count else None,
+            "buckets": {str(b): c for b, c in zip(self.buckets, self.bucket_counts)},
+        }
+
+
+class MetricsRegistry:
+    """ที่เก็บ counters และ histograms (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[tuple, float] = {}
+        self._histograms: Dict[tuple, Histogram] = {}
+        self.started_at = time.time()
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """เพิ่มค่า counter"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """บันทึกค่าลง histogram"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """
+        จับเวลาช่วงการทำงาน (บันทึกลง histogram ชื่อ <name>_seconds)
+
+        Example:
+            with metrics.span("line_send"):
+                requests.post(...)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(f"{name}_seconds", time.perf_counter() - started, **labels)
+
+    def timed(self, name: str, **labels):
+        """decorator สำหรับจับเวลาทั้งฟังก์ชัน (เหมือน span)"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started_at = time.time()
+
+    def snapshot(self) -> dict:
+        """คืนค่า metrics ทั้งหมดเป็น dict (สำหรับ JSON report)"""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self._histograms.items(), key=lambda kv: kv[0])
+            ]
+
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "wall_time_seconds": round(time.time() - self.started_at, 3),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def to_prometheus(self) -> str:
+        """แปลง metrics เป็น Prometheus text exposition format"""
+        def fmt_labels(labels, extra=None):
+            pairs = list(labels) + (extra or [])
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+        lines = []
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                lines.append(f"{PROMETHEUS_PREFIX}{name}{fmt_labels(labels)} {value}")
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda kv: kv[0]):
+                metric = f"{PROMETHEUS_PREFIX}{name}"
+                for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                    lines.append(f"{metric}_bucket{fmt_labels(labels, [('le', str(bound))])} {count}")
+                lines.append(f"{metric}_bucket{fmt_labels(labels, [('le', '+Inf')])} {histogram.count}")
+                lines.append(f"{metric}_sum{fmt_labels(labels)} {histogram.sum}")
+                lines.append(f"{metric}_count{fmt_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, directory: str, run_name: str, prometheus: bool = False) -> str:
+        """
+        เขียนรายงานท้าย run
+
+        Args:
+            directory: โฟลเดอร์ที่เก็บรายงาน
+            run_name: ชื่อ run (ใช้เป็นชื่อไฟล์ เช่น daily_news -> daily_news.json)
+            prometheus: เขียนไฟล์ Prometheus text (<run_name>.prom) ด้วยหรือไม่
+
+        Returns:
+            path ของไฟล์ JSON
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        report = self.snapshot()
+        report["run"] = run_name
+        json_path = os.path.join(directory, f"{run_name}.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        if prometheus:
+            with open(os.path.join(directory, f"{run_name}.prom"), "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+        return json_path
+
+
+# registry กลางของ process
+metrics = MetricsRegistry()
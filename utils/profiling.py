@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Profiling Hooks
+ครอบแต่ละขั้นตอนด้วย cProfile + tracemalloc แล้วเขียนผลเป็นไฟล์ (เปิดใช้เมื่อต้องการเท่านั้น)
+"""
+
+import io
+import os
+import sys
+import pstats
+import cProfile
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Sequence
+
+# context ว่างที่ใช้ร่วมกันเมื่อปิด profiling (ไม่มี overhead เพิ่ม)
+_NULL_CONTEXT = nullcontext()
+
+
+class Profiler:
+    """
+    Profiler ต่อขั้นตอน
+
+    เมื่อเปิดใช้ แต่ละขั้นตอนจะได้ไฟล์ใน <output_dir>/<run_name>/:
+        <stage>.pstats     - ข้อมูล cProfile (เปิดด้วย pstats/snakeviz ได้)
+        <stage>.txt        - ฟังก์ชันที่ใช้เวลามากที่สุด (cumulative และ tottime)
+        <stage>_alloc.txt  - ตำแหน่งที่จองหน่วยความจำมากที่สุด (tracemalloc)
+
+    หมายเหตุ: cProfile เก็บเฉพาะ thread ของขั้นตอนนั้น แต่ tracemalloc
+    นับทั้ง process จึงอาจรวม allocation ของขั้นตอนที่ทำงานพร้อมกันด้วย
+    """
+
+    def __init__(self, enabled: bool = False, output_dir: str = "profiles",
+                 run_name: str = "run", top: int = 40):
+        self.enabled = enabled
+        self.output_dir = os.path.join(output_dir, run_name)
+        self.top = top
+        self._lock = threading.Lock()
+        self._active = 0
+
+    def stage(self, name: str):
+        """context manager สำหรับ profile ขั้นตอนหนึ่ง"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._profile(name)
+
+    def wrap(self, func: Callable, name: str) -> Callable:
+        """ครอบฟังก์ชันด้วย stage() (คืนฟังก์ชันเดิมเมื่อปิด profiling)"""
+        if not self.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self._profile(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    @contextmanager
+    def _profile(self, name: str):
+        with self._lock:
+            if self._active == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(25)
+            self._active += 1
+
+        before = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+
+            with self._lock:
+                self._active -= 1
+                if self._active == 0:
+                    tracemalloc.stop()
+
+            try:
+                self._dump(name, profile, before, after, peak)
+            except Exception as e:
+                print(f"[PROFILE] เขียนผล {name} ไม่สำเร็จ: {str(e)}", file=sys.stderr)
+
+    def _dump(self, name: str, profile: cProfile.Profile, before, after, peak: int):
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, name)
+
+        profile.dump_stats(f"{base}.pstats")
+
+        report = io.StringIO()
+        stats = pstats.Stats(profile, stream=report).strip_dirs()
+        report.write(f"=== {name}: sorted by cumulative time ===\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        report.write(f"\n=== {name}: sorted by internal time ===\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top)
+        with open(f"{base}.txt", "w", encoding="utf-8") as f:
+            f.write(report.getvalue())
+
+        filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        with open(f"{base}_alloc.txt", "w", encoding="utf-8") as f:
+            f.write(f"=== {name}: top allocation sites (peak traced {peak / 1024:.1f} KiB) ===\n")
+            for stat in diff[:self.top]:
+                f.write(f"{stat}\n")
+
+        print(f"[PROFILE] {name} -> {base}.txt", file=sys.stderr)
+
+
+def profiler_from_env(run_name: str, argv: Sequence[str] = ()) -> Profiler:
+    """
+    สร้าง Profiler จาก environment / command line
+
+    เปิดใช้เมื่อมี PROFILE=1 หรือ argument --profile
+    ไฟล์ผลลัพธ์อยู่ใน PROFILE_DIR (ค่าเริ่มต้น profiles/)
+    """
+    enabled = "--profile" in argv or os.getenv("PROFILE", "0").strip().lower() in ["1", "true", "yes", "y"]
+    return Profiler(enabled=enabled, output_dir=os.getenv("PROFILE_DIR", "profiles"), run_name=run_name)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Stage Graph Runner
+รันขั้นตอนของ pipeline แบบ DAG - ขั้นตอนที่ไม่ขึ้นต่อกันทำงานพร้อมกัน
+"""
+
+import io
+import sys
+import time
+import queue
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+from utils.metrics import metrics
+
+
+class StageTimeoutError(TimeoutError):
+    """ขั้นตอนทำงานเกินเวลาที่กำหนด"""
+
+
+class StageResult:
+    """ผลลัพธ์ของขั้นตอนหนึ่ง"""
+
+    def __init__(self, name: str, value=None, error: Optional[BaseException] = None,
+                 elapsed: float = 0.0, skipped: bool = False):
+        self.name = name
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+        self.skipped = skipped
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+class Stage:
+    """นิยามขั้นตอนใน graph"""
+
+    def __init__(self, name: str, func: Callable, deps: Iterable[str] = (),
+                 timeout: Optional[float] = None, critical: bool = False,
+                 after: Iterable[str] = (), buffered: bool = True):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.timeout = timeout
+        self.critical = critical
+        self.after = tuple(after)
+        self.buffered = buffered
+
+
+class _StageOutput:
+    """
+    แยก stdout ของแต่ละ thread ลง buffer ของขั้นตอนนั้น
+
+    buffer จะถูกเขียนออกตามลำดับที่ประกาศขั้นตอน
+    ทำให้ log เหมือนกับการรันทีละขั้นตอน แม้ขั้นตอนจะทำงานพร้อมกัน
+    (ขั้นตอนที่ไม่ buffer และ thread อื่นเขียนออกทันที)
+    ขั้นตอนที่เกินเวลาจะถูก release: ข้อความหลังจากนั้นเขียนไปที่ sys.__stdout__ ทันที
+    (buffer ของขั้นตอนนั้นถูกเขียนออกไปแล้ว จึงไม่มีใครอ่านอีก)
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffers: Dict[int, io.StringIO] = {}
+
+    def attach(self, buffer: io.StringIO):
+        self._buffers[threading.get_ident()] = buffer
+
+    def detach(self):
+        self._buffers.pop(threading.get_ident(), None)
+
+    def release(self, ident: int):
+        if ident in self._buffers:
+            self._buffers[ident] = sys.__stdout__ or self._stream
+
+    def write(self, text):
+        buffer = self._buffers.get(threading.get_ident())
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class StageGraph:
+    """
+    ตัวรันขั้นตอนแบบ DAG
+
+    - ขั้นตอนจะเริ่มเมื่อขั้นตอนที่ขึ้นต่อ (deps) และขั้นตอนที่ต้องรอ (after) ทำงานเสร็จแล้ว
+      after ใช้กำหนดลำดับอย่างเดียว: ขั้นตอนนั้นล้มเหลวหรือถูกข้ามก็ยังทำงานต่อ
+    - ขั้นตอนที่ล้มเหลวไม่กระทบขั้นตอนอื่น (ขั้นตอนถัดไปได้รับ StageResult ที่มี error)
+      ยกเว้นขั้นตอนที่เป็น critical: ขั้นตอนที่ขึ้นต่อจะถูกข้าม และ run() จะ raise error เดิม
+    - timeout ต่อขั้นตอน: ขั้นตอนที่เกินเวลาจะถูกถือว่าล้มเหลว (thread ยังทำงานต่อแบบ daemon)
+    - stdout ของขั้นตอนถูก buffer แล้วเขียนออกตามลำดับที่ประกาศ
+      ยกเว้นขั้นตอนที่ buffered=False (เช่นขั้นตอนที่ใช้เวลานาน) ซึ่งเขียนออกทันที
+    """
+
+    def __init__(self, stage_wrapper: Optional[Callable[[Callable, str], Callable]] = None):
+        """
+        Args:
+            stage_wrapper: ฟังก์ชัน (func, name) -> func สำหรับครอบทุกขั้นตอน
+                           เช่น Profiler.wrap
+        """
+        self._stages: List[Stage] = []
+        self._by_name: Dict[str, Stage] = {}
+        self._stage_wrapper = stage_wrapper
+
+    def add_stage(self, name: str, func: Callable, deps: Iterable[str] = (),
+                  timeout: Optional[float] = None, critical: bool = False,
+                  after: Iterable[str] = (), buffered: bool = True) -> "StageGraph":
+        """
+        เพิ่มขั้นตอน
+
+        Args:
+            name: ชื่อขั้นตอน (ไม่ซ้ำกัน)
+            func: ฟังก์ชันที่รับ dict ของ StageResult ของขั้นตอนที่เสร็จแล้ว
+            deps: ชื่อขั้นตอนที่ต้องเสร็จก่อน (ต้องประกาศไว้ก่อนแล้ว)
+            timeout: เวลาสูงสุด (วินาที) หรือ None
+            critical: ถ้าล้มเหลวให้หยุด pipeline
+            after: ชื่อขั้นตอนที่ต้องเสร็จก่อน แต่ไม่ส่งผลถ้าล้มเหลวหรือถูกข้าม
+            buffered: False = เขียน stdout ออกทันที (ไม่รอขั้นตอนที่ประกาศก่อน)
+        """
+        if name in self._by_name:
+            raise ValueError(f"Duplicate stage: {name}")
+        for dep in (*deps, *after):
+            if dep not in self._by_name:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+
+        if self._stage_wrapper:
+            func = self._stage_wrapper(func, name)
+
+        stage = Stage(name, func, deps, timeout, critical, after, buffered)
+        self._stages.append(stage)
+        self._by_name[name] = stage
+        return self
+
+    def run(self) -> Dict[str, StageResult]:
+        """รันทุกขั้นตอน และคืนค่า dict ชื่อขั้นตอน -> StageResult"""
+        results: Dict[str, StageResult] = {}
+        buffers: Dict[str, io.StringIO] = {}
+        threads: Dict[str, threading.Thread] = {}
+        running: Dict[str, float] = {}
+        pending = list(self._stages)
+        done_queue = queue.Queue()
+        flushed = 0
+
+        output = _StageOutput(sys.stdout)
+        sys.stdout = output
+
+        def worker(stage: Stage, buffer: Optional[io.StringIO], snapshot: Dict[str, StageResult]):
+            if buffer is not None:
+                output.attach(buffer)
+            started = time.perf_counter()
+            try:
+                with metrics.span("stage", stage=stage.name):
+                    value, error = stage.func(snapshot), None
+            except BaseException as e:
+                value, error = None, e
+            finally:
+                output.detach()
+            metrics.incr("stages_total", stage=stage.name, status="ok" if error is None else "error")
+            done_queue.put(StageResult(stage.name, value, error, time.perf_counter() - started))
+
+        try:
+            while pending or running:
+                # เริ่มขั้นตอนที่พร้อม (หรือข้ามถ้าขั้นตอน critical ก่อนหน้าล้มเหลว)
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for stage in list(pending):
+                        if not all(dep in results for dep in (*stage.deps, *stage.after)):
+                            continue
+                        pending.remove(stage)
+                        progressed = True
+
+                        if any(self._blocks(results[dep]) for dep in stage.deps):
+                            results[stage.name] = StageResult(stage.name, skipped=True)
+                            continue
+
+                        buffers[stage.name] = io.StringIO() if stage.buffered else None
+                        deadline = time.monotonic() + stage.timeout if stage.timeout else float("inf")
+                        running[stage.name] = deadline
+                        threads[stage.name] = threading.Thread(
+                            target=worker,
+                            args=(stage, buffers[stage.name], dict(results)),
+                            name=f"stage-{stage.name}",
+                            daemon=True,
+                        )
+                        threads[stage.name].start()
+
+                if running:
+                    wait = min(running.values()) - time.monotonic()
+                    try:
+                        result = done_queue.get(timeout=None if wait == float("inf") else max(wait, 0))
+                        if result.name in running:
+                            del running[result.name]
+                            results[result.name] = result
+                    except queue.Empty:
+                        now = time.monotonic()
+                        for name, deadline in list(running.items()):
+                            if deadline <= now:
+                                del running[name]
+                                output.release(threads[name].ident)
+                                timeout = self._by_name[name].timeout
+                                results[name] = StageResult(
+                                    name, error=StageTimeoutError(f"Stage '{name}' timed out after {timeout}s"),
+                                    elapsed=timeout,
+                                )
+
+                # เขียน log ออกตามลำดับที่ประกาศ (ขั้นตอนที่ไม่ buffer เขียนออกไปแล้ว ไม่ต้องรอ)
+                while flushed < len(self._stages) and (
+                        self._stages[flushed].name in results or not self._stages[flushed].buffered):
+                    buffer = buffers.get(self._stages[flushed].name)
+                    if buffer is not None:
+                        output._stream.write(buffer.getvalue())
+                    flushed += 1
+        finally:
+            sys.stdout = output._stream
+            for stage in self._stages[flushed:]:
+                buffer = buffers.get(stage.name)
+                if buffer is not None:
+                    sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+        for stage in self._stages:
+            result = results[stage.name]
+            if stage.critical and result.error is not None:
+                raise result.error
+
+        return results
+
+    def _blocks(self, result: StageResult) -> bool:
+        """ขั้นตอนนี้ทำให้ขั้นตอนถัดไปต้องถูกข้ามหรือไม่"""
+        return result.skipped or (result.error is not None and self._by_name[result.name].critical)
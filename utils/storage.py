@@ -5,20 +5,20 @@ Storage Utilities
 """
 
 import os
-from config.settings import SENT_DIR, TZ
+from config.settings import settings
 from utils.url_utils import normalize_url
 from datetime import datetime
 
 def read_sent_links() -> set:
     """อ่าน URLs ที่เคยส่งไปแล้ว"""
     sent = set()
-    if not os.path.exists(SENT_DIR):
+    if not os.path.exists(settings.SENT_DIR):
         return sent
     
-    for fn in os.listdir(SENT_DIR):
+    for fn in os.listdir(settings.SENT_DIR):
         if not fn.endswith(".txt"):
             continue
-        fp = os.path.join(SENT_DIR, fn)
+        fp = os.path.join(settings.SENT_DIR, fn)
         try:
             with open(fp, "r", encoding="utf-8") as f:
                 for line in f:
@@ -35,6 +35,7 @@ def append_sent_link(url: str):
     if not url:
         return
     
-    fn = os.path.join(SENT_DIR, datetime.now(TZ).strftime("%Y-%m-%d") + ".txt")
+    os.makedirs(settings.SENT_DIR, exist_ok=True)
+    fn = os.path.join(settings.SENT_DIR, datetime.now(settings.TZ).strftime("%Y-%m-%d") + ".txt")
     with open(fn, "a", encoding="utf-8") as f:
         f.write(url + "\n")
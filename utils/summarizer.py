@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Extractive Summarizer
+สรุปข่าวแบบ extractive (TextRank) ทำงาน offline รองรับภาษาไทยและภาษาอังกฤษ
+"""
+
+import re
+from collections import Counter
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from utils.text_utils import cut, create_simple_summary
+
+# จุดแบ่งประโยค/วลี: จบประโยคภาษาอังกฤษ, ขึ้นบรรทัดใหม่, ตัวคั่นหัวข้อข่าว
+# และช่องว่างระหว่างวลีภาษาไทย (ภาษาไทยใช้ช่องว่างแทนการจบประโยค)
+_SEGMENT_BOUNDARY = re.compile(
+    r'(?<=[.!?])\s+'
+    r'|\s*[\r\n]+\s*'
+    r'|\s+[|•·–—-]\s+'
+    r'|(?<=[\u0E00-\u0E7F])\s+(?=[\u0E00-\u0E7F])'
+)
+_LATIN_WORD = re.compile(r'[a-z0-9]{2,}')
+_THAI_RUN = re.compile(r'[\u0E01-\u0E4E]+')
+
+MIN_SEGMENT_CHARS = 20
+# จำกัดขนาด similarity matrix ต่อ block (segments x segments)
+BLOCK_SEGMENTS = 512
+
+
+def split_segments(text: str) -> List[str]:
+    """
+    แบ่งข้อความเป็นประโยค/วลี
+
+    วลีที่สั้นกว่า MIN_SEGMENT_CHARS จะถูกรวมเข้ากับวลีก่อนหน้า
+
+    Args:
+        text: ข้อความข่าว
+
+    Returns:
+        list ของประโยค/วลีตามลำดับเดิม
+    """
+    text = ' '.join((text or "").split())
+    if not text:
+        return []
+
+    segments = []
+    for part in _SEGMENT_BOUNDARY.split(text):
+        part = (part or "").strip()
+        if not part:
+            continue
+        if segments and len(segments[-1]) < MIN_SEGMENT_CHARS:
+            segments[-1] = f"{segments[-1]} {part}"
+        else:
+            segments.append(part)
+
+    if len(segments) > 1 and len(segments[-1]) < MIN_SEGMENT_CHARS:
+        last = segments.pop()
+        segments[-1] = f"{segments[-1]} {last}"
+
+    return segments
+
+
+def _segment_features(segment: str) -> Counter:
+    """คำภาษาอังกฤษ + character bigram ของภาษาไทย (ไม่ต้องตัดคำ)"""
+    lower = segment.lower()
+    features = Counter(_LATIN_WORD.findall(lower))
+    for run in _THAI_RUN.findall(lower):
+        features.update(run[i:i + 2] for i in range(len(run) - 1))
+    return features
+
+
+def _rank_block(segment_lists: List[List[str]], damping: float, iterations: int) -> List[List[float]]:
+    """คำนวณคะแนน TextRank ของทุกข่าวใน block เดียวด้วย matrix เดียว"""
+    owners, positions, feature_rows = [], [], []
+    for owner, segments in enumerate(segment_lists):
+        for pos, segment in enumerate(segments):
+            owners.append(owner)
+            positions.append(pos)
+            feature_rows.append(_segment_features(segment))
+
+    vocab = {}
+    rows, cols, vals = [], [], []
+    for row, features in enumerate(feature_rows):
+        for feature, count in features.items():
+            rows.append(row)
+            cols.append(vocab.setdefault(feature, len(vocab)))
+            vals.append(count)
+
+    n = len(owners)
+    owner = np.asarray(owners)
+    matrix = np.zeros((n, max(len(vocab), 1)), dtype=np.float32)
+    if vals:
+        matrix[rows, cols] = vals
+
+    # TF-IDF + cosine similarity ของทุกวลีในครั้งเดียว
+    df = np.count_nonzero(matrix, axis=0)
+    matrix *= (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+    similarity = matrix @ matrix.T
+    similarity[owner[:, None] != owner[None, :]] = 0.0
+    np.fill_diagonal(similarity, 0.0)
+
+    row_sum = similarity.sum(axis=1, keepdims=True)
+    transition = np.divide(similarity, row_sum, out=np.zeros_like(similarity), where=row_sum > 0)
+
+    # teleport แบบให้น้ำหนักวลีต้นข่าว (lead bias) แยกตามข่าว
+    prior = 1.0 / (np.asarray(positions, dtype=np.float32) + 1.0)
+    prior /= np.bincount(owner, weights=prior)[owner]
+    dangling = (row_sum[:, 0] == 0)
+
+    scores = prior.copy()
+    for _ in range(iterations):
+        lost = np.bincount(owner, weights=scores * dangling, minlength=len(segment_lists))[owner]
+        scores = (1.0 - damping) * prior + damping * (transition.T @ scores + lost * prior)
+
+    ranked = [[] for _ in segment_lists]
+    for row in range(n):
+        ranked[owners[row]].append(float(scores[row]))
+    return ranked
+
+
+def _select(segments: List[str], scores: List[float], max_length: int) -> str:
+    """เลือกวลีคะแนนสูงสุดให้พอดีความยาว แล้วเรียงตามลำดับเดิม"""
+    order = sorted(range(len(segments)), key=lambda i: (-scores[i], i))
+    chosen, length = [], 0
+    for i in order:
+        added = len(segments[i]) + (1 if chosen else 0)
+        if length + added <= max_length:
+            chosen.append(i)
+            length += added
+
+    if not chosen:
+        return cut(segments[order[0]], max_length)
+    return ' '.join(segments[i] for i in sorted(chosen))
+
+
+def summarize_batch(texts: List[str], max_length: int = 150,
+                    damping: float = 0.85, iterations: int = 30) -> List[str]:
+    """
+    สรุปข่าวหลายข่าวพร้อมกัน (TextRank บน similarity matrix ของ NumPy)
+
+    ข่าวทั้ง run ถูกคำนวณรวมกันเป็น block-diagonal matrix
+    จึงใช้เวลาระดับมิลลิวินาที และไม่ต้องใช้ network หรือโหลด model
+
+    Args:
+        texts: list ของข้อความข่าว
+        max_length: ความยาวสูงสุดของสรุป (ตัวอักษร)
+
+    Returns:
+        list ของสรุปตามลำดับเดียวกับ texts
+    """
+    if np is None:
+        return [create_simple_summary(text, max_length) for text in texts]
+
+    summaries = [""] * len(texts)
+    pending, block, block_size = [], [], 0
+
+    for index, text in enumerate(texts):
+        segments = split_segments(text)
+        if not segments:
+            continue
+        if len(segments) == 1:
+            summaries[index] = cut(segments[0], max_length)
+            continue
+        if block and block_size + len(segments) > BLOCK_SEGMENTS:
+            pending.append(block)
+            block, block_size = [], 0
+        block.append((index, segments))
+        block_size += len(segments)
+
+    if block:
+        pending.append(block)
+
+    for block in pending:
+        ranked = _rank_block([segments for _, segments in block], damping, iterations)
+        for (index, segments), scores in zip(block, ranked):
+            summaries[index] = _select(segments, scores, max_length)
+
+    return summaries
+
+
+def summarize_text(text: str, max_length: int = 150) -> str:
+    """สรุปข่าวข้อความเดียว"""
+    return summarize_batch([text], max_length)[0]
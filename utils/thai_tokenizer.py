@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Thai Tokenizer
+ตัดคำภาษาไทยแบบ maximal matching จาก dictionary ที่เก็บเป็น trie
+
+ภาษาไทยไม่มีช่องว่างระหว่างคำ การแยกคำด้วย split() จึงได้ "คำ" ยาวทั้งประโยค
+ThaiTokenizer เลือกการตัดคำที่มีตัวอักษรที่ไม่รู้จักน้อยที่สุด แล้วจึงจำนวนคำน้อยที่สุด
+(ถ้าเท่ากันเลือกคำแรกที่ยาวกว่า) ส่วนที่ไม่อยู่ใน dictionary รวมเป็นหนึ่งคำ
+
+- ตัดได้เฉพาะขอบของกลุ่มตัวอักษร (ไม่ตัดก่อนสระบน/ล่าง/วรรณยุกต์ และไม่ตัดหลังสระหน้า)
+- ส่วนที่ไม่ใช่ภาษาไทย (อังกฤษ ตัวเลข) เป็นคำแยกตามเดิม
+- ผลการตัดคำของแต่ละช่วงข้อความภาษาไทยถูก cache ไว้ (ชื่อสำนักข่าว/คำซ้ำๆ ตัดครั้งเดียว)
+"""
+
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+THAI_WORDS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "thai_words.txt")
+
+# ตัวอักษรไทย + สระ/วรรณยุกต์ (ไม่รวมตัวเลขไทยและ ฿)
+_THAI_RUN_RE = re.compile(r'[\u0E01-\u0E3A\u0E40-\u0E4E]+|[^\u0E01-\u0E3A\u0E40-\u0E4E]+')
+_THAI_WORD_RE = re.compile(r'[\u0E01-\u0E3A\u0E40-\u0E4E]+')
+
+# ตัวอักษรที่ขึ้นต้นคำไม่ได้ (สระหลัง/บน/ล่าง วรรณยุกต์ การันต์) และสระหน้าที่จบคำไม่ได้
+_NON_STARTING = frozenset(chr(code) for code in [*range(0x0E30, 0x0E3B), 0x0E45, *range(0x0E47, 0x0E4F)])
+_LEADING_VOWELS = frozenset(chr(code) for code in range(0x0E40, 0x0E45))
+
+_END = ""  # key ใน trie node ที่บอกว่าจบคำ
+
+_SEGMENT_CACHE_SIZE = 8192
+
+
+def _boundaries(text: str) -> List[bool]:
+    """ตำแหน่งที่เริ่มคำได้ (len(text) + 1 ตำแหน่ง)"""
+    allowed = [True] * (len(text) + 1)
+    for i in range(1, len(text)):
+        allowed[i] = text[i] not in _NON_STARTING and text[i - 1] not in _LEADING_VOWELS
+    return allowed
+
+
+class ThaiTokenizer:
+    """ตัดคำภาษาไทยด้วย dictionary (trie ของตัวอักษร)"""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._trie: Dict[str, dict] = {}
+        self._size = 0
+        self._max_length = 0
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+        self.update(words)
+
+    @classmethod
+    def load(cls, path: str = THAI_WORDS_FILE, extra: Iterable[str] = ()) -> "ThaiTokenizer":
+        """สร้างจากไฟล์รายการคำ (หนึ่งคำต่อบรรทัด, # = หมายเหตุ) และคำเพิ่มเติม"""
+        tokenizer = cls()
+        with open(path, "r", encoding="utf-8") as f:
+            tokenizer.update(line.strip() for line in f if line.strip() and not line.startswith("#"))
+        tokenizer.update(extra)
+        return tokenizer
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        node = self._trie
+        for ch in word:
+            node = node.get(ch)
+            if node is None:
+                return False
+        return _END in node
+
+    def add(self, word: str):
+        """เพิ่มคำ (ส่วนที่ไม่ใช่ภาษาไทยในคำจะถูกข้าม เช่น 'ปตท.' -> 'ปตท')"""
+        for part in _THAI_WORD_RE.findall(word.lower()):
+            node = self._trie
+            for ch in part:
+                node = node.setdefault(ch, {})
+            if _END not in node:
+                node[_END] = True
+                self._size += 1
+                self._max_length = max(self._max_length, len(part))
+        self._cache.clear()
+
+    def update(self, words: Iterable[str]):
+        for word in words:
+            self.add(word)
+
+    def _word_ends(self, text: str, start: int) -> List[int]:
+        """ตำแหน่งจบของคำใน dictionary ที่เริ่มที่ start (ยาวไปสั้น)"""
+        ends = []
+        node = self._trie
+        for i in range(start, min(len(text), start + self._max_length)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if _END in node:
+                ends.append(i + 1)
+        ends.reverse()
+        return ends
+
+    def segment(self, text: str) -> Tuple[str, ...]:
+        """ตัดคำข้อความภาษาไทยที่ไม่มีช่องว่าง"""
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+
+        n = len(text)
+        allowed = _boundaries(text)
+        # best[i] = (จำนวนตัวอักษรที่ไม่รู้จัก, จำนวนคำ, ตำแหน่งถัดไป, เป็นคำใน dictionary) ของ text[i:]
+        best: List[Optional[Tuple[int, int, int, bool]]] = [None] * (n + 1)
+        best[n] = (0, 0, n, True)
+        for i in range(n - 1, -1, -1):
+            if not allowed[i]:
+                continue
+            choice = None
+            for end in self._word_ends(text, i):
+                rest = best[end]
+                if rest is not None and allowed[end]:
+                    candidate = (rest[0], rest[1] + 1, end, True)
+                    if choice is None or candidate[:2] < choice[:2]:
+                        choice = candidate
+            # ไม่อยู่ใน dictionary: ข้ามไปหนึ่งกลุ่มตัวอักษร
+            end = i + 1
+            while not allowed[end]:
+                end += 1
+            rest = best[end]
+            candidate = (rest[0] + end - i, rest[1] + 1, end, False)
+            if choice is None or candidate[:2] < choice[:2]:
+                choice = candidate
+            best[i] = choice
+
+        tokens = []
+        unknown_start = None
+        i = 0
+        while i < n:
+            _, _, end, known = best[i]
+            if known:
+                if unknown_start is not None:
+                    tokens.append(text[unknown_start:i])
+                    unknown_start = None
+                tokens.append(text[i:end])
+            elif unknown_start is None:
+                unknown_start = i
+            i = end
+        if unknown_start is not None:
+            tokens.append(text[unknown_start:])
+
+        result = tuple(tokens)
+        if len(self._cache) >= _SEGMENT_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[text] = result
+        return result
+
+    def tokenize(self, text: str) -> List[str]:
+        """ตัดคำข้อความทั่วไป (แยกตามช่องว่างก่อน แล้วตัดคำช่วงที่เป็นภาษาไทย)"""
+        tokens = []
+        for chunk in text.split():
+            if not _THAI_WORD_RE.search(chunk):
+                tokens.append(chunk)
+                continue
+            for run in _THAI_RUN_RE.findall(chunk):
+                if _THAI_WORD_RE.match(run):
+                    tokens.extend(self.segment(run))
+                else:
+                    tokens.append(run)
+        return tokens
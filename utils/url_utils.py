@@ -30,8 +30,28 @@ def extract_domain(url: str) -> str:
     except Exception:
         return ""
 
+def is_google_news_domain(domain: str) -> bool:
+    """domain ของ Google News หรือไม่"""
+    return domain == "news.google.com" or domain.endswith(".news.google.com")
+
+def publisher_domain(url: str, source_url: str = "") -> str:
+    """
+    domain ของผู้เผยแพร่
+    ถ้า url ยังเป็นลิงก์ Google News (ถอดไม่ได้) ใช้ domain จาก <source url> ของ feed แทน
+    """
+    domain = extract_domain(url)
+    if source_url and (not domain or is_google_news_domain(domain)):
+        return extract_domain(source_url) or domain
+    return domain
+
 def shorten_google_news_url(url: str) -> str:
-    """ดึง URL จริงจาก Google News redirect"""
+    """
+    ดึง URL จริงจาก Google News redirect แบบ ?url=
+
+    ลิงก์ news.google.com/rss/articles/<id> ของ feed ปัจจุบันเป็น id รูปแบบใหม่ (AU_yqL...)
+    ที่ถอดเป็น URL ของผู้เผยแพร่แบบ offline ไม่ได้ จึงคืน URL ของ Google News ตามเดิม
+    มีเพียง publisher_domain (domain จาก <source url> ของ feed) ที่ได้ domain ของผู้เผยแพร่
+    """
     url = normalize_url(url)
     if not url:
         return url